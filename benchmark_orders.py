@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+HayDaySimulator 주문 생성 벤치마크
+generate_delivery_order / _get_available_items / _get_item_value / simulate_economy 를
+레벨 1~100, Truck/Train/Boat 에 걸쳐 측정하고 JSON 베이스라인과 비교한다.
+
+    python benchmark_orders.py                # 측정 + 이전 베이스라인과 비교 (없으면 새로 저장)
+    python benchmark_orders.py --save         # 측정 결과를 새 베이스라인으로 저장
+    python benchmark_orders.py --quick        # 레벨 간격을 넓혀 빠르게 측정
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hayday_simulator import DeliveryType, HayDaySimulator
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baselines', 'orders.json')
+
+# 같은 시드로 측정해야 레벨/타입별 주문 구성이 실행마다 같다
+BENCHMARK_SEED = 20240901
+
+BENCHMARK_LEVELS = range(1, 101)
+BENCHMARK_STRUGGLE_SCORES = (10, 50, 90)
+
+# 레벨 구간별로 주문 생성 경로가 다르다 (1~10: 고정 주문 템플릿, 이후: 동적 생성)
+LEVEL_BANDS = [(1, 10), (11, 30), (31, 60), (61, 100)]
+
+# p50 지연이 베이스라인보다 이 비율 이상 느려지면 회귀로 표시
+DEFAULT_REGRESSION_THRESHOLD = 0.20
+
+
+def measure(func: Callable, calls: Sequence[Tuple], warmup: bool = True) -> Dict[str, float]:
+    """calls의 인자로 func를 하나씩 호출해 ops/sec, p50/p99 지연(µs) 측정"""
+    if warmup:
+        for args in calls:
+            func(*args)
+
+    latencies = np.empty(len(calls), dtype=np.float64)
+    clock = time.perf_counter_ns
+    for index, args in enumerate(calls):
+        started = clock()
+        func(*args)
+        latencies[index] = clock() - started
+
+    total_seconds = latencies.sum() / 1e9
+    return {
+        'calls': len(calls),
+        'ops_per_sec': len(calls) / total_seconds if total_seconds > 0 else float('inf'),
+        'p50_us': float(np.percentile(latencies, 50) / 1e3),
+        'p99_us': float(np.percentile(latencies, 99) / 1e3),
+    }
+
+
+def run_benchmarks(simulator: HayDaySimulator, levels: Sequence[int], rounds: int = 3,
+                   economy_repeats: int = 5) -> Dict[str, Dict[str, float]]:
+    """벤치마크 케이스 이름 -> 측정 결과"""
+    results = {}
+
+    for delivery_type in DeliveryType:
+        for low, high in LEVEL_BANDS:
+            band_levels = [level for level in levels if low <= level <= high]
+            if not band_levels:
+                continue
+            calls = [(level, score, delivery_type)
+                     for _ in range(rounds) for level in band_levels for score in BENCHMARK_STRUGGLE_SCORES]
+            name = f"generate_delivery_order[{delivery_type.value}, L{low}-{high}]"
+            results[name] = measure(simulator.generate_delivery_order, calls)
+
+    level_calls = [(level,) for _ in range(rounds) for level in levels]
+    results['_get_available_items'] = measure(simulator._get_available_items, level_calls)
+
+    item_names = simulator._get_available_items(max(levels))
+    item_calls = [(item,) for _ in range(rounds) for item in item_names]
+    results['_get_item_value'] = measure(simulator._get_item_value, item_calls)
+
+    for level in (10, 50):
+        economy_calls = [(30, level)] * economy_repeats
+        results[f"simulate_economy[30d, L{level}]"] = measure(simulator.simulate_economy, economy_calls)
+
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def load_baseline(path: str) -> Optional[Dict]:
+    """저장된 베이스라인 (없거나 읽을 수 없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: 베이스라인을 읽을 수 없습니다 ({path}): {e}")
+        return None
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, float]], options: Dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'options': options,
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+    print(f"베이스라인 저장: {path}")
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict,
+            threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> List[str]:
+    """결과 표 출력 후 p50 기준 회귀 케이스 이름 목록 반환"""
+    previous = baseline.get('results', {}) if baseline else {}
+    regressions = []
+
+    print(f"\n{'case':<46} {'ops/sec':>12} {'p50 µs':>10} {'p99 µs':>10} {'vs base':>9}")
+    print('-' * 91)
+    for name, current in results.items():
+        delta = ''
+        base = previous.get(name)
+        if base and base.get('p50_us'):
+            ratio = current['p50_us'] / base['p50_us'] - 1
+            delta = f"{ratio:+.0%}"
+            if ratio > threshold:
+                delta += ' !'
+                regressions.append(name)
+        print(f"{name:<46} {current['ops_per_sec']:>12,.0f} {current['p50_us']:>10.1f} "
+              f"{current['p99_us']:>10.1f} {delta:>9}")
+
+    if baseline:
+        print(f"\n비교 대상: {baseline.get('created')} (commit {baseline.get('commit')})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="HayDaySimulator 주문 생성 벤치마크")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="베이스라인 JSON 경로")
+    parser.add_argument('--save', action='store_true', help="측정 결과를 베이스라인으로 저장")
+    parser.add_argument('--rounds', type=int, default=3, help="케이스별 반복 횟수")
+    parser.add_argument('--quick', action='store_true', help="레벨 1~100을 5 간격으로만 측정")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="회귀로 볼 p50 증가 비율 (기본 0.20)")
+    args = parser.parse_args(argv)
+
+    levels = list(BENCHMARK_LEVELS)[::5] if args.quick else list(BENCHMARK_LEVELS)
+    options = {'rounds': args.rounds, 'levels': [levels[0], levels[-1], len(levels)], 'seed': BENCHMARK_SEED}
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # 데이터 로드 / 주문 생성 로그 숨김
+        simulator = HayDaySimulator(rng=BENCHMARK_SEED)
+        load_seconds = time.perf_counter() - started
+        results = run_benchmarks(simulator, levels, rounds=args.rounds)
+    print(f"데이터 로드 {load_seconds:.2f}초, 전체 측정 {time.perf_counter() - started:.1f}초")
+
+    baseline = load_baseline(args.baseline)
+    if baseline and baseline.get('options') != options:
+        print(f"Warning: 베이스라인 측정 옵션이 다릅니다 ({baseline.get('options')} vs {options})")
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.save or baseline is None:
+        save_baseline(args.baseline, results, options)
+
+    if regressions:
+        print(f"\nWARNING 성능 회귀 {len(regressions)}건 (p50 +{args.threshold:.0%} 초과): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
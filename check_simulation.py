@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+HayDay / SungDae 시뮬레이터 재현성 점검
+같은 시드로 만든 결과가 실행 환경(해시 시드 등)과 관계없이 같은지 확인한다.
+
+    python check_simulation.py                # 전체 점검
+    python check_simulation.py hash_seed      # 지정한 점검만 실행
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from hayday_simulator import DeliveryType, HayDaySimulator
+from sungdae_simulator import (DeliveryType as SungDaeDeliveryType, ItemLayer, ResourceState, ResourceStore,
+                               SungDaeSimulator)
+
+CHECK_SEED = 20240901
+CHECK_LEVELS = (3, 8, 15, 25, 40, 60, 90)
+
+# 서로 다른 PYTHONHASHSEED로 자식 프로세스를 띄워 결과를 비교
+HASH_SEEDS = ('1', '2')
+
+# 앙상블 점검 규모 (워커 프로세스 2개 vs 순차 실행)
+ENSEMBLE_REPLICAS = 6
+ENSEMBLE_DAYS = 5
+ENSEMBLE_LEVELS = [20, 45]
+
+# ResourceStore 삭제/재추가 반복 횟수
+STORE_ITEMS = 40
+STORE_CYCLES = 500
+
+
+def seeded_outputs() -> Dict[str, list]:
+    """CHECK_SEED로 만든 HayDay 단건/대량 주문, 경제 시뮬레이션, SungDae 주문 (JSON 직렬화 가능한 형태)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulator = HayDaySimulator(rng=CHECK_SEED)
+        orders = []
+        for level in CHECK_LEVELS:
+            for delivery_type in DeliveryType:
+                for struggle_score in (20, 50, 80):
+                    order = simulator.generate_delivery_order(level, struggle_score, delivery_type)
+                    orders.append([order.order_id, order.delivery_type.value, list(order.items.items()),
+                                   order.total_value, order.total_production_time])
+        batches = []
+        for level in CHECK_LEVELS:
+            batch = simulator.generate_delivery_orders(20, level, 50, DeliveryType.TRUCK)
+            batches.append([[[batch.item_names[item] for item in row] for row in batch.item_ids.tolist()],
+                            batch.quantities.tolist()])
+        economy = simulator.simulate_economy(10, 20)
+
+        sungdae = SungDaeSimulator.create_from_hayday_simulator(simulator, player_level=25)
+        sungdae_orders = []
+        for index in range(30):
+            order = sungdae.generate_delivery_order(SungDaeDeliveryType.TRAIN if index % 3 == 0
+                                                    else SungDaeDeliveryType.TRUCK)
+            sungdae_orders.append([list(order.items.items()), order.total_value, round(order.struggle_score, 6)])
+
+    return {
+        'orders': orders,
+        'bulk_orders': batches,
+        'economy': {key: [float(value) for value in values] for key, values in economy.items()},
+        'sungdae_orders': sungdae_orders,
+    }
+
+
+def check_hash_seed() -> List[str]:
+    """PYTHONHASHSEED만 다른 두 프로세스에서 같은 시드의 결과가 같은지 (set 반복 순서 의존 검출)"""
+    runs = []
+    for hash_seed in HASH_SEEDS:
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), '--emit'], env=env,
+                                capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        if result.returncode != 0:
+            return [f"PYTHONHASHSEED={hash_seed} run failed: {result.stderr.strip()[-500:]}"]
+        runs.append(json.loads(result.stdout))
+
+    first, second = runs
+    return [f"{section} differs between PYTHONHASHSEED={HASH_SEEDS[0]} and {HASH_SEEDS[1]}"
+            for section in first if first[section] != second.get(section)]
+
+
+def check_ensemble() -> List[str]:
+    """simulate_economy_ensemble을 프로세스 풀(spawn 워커)로 돌린 결과가 순차 실행과 같은지"""
+    results = {}
+    for workers in (1, 2):
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulator = HayDaySimulator(rng=CHECK_SEED)
+            results[workers] = simulator.simulate_economy_ensemble(ENSEMBLE_REPLICAS, ENSEMBLE_DAYS,
+                                                                   ENSEMBLE_LEVELS, workers=workers)
+
+    serial, parallel = results[1], results[2]
+    if parallel['workers'] != 2:
+        return [f"expected 2 workers, ran with {parallel['workers']}"]
+    return [f"level {level} {metric} differs between workers=1 and workers=2"
+            for level, metrics in serial['levels'].items() for metric, bands in metrics.items()
+            if not np.array_equal(bands, parallel['levels'][level][metric])]
+
+
+def check_resource_store() -> List[str]:
+    """삭제/재추가를 반복해도 ResourceStore 배열 크기가 보유 아이템 수를 넘어 커지지 않는지"""
+    problems = []
+    store = ResourceStore(capacity=STORE_ITEMS)
+    expected = {}
+    for index in range(STORE_ITEMS):
+        name = f"item{index}"
+        store[name] = ResourceState(name, ItemLayer.CROPS, index, 100, 60, ['field'], True, True)
+        expected[name] = index
+    for cycle in range(STORE_CYCLES):
+        name = f"item{(cycle * 7) % STORE_ITEMS}"
+        del store[name]
+        del expected[name]
+        store[name] = ResourceState(name, ItemLayer.MID, cycle, 100, 60, ['bakery'], False, True)
+        expected[name] = cycle
+
+    if len(store.row_names) != STORE_ITEMS or len(store.current_stock) != STORE_ITEMS:
+        problems.append(f"store grew to {len(store.row_names)} rows / {len(store.current_stock)} capacity "
+                        f"for {STORE_ITEMS} items")
+    if list(store) != list(expected) or [store[name].current_stock for name in store] != list(expected.values()):
+        problems.append("iteration order or values differ from dict semantics after re-adding items")
+    if sorted(store, key=store.insertion_order) != list(store):
+        problems.append("insertion_order does not match iteration order")
+
+    # SungDae 레벨 상승/하강 반복 (고레벨 아이템 삭제 후 재추가)
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulator = HayDaySimulator(rng=CHECK_SEED)
+        sungdae = SungDaeSimulator.create_from_hayday_simulator(simulator, player_level=30)
+        peak = len(sungdae.resource_states)
+        for _ in range(10):
+            for level in (30, 8, 40, 12):
+                sungdae.player_level = level
+                peak = max(peak, len(sungdae.resource_states))
+                sungdae.generate_delivery_order()
+    resources = sungdae.resource_states
+    if len(resources.row_names) > peak:
+        problems.append(f"SungDae store has {len(resources.row_names)} rows for at most {peak} live items")
+    rows = sungdae._get_eligible_rows()
+    prices = [sungdae.hayday_items.get(resources.row_names[row], {}).get('sell_price', 100) for row in rows]
+    if not np.array_equal(sungdae._source_shelf_price[rows], prices):
+        problems.append("source tagging inputs are stale for reused rows")
+    return problems
+
+
+CHECKS: Dict[str, Callable[[], List[str]]] = {
+    'hash_seed': check_hash_seed,
+    'ensemble': check_ensemble,
+    'resource_store': check_resource_store,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('checks', nargs='*', metavar='CHECK', help=f"실행할 점검 ({', '.join(CHECKS)}, 기본: 전체)")
+    parser.add_argument('--emit', action='store_true', help=argparse.SUPPRESS)  # hash_seed 자식 프로세스용
+    args = parser.parse_args(argv)
+
+    if args.emit:
+        json.dump(seeded_outputs(), sys.stdout)
+        return 0
+    unknown = [name for name in args.checks if name not in CHECKS]
+    if unknown:
+        parser.error(f"unknown check: {', '.join(unknown)}")
+
+    failed = 0
+    for name in args.checks or list(CHECKS):
+        problems = CHECKS[name]()
+        print(f"{'FAIL' if problems else 'ok  '} {name}")
+        for problem in problems:
+            print(f"     {problem}")
+        failed += bool(problems)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1187 @@
+#!/usr/bin/env python3
+"""
+HayDay 카탈로그 스냅샷
+core_data CSV를 타입이 있는 컬럼 배열로 컴파일해 두고, 원본이 바뀌지 않았다면
+파싱 없이 메모리 매핑으로 바로 불러온다.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Configuration
+DATA_PATH = os.path.join(os.path.dirname(__file__), "hayday_extracted_data", "core_data")
+CATALOG_CACHE_PATH = os.path.join(os.path.dirname(__file__), "hayday_extracted_data", "catalog_cache")
+
+# 스냅샷 포맷(또는 CSV 리더 결과 타입)이 바뀌면 올려서 기존 캐시를 무효화
+SNAPSHOT_FORMAT_VERSION = 2
+
+# HayDay CSV 두 번째 줄(데이터 타입 행) 판별 패턴 (타입 행을 해석할 수 없는 파일용)
+TYPE_ROW_PATTERN = 'int|String|Boolean|float'
+
+# 타입 행 토큰 -> pandas dtype (Boolean은 파싱 후 결측을 False로 채워 bool로 변환)
+SCHEMA_DTYPES = {
+    'int': 'Int32',
+    'float': 'float64',
+    'boolean': 'boolean',
+    'string': str
+}
+
+# 고유값 비율이 이 값 이하인 문자열 컬럼은 category로 저장
+CATEGORY_MAX_RATIO = 0.5
+
+# 병렬 로드 기본 워커 수 (I/O + C 파서 구간은 GIL을 놓으므로 스레드로 충분)
+DEFAULT_LOAD_WORKERS = min(16, (os.cpu_count() or 1) + 4)
+
+# 아이템 카탈로그: 농작물/과일 테이블과 가격 컬럼 우선순위
+CROP_CATEGORIES = ('fields', 'fruits', 'fruit_trees')
+PRICE_COLUMNS = ['OrderPrice', 'OrderValue', 'BoatOrderValue', 'Price', 'Value']
+
+# 결측값 마스크 필드 접두사 (구조체 배열 안에서 컬럼과 함께 저장)
+_NA_PREFIX = '__na__'
+
+# exp_levels 주문 파라미터 컬럼 -> 컬럼이 없을 때 기본값
+LEVEL_ORDER_COLUMNS = {
+    'MinGoodsInOrderDelivery': 1,
+    'MaxGoodsInOrderDelivery': 3,
+    'OrderMinValue': 100,
+    'OrderMaxValue': 600,
+    'MaxOrderCount': 1,
+    'TruckCoinMultiplier': 100,
+    'TruckEXPMultiplier': 100,
+    'OrderCancelTimeMin': 6,
+    'SpecialOrderProbablity': 0,  # 원본 오타: Probablity
+    'SpecialOrderMaxCount': 0,
+    'MinCrateAmountInBoatOrder': 1,
+    'MaxCrateAmountInBoatOrder': 1,
+    'BoatCrateCoinMultiplier': 100,
+    'BoatCrateEXPMultiplier': 100,
+    'MinGoodTypesInBoatOrder': 3,
+    'MaxGoodTypesInBoatOrder': 3,
+    'MinBoatOrderValue': None,
+    'MaxBoatOrderValue': None,
+}
+# 기본값이 None인 컬럼은 없을 때 다른 컬럼 값을 그대로 사용
+LEVEL_COLUMN_FALLBACKS = {'MinBoatOrderValue': 'OrderMinValue', 'MaxBoatOrderValue': 'OrderMaxValue'}
+
+# 사전 정의(튜토리얼) 주문 템플릿: (아이템 목록, 수량 목록)
+OrderTemplate = Tuple[Tuple[str, ...], Tuple[int, ...]]
+
+
+def read_schema(file_path: str) -> Optional[Dict[str, str]]:
+    """CSV 데이터 타입 행 읽기 (컬럼명 -> 타입 토큰, 타입 행이 없으면 None)"""
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        type_row = next(reader, [])
+
+    types = [token.strip().lower() for token in type_row]
+    if (not header or len(types) != len(header) or len(set(header)) != len(header)
+            or any(token not in SCHEMA_DTYPES for token in types)):
+        return None
+    return dict(zip(header, types))
+
+
+def read_game_csv(file_path: str, filter_names: bool = True) -> pd.DataFrame:
+    """HayDay CSV 읽기 (데이터 타입 행 기반 dtype 지정, 빈 Name 행 필터링)"""
+    schema = read_schema(file_path)
+
+    if schema is not None:
+        # 타입 행을 건너뛰고 컬럼 타입을 지정해 한 번에 파싱
+        df = pd.read_csv(file_path, skiprows=[1],
+                         dtype={name: SCHEMA_DTYPES[token] for name, token in schema.items()})
+    else:
+        df = pd.read_csv(file_path)
+
+        # 첫 번째 행이 데이터 타입인 경우 제거
+        if len(df) > 1 and df.iloc[0].astype(str).str.contains(TYPE_ROW_PATTERN, na=False).any():
+            df = df.drop(0).reset_index(drop=True)
+
+    # Name이 비어있지 않은 행만 필터링
+    if filter_names and 'Name' in df.columns:
+        df = df[df['Name'].notna() & (df['Name'].astype(str).str.strip() != '')]
+        df = df.reset_index(drop=True)
+
+    if schema is not None:
+        for name, token in schema.items():
+            if token == 'boolean':
+                df[name] = df[name].fillna(False).astype(bool)
+            elif token == 'string' and len(df) > 0:
+                if 0 < df[name].nunique() <= len(df) * CATEGORY_MAX_RATIO:
+                    df[name] = df[name].astype('category')
+
+    return df
+
+
+def source_signature(file_path: str, with_hash: bool = True) -> Dict:
+    """원본 파일 시그니처 (크기, 수정시각, 내용 해시)"""
+    stat = os.stat(file_path)
+    signature = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if with_hash:
+        signature['sha1'] = _file_sha1(file_path)
+    return signature
+
+
+def _file_stamp(file_path: str) -> Optional[Tuple[int, int]]:
+    """(크기, 수정시각) - 파일이 없으면 None"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _file_sha1(file_path: str) -> str:
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CatalogSnapshot:
+    """
+    테이블 단위 바이너리 스냅샷
+
+    테이블마다 두 파일을 둔다:
+    - <key>.npy: 컬럼별 타입 배열을 묶은 구조체 배열 (mmap 로드)
+    - <key>.meta.json: 원본 시그니처, 컬럼 타입, Name 인덱스
+
+    meta 파일이 커밋 마커 역할을 하므로 테이블마다 독립적으로 갱신되고,
+    여러 워커가 동시에 빌드해도 os.replace로 원자적으로 교체된다.
+    """
+
+    def __init__(self, cache_dir: str = CATALOG_CACHE_PATH, enabled: bool = True):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.stats = {'hits': 0, 'builds': 0}
+        self.timings: Dict[str, float] = {}
+        # 로드한 테이블의 원본 (file_path, reader, (size, mtime_ns)) - 변경 감지용
+        self.sources: Dict[str, Tuple[str, Callable[[str], pd.DataFrame], Tuple[int, int]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str, file_path: str,
+             reader: Callable[[str], pd.DataFrame] = read_game_csv) -> pd.DataFrame:
+        """스냅샷이 유효하면 매핑해서 반환, 아니면 CSV를 파싱하고 스냅샷 재생성"""
+        started = time.perf_counter()
+        # 읽기 전에 시그니처를 잡아 두어야 로드 도중 수정도 다음 검사에서 잡힌다
+        stamp = _file_stamp(file_path)
+        try:
+            df = self._load(key, file_path, reader)
+            with self._lock:
+                self.sources[key] = (file_path, reader, stamp)
+            return df
+        finally:
+            # 테이블별 소요 시간 기록
+            with self._lock:
+                self.timings[key] = time.perf_counter() - started
+
+    def load_many(self, tables: List[Tuple[str, str, Callable[[str], pd.DataFrame]]],
+                  max_workers: Optional[int] = None) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Exception]]:
+        """
+        여러 테이블을 스레드 풀로 동시에 로드
+
+        tables: (key, file_path, reader) 목록. 결과 dict는 입력 순서를 유지하고,
+        테이블별 소요 시간은 self.timings에 기록된다.
+        """
+        workers = max(1, min(max_workers or DEFAULT_LOAD_WORKERS, len(tables) or 1))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [(key, executor.submit(self.load, key, file_path, reader))
+                       for key, file_path, reader in tables]
+
+        frames = {}
+        errors = {}
+        for key, future in futures:
+            try:
+                frames[key] = future.result()
+            except Exception as e:
+                errors[key] = e
+        return frames, errors
+
+    def changed_keys(self) -> List[str]:
+        """로드 이후 원본 CSV가 바뀐(또는 사라진) 테이블 키 목록 (mtime 폴링)"""
+        with self._lock:
+            sources = list(self.sources.items())
+        return [key for key, (file_path, _, stamp) in sources if _file_stamp(file_path) != stamp]
+
+    def reload(self, keys: Iterable[str]) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Exception]]:
+        """지정한 테이블을 원래 리더로 다시 로드 (바뀐 파일은 스냅샷도 재생성됨)"""
+        with self._lock:
+            tables = [(key, self.sources[key][0], self.sources[key][1]) for key in keys if key in self.sources]
+        frames, errors = self.load_many(tables)
+
+        # 실패한 파일은 현재 시그니처를 기록해 다시 바뀔 때까지 재시도하지 않음
+        with self._lock:
+            for key in errors:
+                file_path, reader, _ = self.sources[key]
+                self.sources[key] = (file_path, reader, _file_stamp(file_path))
+        return frames, errors
+
+    def name_index(self, key: str) -> Dict[str, int]:
+        """스냅샷에 저장된 Name -> 행 번호 인덱스"""
+        meta = self._read_meta(key)
+        return dict(meta.get('name_index', {})) if meta else {}
+
+    def fresh_name_index(self, key: str, file_path: str) -> Optional[Dict[str, int]]:
+        """원본 CSV가 스냅샷 이후 바뀌지 않았을 때만 Name 인덱스 반환 (테이블을 로드하지 않고 이름 확인용)"""
+        if not self.enabled:
+            return None
+        meta = self._read_meta(key)
+        try:
+            if meta is None or not self._is_fresh(key, meta, file_path):
+                return None
+        except OSError:
+            return None
+        return meta.get('name_index', {})
+
+    def invalidate(self, key: Optional[str] = None):
+        """스냅샷 삭제 (key가 없으면 전체)"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for filename in os.listdir(self.cache_dir):
+            if key is None or filename in (f"{key}.npy", f"{key}.meta.json"):
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError:
+                    pass
+
+    # 내부 구현
+
+    def _load(self, key: str, file_path: str, reader: Callable[[str], pd.DataFrame]) -> pd.DataFrame:
+        if not self.enabled:
+            return reader(file_path)
+
+        meta = self._read_meta(key)
+        if meta is not None and self._is_fresh(key, meta, file_path):
+            df = self._load_table(key, meta)
+            if df is not None:
+                self._count('hits')
+                return df
+
+        df = reader(file_path)
+        self._write_table(key, df, source_signature(file_path))
+        self._count('builds')
+        return df
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _paths(self, key: str):
+        return (os.path.join(self.cache_dir, f"{key}.npy"),
+                os.path.join(self.cache_dir, f"{key}.meta.json"))
+
+    def _read_meta(self, key: str) -> Optional[Dict]:
+        _, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+            return None
+        return meta
+
+    def _is_fresh(self, key: str, meta: Dict, file_path: str) -> bool:
+        """크기/수정시각이 같으면 바로 통과, 수정시각만 다르면 해시로 확인"""
+        try:
+            current = source_signature(file_path, with_hash=False)
+        except OSError:
+            return False
+
+        cached = meta.get('source', {})
+        if current['size'] != cached.get('size'):
+            return False
+        if current['mtime_ns'] == cached.get('mtime_ns'):
+            return True
+
+        # touch/checkout 등으로 수정시각만 바뀐 경우 내용 해시 비교
+        if _file_sha1(file_path) != cached.get('sha1'):
+            return False
+        meta['source']['mtime_ns'] = current['mtime_ns']
+        self._write_json(self._paths(key)[1], meta)
+        return True
+
+    def _load_table(self, key: str, meta: Dict) -> Optional[pd.DataFrame]:
+        npy_path, _ = self._paths(key)
+        try:
+            table = np.load(npy_path, mmap_mode='r', allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+
+        columns = {}
+        for column in meta['columns']:
+            name = column['name']
+            field = column['field']
+            values = table[field] if len(table) else np.array([], dtype=table.dtype[field])
+            mask = table[_NA_PREFIX + field] if len(table) else None
+            columns[name] = _decode_column(values, mask, column['kind'], column.get('dtype', 'object'))
+
+        return pd.DataFrame(columns, columns=[c['name'] for c in meta['columns']])
+
+    def _write_table(self, key: str, df: pd.DataFrame, signature: Dict):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            table, columns = _encode_table(df)
+
+            npy_path, meta_path = self._paths(key)
+            tmp_path = f"{npy_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, table, allow_pickle=False)
+            os.replace(tmp_path, npy_path)
+
+            name_index = {}
+            if 'Name' in df.columns:
+                for row, name in enumerate(df['Name']):
+                    if pd.notna(name) and str(name) not in name_index:
+                        name_index[str(name)] = row
+
+            self._write_json(meta_path, {
+                'format_version': SNAPSHOT_FORMAT_VERSION,
+                'key': key,
+                'source': signature,
+                'rows': len(df),
+                'columns': columns,
+                'name_index': name_index
+            })
+        except Exception as e:
+            # 캐시 디렉토리에 쓸 수 없어도 로드 자체는 계속 진행
+            print(f"WARNING {key} 스냅샷 저장 실패: {e}")
+
+    @staticmethod
+    def _write_json(path: str, payload: Dict):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+class LazyTableMap(MutableMapping):
+    """
+    카테고리 키 -> DataFrame 지연 로드 매핑
+
+    키 목록(등록 순서)만 먼저 가지고 있다가 처음 접근할 때 스냅샷/CSV에서 로드한다.
+    keys()/in/len은 로드를 일으키지 않고, items()/values()처럼 값을 순회하면
+    그때 남은 테이블이 로드된다.
+    """
+
+    def __init__(self, snapshot: CatalogSnapshot, max_workers: Optional[int] = None):
+        self.snapshot = snapshot
+        self.max_workers = max_workers
+        self._sources: Dict[str, Tuple[str, Callable[[str], pd.DataFrame]]] = {}
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def register(self, key: str, file_path: str,
+                 reader: Callable[[str], pd.DataFrame] = read_game_csv):
+        """테이블 등록 (로드는 첫 접근 시)"""
+        self._sources[key] = (file_path, reader)
+
+    def preload(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Exception]:
+        """지정한 테이블들(없으면 전체)을 병렬로 미리 로드, 실패한 테이블의 예외 반환"""
+        targets = list(self._sources) if keys is None else [k for k in keys if k in self._sources]
+        pending = [(key, *self._sources[key]) for key in targets if key not in self._frames]
+        if not pending:
+            return {}
+
+        frames, errors = self.snapshot.load_many(pending, max_workers=self.max_workers)
+        with self._lock:
+            for key, _, _ in pending:
+                if key not in self._frames:
+                    self._frames[key] = frames.get(key, pd.DataFrame())
+        return errors
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self._frames
+
+    def loaded_keys(self) -> List[str]:
+        return [key for key in self._sources if key in self._frames]
+
+    def indexed_names(self, key: str) -> Optional[Iterable[str]]:
+        """
+        아직 로드하지 않은 테이블의 Name 목록 (스냅샷 Name 인덱스가 최신일 때만)
+
+        이미 로드했거나 인덱스를 믿을 수 없으면 None - 호출 측에서 테이블을 직접 보면 된다.
+        """
+        if key in self._frames or key not in self._sources:
+            return None
+        file_path, _ = self._sources[key]
+        if file_path is None:
+            return None
+        return self.snapshot.fresh_name_index(key, file_path)
+
+    def with_frames(self, frames: Mapping[str, pd.DataFrame]) -> 'LazyTableMap':
+        """
+        같은 등록 정보의 새 매핑 (핫 리로드용)
+
+        frames에 있는 등록 키는 새 테이블로 교체하고, 이미 로드된 나머지 테이블은 그대로 공유한다.
+        기존 매핑은 바뀌지 않는다.
+        """
+        table_map = LazyTableMap(self.snapshot, max_workers=self.max_workers)
+        with self._lock:
+            table_map._sources = dict(self._sources)
+            table_map._frames = dict(self._frames)
+        for key, frame in frames.items():
+            if key in table_map._sources:
+                table_map._frames[key] = frame
+        return table_map
+
+    def __getitem__(self, key: str) -> pd.DataFrame:
+        frame = self._frames.get(key)
+        if frame is not None:
+            return frame
+        if key not in self._sources:
+            raise KeyError(key)
+
+        with self._lock:
+            if key not in self._frames:
+                file_path, reader = self._sources[key]
+                try:
+                    self._frames[key] = self.snapshot.load(key, file_path, reader)
+                except Exception as e:
+                    print(f"WARNING {key} 파일 로드 실패: {e}")
+                    self._frames[key] = pd.DataFrame()  # 빈 데이터프레임으로 초기화
+            return self._frames[key]
+
+    def __setitem__(self, key: str, frame: pd.DataFrame):
+        with self._lock:
+            self._sources.setdefault(key, (None, None))
+            self._frames[key] = frame
+
+    def __delitem__(self, key: str):
+        with self._lock:
+            del self._sources[key]
+            self._frames.pop(key, None)
+
+    def __contains__(self, key) -> bool:
+        return key in self._sources
+
+    def __iter__(self):
+        return iter(list(self._sources))
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __repr__(self) -> str:
+        return f"LazyTableMap({len(self._frames)}/{len(self._sources)} loaded)"
+
+
+@dataclass
+class BuildingRecord:
+    """processing_buildings 한 건물 (같은 이름의 첫 번째 행 기준)"""
+    name: str
+    unlock_level: int         # 없으면 0
+    slots: Optional[int]      # 생산 슬롯 수
+    category: str             # production / seasonal
+
+
+class BuildingCatalog:
+    """processing_buildings 이름(대소문자 무시) -> 건물 레코드"""
+
+    def __init__(self, records: Dict[str, BuildingRecord]):
+        self.records = records
+
+    @classmethod
+    def build(cls, processing_buildings: Optional[pd.DataFrame]) -> 'BuildingCatalog':
+        records = {}
+        if (processing_buildings is None or processing_buildings.empty
+                or not {'Name', 'UnlockLevel'} <= set(processing_buildings.columns)):
+            return cls(records)
+
+        columns = processing_buildings.columns
+        slots = processing_buildings['Slots'] if 'Slots' in columns else [None] * len(processing_buildings)
+        seasonal = (processing_buildings['SeasonalObject'] if 'SeasonalObject' in columns
+                    else [False] * len(processing_buildings))
+        for name, level, slot_count, is_seasonal in zip(processing_buildings['Name'],
+                                                        processing_buildings['UnlockLevel'],
+                                                        slots, seasonal):
+            if pd.isna(name):
+                continue  # 마스터리 단계 등 이어지는 행
+            key = str(name).lower()
+            if key in records:
+                continue  # 같은 건물명이 여러 행이면 첫 번째 행만 사용
+            records[key] = BuildingRecord(
+                name=str(name),
+                unlock_level=_optional_int(level) or 0,
+                slots=_optional_int(slot_count),
+                category='seasonal' if pd.notna(is_seasonal) and bool(is_seasonal) else 'production'
+            )
+        return cls(records)
+
+    def __contains__(self, building_name: str) -> bool:
+        return building_name.lower() in self.records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, building_name: str) -> Optional[BuildingRecord]:
+        return self.records.get(building_name.lower())
+
+    def unlock_level(self, building_name: str) -> int:
+        """건물 언락레벨 (없으면 0)"""
+        record = self.records.get(building_name.lower())
+        return record.unlock_level if record else 0
+
+    def slots(self, building_name: str) -> Optional[int]:
+        record = self.records.get(building_name.lower())
+        return record.slots if record else None
+
+    def category(self, building_name: str) -> Optional[str]:
+        record = self.records.get(building_name.lower())
+        return record.category if record else None
+
+    def unmatched_goods(self, goods_keys: Iterable[str]) -> List[str]:
+        """건물 행을 찾지 못해 언락레벨 0으로 처리되는 *_goods 카테고리 목록"""
+        return [key for key in goods_keys
+                if key.endswith('_goods') and key[:-len('_goods')] not in self]
+
+
+@dataclass
+class ItemRecord:
+    """카테고리 테이블 한 곳에서 찾은 아이템 정보 (테이블당 첫 번째 행 기준)"""
+    name: str
+    category: str                 # self.data 키 (bakery_goods, fields, animals ...)
+    building: str                 # 생산 건물 키 (bakery, fields, animals ...)
+    price: Optional[int]          # PRICE_COLUMNS 중 첫 번째 양수 값 (동물은 ProcessValue)
+    production_time: Optional[int]  # TimeMin (분)
+    unlock_level: Optional[int]   # 테이블의 UnlockLevel
+    layer: str                    # CROPS / MID / TOP
+
+
+class ItemCatalog:
+    """
+    아이템 이름 -> 레코드 인덱스
+
+    가격/생산시간/언락레벨은 이름별로 처음 조회할 때 한 번 계산해 두고 이후 조회는 dict 한 번으로 끝낸다.
+    카테고리 테이블은 그 이름이 들어 있는 테이블만 로드한다 (지연 로드 매핑이면 스냅샷 Name 인덱스로 판단,
+    인덱스가 없는 테이블은 처음 조회할 때 로드). 여러 테이블에 같은 이름이 있으면 self.data 순서대로
+    레코드를 모두 보관하고, 조회 결과는 기존 테이블 순회와 같은 우선순위로 결정한다.
+    """
+
+    def __init__(self, data: Mapping[str, pd.DataFrame], categories: List[Tuple[str, str]],
+                 buildings: BuildingCatalog):
+        self.data = data
+        self.categories = categories  # (테이블 키, 이름 컬럼) - self.data 순서
+        self.buildings = buildings
+        self.records: Dict[str, List[ItemRecord]] = {}  # 지금까지 읽은 테이블의 레코드
+        self._category_order = {key: position for position, (key, _) in enumerate(categories)}
+        self._pending = dict(categories)  # 아직 레코드를 읽지 않은 테이블 -> 이름 컬럼
+        self._name_categories: Optional[Dict[str, List[str]]] = None  # 이름 -> 그 이름이 있는 미로드 테이블
+        self._values: Dict[str, int] = {}
+        self._production_times: Dict[str, int] = {}
+        self._unlock_levels: Dict[str, int] = {}
+        self._resolved = set()
+        self._lock = threading.RLock()
+
+    @classmethod
+    def build(cls, data: Mapping[str, pd.DataFrame],
+              buildings: Optional[BuildingCatalog] = None) -> 'ItemCatalog':
+        """카테고리 테이블과 건물 카탈로그에서 아이템 카탈로그 생성 (테이블은 키만 보고, 로드는 조회 시)"""
+        categories = []
+        for key in data.keys():
+            if key in CROP_CATEGORIES or key.endswith('_goods'):
+                categories.append((key, 'Name'))
+            elif key == 'animals':
+                categories.append((key, 'Good'))
+        return cls(data, categories, buildings or BuildingCatalog({}))
+
+    def __contains__(self, item_name: str) -> bool:
+        self._ensure(item_name)
+        return item_name in self.records
+
+    def __len__(self) -> int:
+        self._read_all()
+        return len(self.records)
+
+    def get(self, item_name: str) -> Optional[ItemRecord]:
+        """대표 레코드 (self.data 순서상 첫 번째 테이블)"""
+        self._ensure(item_name)
+        records = self.records.get(item_name)
+        return records[0] if records else None
+
+    def value(self, item_name: str) -> Optional[int]:
+        self._ensure(item_name)
+        return self._values.get(item_name)
+
+    def production_time(self, item_name: str) -> Optional[int]:
+        self._ensure(item_name)
+        return self._production_times.get(item_name)
+
+    def unlock_level(self, item_name: str) -> Optional[int]:
+        self._ensure(item_name)
+        return self._unlock_levels.get(item_name)
+
+    def first_unlock_level(self, item_name: str, categories: Iterable[str]) -> Optional[int]:
+        """주어진 카테고리 순서대로 처음 발견되는 테이블 UnlockLevel"""
+        self._ensure(item_name)
+        by_category = {record.category: record for record in self.records.get(item_name, [])}
+        for category in categories:
+            record = by_category.get(category)
+            if record is not None and record.unlock_level is not None:
+                return record.unlock_level
+        return None
+
+    def _ensure(self, item_name: str):
+        """이름이 들어 있는 테이블을 모두 읽고 조회 값 계산 (이름당 한 번)"""
+        if item_name in self._resolved:
+            return
+        with self._lock:
+            if item_name in self._resolved:
+                return
+            if self._name_categories is None:
+                self._index_names()
+            for key in self._name_categories.get(item_name, ()):
+                self._read_category(key)
+            self._resolve(item_name)
+            self._resolved.add(item_name)
+
+    def _index_names(self):
+        """미로드 테이블의 이름 목록 수집 - 스냅샷 Name 인덱스를 쓸 수 없는 테이블은 바로 읽는다"""
+        indexed_names = getattr(self.data, 'indexed_names', None)
+        self._name_categories = {}
+        for key, name_column in list(self._pending.items()):
+            names = indexed_names(key) if indexed_names is not None and name_column == 'Name' else None
+            if names is None:
+                self._read_category(key)
+                continue
+            for name in names:
+                self._name_categories.setdefault(name, []).append(key)
+
+    def _read_all(self):
+        # 이미 계산한 이름은 그 이름이 있는 테이블을 모두 읽은 뒤라 다시 계산할 필요 없음
+        with self._lock:
+            for key in list(self._pending):
+                self._read_category(key)
+
+    def _read_category(self, key: str):
+        name_column = self._pending.pop(key, None)
+        if name_column is None:
+            return
+        df = self.data[key]
+        if df.empty or name_column not in df.columns:
+            return
+
+        building = key[:-len('_goods')] if key.endswith('_goods') else key
+        for name, row in _first_rows(df, name_column):
+            records = self.records.setdefault(name, [])
+            records.append(_item_record(name, key, building, row))
+            records.sort(key=lambda record: self._category_order[record.category])
+
+    def _resolve(self, name: str):
+        records = self.records.get(name, [])
+
+        # 가격: 값이 있는 첫 번째 테이블
+        for record in records:
+            if record.price is not None:
+                self._values[name] = record.price
+                break
+
+        # 생산시간: 농작물/생산품 테이블의 TimeMin
+        for record in records:
+            if record.category != 'animals' and record.production_time is not None:
+                self._production_times[name] = record.production_time
+                break
+
+        # 언락레벨: fields -> 생산 건물 언락레벨 -> 동물 순
+        level = None
+        for record in records:
+            if record.category == 'fields' and record.unlock_level is not None:
+                level = record.unlock_level
+                break
+        if level is None:
+            for record in records:
+                if record.category.endswith('_goods'):
+                    building_level = self.buildings.unlock_level(record.building)
+                    if building_level > 0:
+                        level = building_level
+                        break
+        if level is None:
+            for record in records:
+                if record.category == 'animals' and record.unlock_level is not None:
+                    level = record.unlock_level
+                    break
+        if level is not None:
+            self._unlock_levels[name] = level
+
+
+class LevelTable:
+    """
+    exp_levels 주문 파라미터를 레벨 번호로 바로 인덱싱하는 구조체 배열
+
+    params[level][column]이 해당 레벨의 값이고 missing은 같은 모양의 NA 마스크.
+    레벨 행이 없으면 exists[level]이 False. 단건 조회용으로 레벨별 dict도 미리 만들어 둔다.
+    """
+
+    def __init__(self, params: np.ndarray, missing: np.ndarray, exists: np.ndarray):
+        self.params = params
+        self.missing = missing
+        self.exists = exists
+        names = params.dtype.names or ()
+        self._rows: List[Optional[Dict[str, Optional[int]]]] = [
+            {name: (None if is_missing else value) for name, value, is_missing in zip(names, values, flags)}
+            if present else None
+            for values, flags, present in zip(params.tolist(), missing.tolist(), exists.tolist())
+        ]
+
+    @classmethod
+    def build(cls, exp_levels: Optional[pd.DataFrame]) -> 'LevelTable':
+        if exp_levels is None or exp_levels.empty or 'Level' not in exp_levels.columns:
+            return cls.empty()
+
+        levels = pd.to_numeric(exp_levels['Level'], errors='coerce')
+        valid = levels.notna() & (levels >= 0) & (levels == levels.round())
+        rows = exp_levels[valid]
+        levels = levels[valid].astype(np.int64).to_numpy()
+        # 같은 레벨이 여러 행이면 첫 번째 행만 사용
+        levels, first = np.unique(levels, return_index=True)
+        rows = rows.iloc[first]
+
+        size = int(levels.max()) + 1 if len(levels) else 0
+        params = np.zeros(size, dtype=[(name, np.int64) for name in LEVEL_ORDER_COLUMNS])
+        missing = np.zeros(size, dtype=[(name, np.bool_) for name in LEVEL_ORDER_COLUMNS])
+        exists = np.zeros(size, dtype=bool)
+        exists[levels] = True
+        for name in LEVEL_ORDER_COLUMNS:
+            source = name
+            if source not in rows.columns and name in LEVEL_COLUMN_FALLBACKS:
+                source = LEVEL_COLUMN_FALLBACKS[name]
+            if source not in rows.columns:
+                params[name][levels] = LEVEL_ORDER_COLUMNS[source]
+                continue
+            values = pd.to_numeric(rows[source], errors='coerce')
+            missing[name][levels] = values.isna().to_numpy()
+            params[name][levels] = values.fillna(0).astype(np.int64).to_numpy()
+        return cls(params, missing, exists)
+
+    @classmethod
+    def empty(cls) -> 'LevelTable':
+        return cls(np.zeros(0, dtype=[(name, np.int64) for name in LEVEL_ORDER_COLUMNS]),
+                   np.zeros(0, dtype=[(name, np.bool_) for name in LEVEL_ORDER_COLUMNS]),
+                   np.zeros(0, dtype=bool))
+
+    def __contains__(self, level: int) -> bool:
+        return 0 <= level < len(self.exists) and bool(self.exists[level])
+
+    def __len__(self) -> int:
+        return int(self.exists.sum())
+
+    @property
+    def max_level(self) -> int:
+        return len(self.exists) - 1
+
+    def get(self, level: int) -> Optional[Dict[str, Optional[int]]]:
+        """레벨 주문 파라미터 (NA 값은 None, 레벨 행이 없으면 None)"""
+        if 0 <= level < len(self._rows):
+            return self._rows[level]
+        return None
+
+    def column(self, name: str) -> np.ndarray:
+        """레벨 번호로 인덱싱하는 컬럼 배열 (여러 레벨을 한 번에 조회할 때)"""
+        return self.params[name]
+
+    def missing_fields(self, level: int) -> List[str]:
+        row = self.get(level)
+        return [name for name, value in row.items() if value is None] if row else []
+
+
+@dataclass
+class ProductionNode:
+    """생산 그래프 노드 (아이템 1개를 만드는 방법)"""
+    name: str
+    category: str                 # 정의된 테이블 키 (bakery_goods, animals, fields ...), 재료로만 나오면 'raw'
+    building: str                 # 생산 건물 (ProcessingBuilding / 동물 이름 / 테이블 키)
+    craft_time: int               # 1회 생산 시간 (분)
+    ingredients: Dict[str, int] = field(default_factory=dict)  # 재료 -> 개수
+
+
+class ProductionGraph:
+    """
+    전체 생산 체인 DAG (재료 -> 제품)
+
+    빌드 시 위상 정렬 순서로 아이템 1개 기준 합계를 한 번씩 계산해 두므로 이후 조회는 dict 조회.
+    - raw_materials: 재료를 끝까지 풀어낸 기본 재료 개수
+    - critical_time: 재료를 병렬로 만든다고 할 때 가장 긴 경로의 생산 시간 (분)
+    - building_minutes: 체인 전체 건물 가동 시간 합계 (분)
+    - depth: 기본 재료 0, 그 외 1 + 재료 depth 최댓값
+    레시피가 없는 재료(사료 등)는 생산 시간 0인 기본 재료로 본다.
+    """
+
+    def __init__(self, nodes: Dict[str, ProductionNode]):
+        self.nodes = dict(nodes)
+        for node in nodes.values():
+            for ingredient in node.ingredients:
+                if ingredient not in self.nodes:
+                    self.nodes[ingredient] = ProductionNode(ingredient, 'raw', '', 0)
+
+        self.order, cyclic = self._topological_order()
+        if cyclic:
+            print(f"WARNING 생산 그래프 순환 {len(cyclic)}개 (순환 재료는 기본 재료로 계산): {', '.join(cyclic[:10])}")
+        self.consumers: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for node in self.nodes.values():
+            for ingredient in node.ingredients:
+                self.consumers[ingredient].append(node.name)
+
+        self.depth: Dict[str, int] = {}
+        self.critical_time: Dict[str, int] = {}
+        self.building_minutes: Dict[str, int] = {}
+        self.raw_materials: Dict[str, Dict[str, int]] = {}
+        for name in self.order + cyclic:
+            node = self.nodes[name]
+            # 순환으로 아직 계산되지 않은 재료는 기본 재료 취급
+            ingredients = {ingredient: amount for ingredient, amount in node.ingredients.items()
+                           if ingredient in self.depth}
+            if not ingredients:
+                self.depth[name] = 0
+                self.critical_time[name] = node.craft_time
+                self.building_minutes[name] = node.craft_time
+                self.raw_materials[name] = {name: 1}
+                continue
+            self.depth[name] = 1 + max(self.depth[ingredient] for ingredient in ingredients)
+            self.critical_time[name] = node.craft_time + max(self.critical_time[ingredient] for ingredient in ingredients)
+            self.building_minutes[name] = node.craft_time + sum(
+                amount * self.building_minutes[ingredient] for ingredient, amount in ingredients.items()
+            )
+            raw = {}
+            for ingredient, amount in ingredients.items():
+                for material, count in self.raw_materials[ingredient].items():
+                    raw[material] = raw.get(material, 0) + amount * count
+            self.raw_materials[name] = raw
+        self.cyclic = cyclic
+
+    @classmethod
+    def build(cls, recipe_tables: Mapping[str, pd.DataFrame],
+              animals: Optional[pd.DataFrame] = None) -> 'ProductionGraph':
+        """
+        recipe_tables: 카테고리 키 -> Name 필터링 전 테이블 (*_goods, fields, fruits ...)
+        animals: animals.csv (Good <- Feed 1개, 생산 시간은 animal_goods의 TimeMin)
+
+        *_goods는 Name 행에서 레시피가 시작되고 Name이 빈 다음 행들이 Requirement를 이어서 추가한다.
+        같은 아이템이 여러 테이블에 있으면 먼저 나온 정의를 사용.
+        """
+        nodes: Dict[str, ProductionNode] = {}
+        for key, df in recipe_tables.items():
+            if df is None or df.empty or 'Name' not in df.columns:
+                continue
+            columns = df.columns
+            times = df['TimeMin'] if 'TimeMin' in columns else [None] * len(df)
+            buildings = df['ProcessingBuilding'] if 'ProcessingBuilding' in columns else [None] * len(df)
+            requirements = df['Requirement'] if 'Requirement' in columns else [None] * len(df)
+            amounts = df['RequirementAmount'] if 'RequirementAmount' in columns else [None] * len(df)
+
+            current = None
+            for name, craft_time, building, requirement, amount in zip(df['Name'], times, buildings,
+                                                                      requirements, amounts):
+                if pd.notna(name) and str(name).strip():
+                    name = str(name).strip()
+                    if name in nodes:
+                        current = None  # 이미 정의된 아이템의 이어지는 행은 무시
+                        continue
+                    current = ProductionNode(
+                        name=name,
+                        category=key,
+                        building=str(building) if pd.notna(building) else key,
+                        craft_time=_optional_int(craft_time) or 0
+                    )
+                    nodes[name] = current
+                if current is None or pd.isna(requirement) or not str(requirement).strip():
+                    continue
+                requirement = str(requirement).strip()
+                current.ingredients[requirement] = (current.ingredients.get(requirement, 0)
+                                                    + (_optional_int(amount) or 1))
+
+        if animals is not None and not animals.empty and {'Good', 'Feed'} <= set(animals.columns):
+            for animal, good, feed in zip(animals['Name'] if 'Name' in animals.columns else [None] * len(animals),
+                                          animals['Good'], animals['Feed']):
+                if pd.isna(good):
+                    continue
+                good = str(good)
+                node = nodes.get(good)
+                if node is None:
+                    node = nodes[good] = ProductionNode(good, 'animals', str(animal) if pd.notna(animal) else 'animals', 0)
+                elif pd.notna(animal):
+                    node.building = str(animal)
+                if pd.notna(feed) and not node.ingredients:
+                    node.ingredients[str(feed)] = 1
+        return cls(nodes)
+
+    def _topological_order(self) -> Tuple[List[str], List[str]]:
+        """(재료가 먼저 오는 순서, 순환에 걸린 아이템) - Kahn 알고리즘, 같은 단계는 정의 순서 유지"""
+        pending = {name: len(node.ingredients) for name, node in self.nodes.items()}
+        users: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for node in self.nodes.values():
+            for ingredient in node.ingredients:
+                users[ingredient].append(node.name)
+
+        ready = [name for name, count in pending.items() if count == 0]
+        order = []
+        while ready:
+            order.extend(ready)
+            next_ready = []
+            for name in ready:
+                for user in users[name]:
+                    pending[user] -= 1
+                    if pending[user] == 0:
+                        next_ready.append(user)
+            ready = next_ready
+        placed = set(order)
+        return order, [name for name in self.nodes if name not in placed]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def get(self, name: str) -> Optional[ProductionNode]:
+        return self.nodes.get(name)
+
+    def item_cost(self, name: str) -> Dict:
+        """아이템 1개 합계 (그래프에 없으면 생산 시간 0인 기본 재료)"""
+        if name not in self.nodes:
+            return {'depth': 0, 'critical_time': 0, 'building_minutes': 0, 'raw_materials': {name: 1}}
+        return {
+            'depth': self.depth[name],
+            'critical_time': self.critical_time[name],
+            'building_minutes': self.building_minutes[name],
+            'raw_materials': self.raw_materials[name],
+        }
+
+    def order_cost(self, items: Mapping[str, int]) -> Dict:
+        """주문 전체 합계 (아이템별 사전 계산 값을 수량만큼 합산, 아이템 종류 수에만 비례)"""
+        raw = {}
+        depth = critical_time = building_minutes = 0
+        for name, quantity in items.items():
+            cost = self.item_cost(name)
+            depth = max(depth, cost['depth'])
+            critical_time = max(critical_time, cost['critical_time'])
+            building_minutes += quantity * cost['building_minutes']
+            for material, count in cost['raw_materials'].items():
+                raw[material] = raw.get(material, 0) + quantity * count
+        return {
+            'depth': depth,
+            'critical_time': critical_time,
+            'building_minutes': building_minutes,
+            'raw_materials': raw,
+        }
+
+
+@dataclass(frozen=True)
+class CatalogState:
+    """
+    한 데이터 버전의 테이블과 인덱스 묶음 (HayDaySimulator.catalog)
+
+    핫 리로드는 새 묶음을 끝까지 만든 뒤 참조 하나만 교체한다. 호출 측은 요청 처리 시작 시
+    묶음을 한 번 잡아 두고 그것만 보므로, 새 테이블과 이전 인덱스(또는 그 반대)가 섞이지 않는다.
+    available_items / derived 는 이 버전 안에서만 유효한 파생 캐시로 처음 필요할 때 채운다.
+    """
+    version: int
+    data: Mapping[str, pd.DataFrame]
+    orders: pd.DataFrame
+    predefined_orders: pd.DataFrame
+    exp_levels: pd.DataFrame
+    processing_buildings: pd.DataFrame
+    building_catalog: BuildingCatalog
+    level_table: LevelTable
+    predefined_templates: Tuple[OrderTemplate, ...]
+    item_catalog: ItemCatalog
+    unmatched_goods_buildings: Tuple[str, ...]
+    available_items: Dict[int, List[str]] = field(default_factory=dict, compare=False)  # 레벨 -> 가용 아이템
+    derived: Dict[str, object] = field(default_factory=dict, compare=False)  # 'availability_index', 'production_graph'
+
+    @classmethod
+    def build(cls, version: int, data: Mapping[str, pd.DataFrame], orders: pd.DataFrame,
+              predefined_orders: pd.DataFrame, exp_levels: pd.DataFrame, processing_buildings: pd.DataFrame,
+              previous: Optional['CatalogState'] = None) -> 'CatalogState':
+        """테이블에서 인덱스를 만들어 묶음 생성 (previous에서 원본 테이블이 같은 인덱스는 그대로 재사용)"""
+        if previous is not None and processing_buildings is previous.processing_buildings:
+            building_catalog = previous.building_catalog
+        else:
+            building_catalog = BuildingCatalog.build(processing_buildings)
+        if previous is not None and exp_levels is previous.exp_levels:
+            level_table = previous.level_table
+        else:
+            level_table = LevelTable.build(exp_levels)
+        if previous is not None and predefined_orders is previous.predefined_orders:
+            predefined_templates = previous.predefined_templates
+        else:
+            predefined_templates = compile_order_templates(predefined_orders)
+
+        return cls(
+            version=version,
+            data=data,
+            orders=orders,
+            predefined_orders=predefined_orders,
+            exp_levels=exp_levels,
+            processing_buildings=processing_buildings,
+            building_catalog=building_catalog,
+            level_table=level_table,
+            predefined_templates=predefined_templates,
+            item_catalog=ItemCatalog.build(data, building_catalog),
+            unmatched_goods_buildings=tuple(building_catalog.unmatched_goods(data.keys()))
+        )
+
+    @classmethod
+    def empty(cls, data: Optional[Mapping[str, pd.DataFrame]] = None) -> 'CatalogState':
+        """데이터 로드 실패 시 사용하는 빈 묶음"""
+        return cls.build(0, data if data is not None else {}, pd.DataFrame(), pd.DataFrame(),
+                         pd.DataFrame(), pd.DataFrame())
+
+
+def compile_order_templates(predefined_orders: Optional[pd.DataFrame]) -> Tuple[OrderTemplate, ...]:
+    """
+    predefined_orders 행 -> 불변 (아이템, 수량) 템플릿 (행 순서 유지)
+
+    Goods/GoodAmounts는 쉼표로 나뉜 목록이고 수량이 모자라면 첫 번째 수량을 쓴다.
+    파싱할 수 없는 행은 경고 후 제외.
+    """
+    if predefined_orders is None or predefined_orders.empty:
+        return ()
+
+    columns = predefined_orders.columns
+    goods_column = predefined_orders['Goods'] if 'Goods' in columns else ['Wheat'] * len(predefined_orders)
+    amounts_column = (predefined_orders['GoodAmounts'] if 'GoodAmounts' in columns
+                      else ['1'] * len(predefined_orders))
+    templates = []
+    skipped = 0
+    for goods, amounts in zip(goods_column, amounts_column):
+        try:
+            if pd.isna(goods) or pd.isna(amounts):
+                raise ValueError('empty Goods/GoodAmounts')
+            goods = [good.strip() for good in str(goods).split(',')]
+            amounts = str(amounts).split(',')
+            items = {good: int(amounts[i] if i < len(amounts) else amounts[0]) for i, good in enumerate(goods)}
+        except ValueError:
+            skipped += 1
+            continue
+        templates.append((tuple(items), tuple(items.values())))
+    if skipped:
+        print(f"WARNING predefined_orders 파싱 불가 행 {skipped}개 제외")
+    return tuple(templates)
+
+
+def _first_rows(df: pd.DataFrame, name_column: str):
+    """(이름, 행 dict) - 테이블 안에서 같은 이름은 첫 번째 행만"""
+    seen = set()
+    for row in df.to_dict('records'):
+        name = row.get(name_column)
+        if pd.isna(name) or name in seen:
+            continue
+        seen.add(name)
+        yield str(name), row
+
+
+def _optional_int(value) -> Optional[int]:
+    return int(value) if value is not None and pd.notna(value) else None
+
+
+def _item_record(name: str, category: str, building: str, row: Dict) -> ItemRecord:
+    if category == 'animals':
+        price = _optional_int(row.get('ProcessValue', row.get('Value', 10)))
+        production_time = None
+    else:
+        price = None
+        for price_column in PRICE_COLUMNS:
+            candidate = _optional_int(row.get(price_column))
+            if candidate is not None and candidate > 0:
+                price = candidate
+                break
+        production_time = _optional_int(row.get('TimeMin'))
+
+    if category in CROP_CATEGORIES or category == 'animals':
+        layer = 'CROPS'
+    elif (price or 0) >= 100 or (production_time or 0) >= 240:
+        layer = 'TOP'
+    else:
+        layer = 'MID'
+
+    return ItemRecord(
+        name=name,
+        category=category,
+        building=building,
+        price=price,
+        production_time=production_time,
+        unlock_level=_optional_int(row.get('UnlockLevel')),
+        layer=layer
+    )
+
+
+def _column_kind(series: pd.Series) -> str:
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return 'bool'
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return 'int'
+    if pd.api.types.is_float_dtype(series.dtype):
+        return 'float'
+    return 'str'
+
+
+def _encode_table(df: pd.DataFrame):
+    """DataFrame -> (구조체 배열, 컬럼 메타데이터)"""
+    fields = []
+    arrays = []
+    columns = []
+
+    for position, name in enumerate(df.columns):
+        series = df[name]
+        kind = _column_kind(series)
+        field = f"c{position}"
+        mask = series.isna().to_numpy(dtype=bool)
+
+        if kind == 'str':
+            values = np.array(['' if missing else str(value)
+                               for value, missing in zip(series.tolist(), mask)], dtype=str)
+            if values.dtype.itemsize == 0:
+                values = values.astype('<U1')
+        elif kind == 'int':
+            values = series.fillna(0).to_numpy(dtype=np.int64)
+        elif kind == 'float':
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = series.fillna(False).to_numpy(dtype=bool)
+
+        fields.append((field, values.dtype))
+        fields.append((_NA_PREFIX + field, np.bool_))
+        arrays.append(values)
+        arrays.append(mask)
+        columns.append({'name': str(name), 'field': field, 'kind': kind,
+                        'dtype': str(series.dtype)})
+
+    table = np.empty(len(df), dtype=fields)
+    for (field, _), values in zip(fields, arrays):
+        table[field] = values
+    return table, columns
+
+
+def _decode_column(values: np.ndarray, mask: Optional[np.ndarray], kind: str, dtype: str):
+    """구조체 배열 필드 -> pandas 컬럼 값 (Series를 거치지 않아 테이블 생성이 빠름)"""
+    if kind == 'str':
+        restored = values.astype(object)
+        if mask is not None and mask.any():
+            restored[mask] = np.nan
+        if dtype == 'category':
+            return pd.Categorical(restored)
+        if mask is not None and mask.all() and dtype != 'object':
+            # 전부 결측이면 추론이 object로 떨어지므로 원래 dtype 복원
+            return pd.array(restored, dtype=dtype)
+        # object/str dtype은 DataFrame 생성 시 pandas 버전 기본값으로 추론됨
+        return restored
+    if isinstance(pd.api.types.pandas_dtype(dtype), pd.api.extensions.ExtensionDtype):
+        # Int32/boolean 같은 nullable 타입은 결측 마스크와 함께 복원
+        restored = pd.array(np.asarray(values), dtype=dtype)
+        if mask is not None and mask.any():
+            restored[np.asarray(mask)] = pd.NA
+        return restored
+    if kind == 'bool':
+        return np.array(values, dtype=bool)
+    return np.array(values)
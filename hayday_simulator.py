@@ -8,12 +8,23 @@ import pandas as pd
 import numpy as np
 import json
 import os
-import random
-import uuid
-from typing import Dict, List, Tuple, Optional
+import threading
+import time
+import contextlib
+import copy
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Mapping, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 import math
+import bisect
+from collections import OrderedDict
+
+from hayday_catalog import (CATALOG_CACHE_PATH, DATA_PATH, CatalogSnapshot, CatalogState, LazyTableMap,
+                            ProductionGraph, read_game_csv)
+from simulation_random import SeedLike, SimulationRandom, as_simulation_random
 
 # Optional imports for UI features
 try:
@@ -33,9 +44,6 @@ except ImportError:
     st = DummyStreamlit()
     px = go = make_subplots = None
 
-# Configuration
-DATA_PATH = os.path.join(os.path.dirname(__file__), "hayday_extracted_data", "core_data")
-
 class DeliveryType(Enum):
     TRUCK = "Truck"
     TRAIN = "Train"
@@ -62,6 +70,9 @@ class ProductionChain:
     value: int
     unlock_level: int
     building_type: str
+    chain_depth: int = 0  # 기본 재료 0, 재료를 거칠 때마다 +1
+    critical_path_time: int = 0  # 재료 병렬 생산 기준 최장 경로 시간 (분)
+    building_minutes: int = 0  # 체인 전체 건물 가동 시간 (분)
 
 @dataclass
 class DeliveryOrder:
@@ -76,39 +87,230 @@ class DeliveryOrder:
     total_production_time: int = 0  # Total 생산 시간 (분)
     expiry_time: int = 60  # 만료 시간 (분)
 
+@dataclass
+class DeliveryOrderBatch:
+    """같은 조건으로 생성한 주문 묶음 (컬럼 형식, 주문 i의 아이템은 item_names[item_ids[i]])"""
+    delivery_type: DeliveryType
+    difficulty: DifficultyType
+    struggle_score: float
+    level_requirement: int
+    item_names: List[str]
+    item_ids: np.ndarray               # (주문 수, 주문당 아이템 칸 수), 빈 칸은 -1
+    quantities: np.ndarray             # item_ids와 같은 모양, 빈 칸은 0
+    total_value: np.ndarray            # (주문 수,)
+    total_production_time: np.ndarray  # (주문 수,) 분
+    expiry_time: int = 60
+    
+    def __len__(self) -> int:
+        return len(self.total_value)
+    
+    def to_orders(self, rng: Optional[np.random.Generator] = None) -> List[DeliveryOrder]:
+        """DeliveryOrder 목록으로 변환 (rng: 주문 번호용)"""
+        rng = np.random.default_rng() if rng is None else rng
+        order_numbers = rng.integers(1000, 9999, size=len(self)).tolist()
+        orders = []
+        for number, ids, amounts, value, total_time in zip(order_numbers, self.item_ids.tolist(),
+                                                           self.quantities.tolist(), self.total_value.tolist(),
+                                                           self.total_production_time.tolist()):
+            orders.append(DeliveryOrder(
+                order_id=f"{self.delivery_type.value}_{number}",
+                delivery_type=self.delivery_type,
+                items={self.item_names[item_id]: amount for item_id, amount in zip(ids, amounts) if item_id >= 0},
+                total_value=value,
+                difficulty=self.difficulty,
+                struggle_score=self.struggle_score,
+                level_requirement=self.level_requirement,
+                total_production_time=total_time,
+                expiry_time=self.expiry_time
+            ))
+        return orders
+    
+    @classmethod
+    def from_orders(cls, orders: List[DeliveryOrder], delivery_type: DeliveryType,
+                    struggle_score: float, player_level: int) -> 'DeliveryOrderBatch':
+        """단건 생성한 주문들을 배치 형식으로 묶음 (아이템 칸 수는 가장 긴 주문 기준)"""
+        item_names = list(dict.fromkeys(item for order in orders for item in order.items))
+        item_index = {item: index for index, item in enumerate(item_names)}
+        width = max((len(order.items) for order in orders), default=0)
+        item_ids = np.full((len(orders), width), -1, dtype=np.int64)
+        quantities = np.zeros((len(orders), width), dtype=np.int64)
+        for row, order in enumerate(orders):
+            for column, (item, amount) in enumerate(order.items.items()):
+                item_ids[row, column] = item_index[item]
+                quantities[row, column] = amount
+        return cls(
+            delivery_type=orders[0].delivery_type if orders else delivery_type,
+            difficulty=orders[0].difficulty if orders else DifficultyType.NORMAL,
+            struggle_score=struggle_score,
+            level_requirement=player_level,
+            item_names=item_names,
+            item_ids=item_ids,
+            quantities=quantities,
+            total_value=np.array([order.total_value for order in orders], dtype=np.int64),
+            total_production_time=np.array([order.total_production_time for order in orders], dtype=np.int64),
+            expiry_time=orders[0].expiry_time if orders else 60
+        )
+
+@dataclass
+class OrderContext:
+    """(레벨, 납품 타입)별 동적 주문 준비 데이터 - 호출마다 같은 값이라 캐시해 두고 샘플링만 새로 한다"""
+    delivery_type: DeliveryType         # 실제 납품 타입 (보트 미해금 레벨은 트럭)
+    min_items: int
+    max_items: int
+    min_value: int
+    max_value: int
+    available_items: List[str]
+    values: np.ndarray                  # available_items 순서의 가치 배열
+    times: np.ndarray                   # available_items 순서의 생산시간 배열
+    pools: Dict[str, np.ndarray]        # 카테고리 -> available_items 인덱스
+    pool_items: Dict[str, List[str]]    # 카테고리 -> 아이템 이름 (단건 샘플링용)
+    item_values: Dict[str, int]
+    item_times: Dict[str, int]
+
+@dataclass
+class PopulationState:
+    """플레이어 집단 상태 (플레이어 축 배열)"""
+    level: np.ndarray             # 플레이어 레벨 (시뮬레이션 중 고정)
+    struggle: np.ndarray          # 어려움 지수
+    total_value: np.ndarray       # 누적 납품 가치 (코인)
+    orders_completed: np.ndarray  # 누적 주문 수
+    
+    def __len__(self) -> int:
+        return len(self.level)
+
+def _sample_distinct(rng: np.random.Generator, n: int, population: int, k: int,
+                     taken: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    행마다 [0, population)에서 서로 다른 정수 k개 추출 -> (n, k) 배열
+    
+    taken이 주어지면 같은 행의 taken 값과도 겹치지 않는다. 모집단이 작으면 난수 키 정렬,
+    크면 복원 추출 후 중복이 생긴 행만 다시 뽑는다 (행 단위 균등 비복원 추출과 같은 분포).
+    """
+    taken = np.empty((n, 0), dtype=np.int64) if taken is None else taken
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.int64)
+    if population <= 4 * (taken.shape[1] + k):
+        keys = rng.random((n, population))
+        np.put_along_axis(keys, taken, 2.0, axis=1)  # 이미 뽑힌 값은 맨 뒤로
+        return np.argsort(keys, axis=1)[:, :k]
+    
+    picks = rng.integers(0, population, size=(n, k))
+    pending = np.arange(n)
+    while len(pending):
+        rows = np.sort(np.concatenate([taken[pending], picks[pending]], axis=1), axis=1)
+        pending = pending[(rows[:, 1:] == rows[:, :-1]).any(axis=1)]
+        picks[pending] = rng.integers(0, population, size=(len(pending), k))
+    return picks
+
+def _catalog_attribute(name: str, doc: str) -> property:
+    """self.catalog(현재 데이터 버전 묶음)의 같은 이름 속성 - 교체는 catalog 참조로만 한다"""
+    return property(lambda self: getattr(self.catalog, name), doc=doc)
+
 class HayDaySimulator:
     """HayDay 생산 및 동적 밸런싱 시뮬레이터"""
     
-    def __init__(self):
-        self.data = {}
+    def __init__(self, use_snapshot: bool = True, load_workers: Optional[int] = None,
+                 preload: Optional[List[str]] = None, rng: SeedLike = None,
+                 snapshot_dir: str = CATALOG_CACHE_PATH):
+        self.rng: SimulationRandom = as_simulation_random(rng)  # 인스턴스 전용 난수 스트림 (시드/스트림 주입 가능)
+        self.snapshot = CatalogSnapshot(cache_dir=snapshot_dir, enabled=use_snapshot)
         self.production_chains = {}
         self.delivery_patterns = []
         self.difficulty_policies = []
         self.reward_policies = []
+        self.load_workers = load_workers
+        self.preload = preload
+        self.load_timings = {}
+        # 테이블 + 인덱스 묶음 (핫 리로드 시 새 묶음으로 참조만 교체)
+        self.catalog: CatalogState = CatalogState.empty(LazyTableMap(self.snapshot, max_workers=load_workers))
+        self._order_contexts: OrderedDict = OrderedDict()  # (버전, 레벨, 납품 타입) -> OrderContext
+        self._order_context_lock = threading.Lock()
+        self._level_item_tables: OrderedDict = OrderedDict()  # (버전, 레벨) -> 아이템 표
+        self._level_item_tables_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
         self.load_data()
-        
+    
+    # 현재 데이터 버전의 테이블/인덱스 (여러 값을 함께 쓸 때는 self.catalog를 한 번 잡아 두고 사용)
+    data = _catalog_attribute('data', "카테고리 키 -> DataFrame (지연 로드)")
+    orders = _catalog_attribute('orders', "orders.csv")
+    predefined_orders = _catalog_attribute('predefined_orders', "predefined_orders.csv")
+    exp_levels = _catalog_attribute('exp_levels', "exp_levels.csv")
+    processing_buildings = _catalog_attribute('processing_buildings', "processing_buildings.csv")
+    building_catalog = _catalog_attribute('building_catalog', "건물 언락레벨/슬롯 인덱스")
+    level_table = _catalog_attribute('level_table', "레벨별 주문 파라미터 인덱스")
+    predefined_templates = _catalog_attribute('predefined_templates', "튜토리얼 주문 템플릿")
+    unmatched_goods_buildings = _catalog_attribute('unmatched_goods_buildings',
+                                                   "processing_buildings에 없는 goods 카테고리")
+    item_catalog = _catalog_attribute('item_catalog', "아이템 이름 -> 가격/시간/언락레벨 인덱스")
+    catalog_version = _catalog_attribute('version', "데이터 핫 리로드 때마다 증가")
+    
+    @property
+    def production_graph(self) -> ProductionGraph:
+        """전체 생산 체인 DAG (첫 사용 시 생성)"""
+        return self._production_graph(self.catalog)
+    
+    def _production_graph(self, catalog: CatalogState) -> ProductionGraph:
+        graph = catalog.derived.get('production_graph')
+        if graph is None:
+            graph = catalog.derived['production_graph'] = self._build_production_graph(catalog.data)
+        return graph
+    
+    # 생산 그래프용 Name 필터링 전 레시피 테이블 키 접미사 (이어지는 Requirement 행 유지)
+    RECIPE_TABLE_SUFFIX = '__recipes'
+    
+    def _build_production_graph(self, data: Mapping[str, pd.DataFrame],
+                                frames: Optional[Dict[str, pd.DataFrame]] = None) -> ProductionGraph:
+        """*_goods 레시피(필터링 전) + 농작물/과일 + 동물로 생산 그래프 생성 (frames: 리로드한 레시피 테이블)"""
+        frames = frames or {}
+        goods_keys = [key for key in data.keys() if key.endswith('_goods')
+                      and not any(marker in key.lower() for marker in self.EXCLUDED_CATEGORY_MARKERS)]
+        recipe_keys = [key + self.RECIPE_TABLE_SUFFIX for key in goods_keys]
+        missing = [key for key in recipe_keys if key not in frames]
+        loaded, errors = self.snapshot.load_many(
+            [(key, f"{DATA_PATH}/{key[:-len(self.RECIPE_TABLE_SUFFIX)]}.csv", self._table_reader(False))
+             for key in missing],
+            max_workers=self.load_workers
+        )
+        for key, error in errors.items():
+            print(f"WARNING {key} 레시피 로드 실패: {error}")
+        
+        recipe_tables = {goods_key: frames.get(recipe_key, loaded.get(recipe_key))
+                         for goods_key, recipe_key in zip(goods_keys, recipe_keys)}
+        for key in ['fields', 'fruits', 'fruit_trees']:
+            if key in data:
+                recipe_tables[key] = data[key]
+        animals = data['animals'] if 'animals' in data else None
+        return ProductionGraph.build(recipe_tables, animals)
+    
+    @staticmethod
+    def _table_reader(filter_names: bool = True):
+        """CSV 리더 선택 (Name 필터링 여부)"""
+        if filter_names:
+            return read_game_csv
+        return lambda path: read_game_csv(path, filter_names=False)
+    
+    def _read_table(self, key: str, file_path: str, filter_names: bool = True) -> pd.DataFrame:
+        """CSV 테이블 로드 (카탈로그 스냅샷이 유효하면 파싱 없이 매핑)"""
+        return self.snapshot.load(key, file_path, self._table_reader(filter_names))
+    
     def load_data(self):
-        """CSV 데이터 로드"""
+        """
+        CSV 데이터 로드
+        
+        self.data의 카테고리 테이블은 등록만 해 두고 처음 접근할 때 로드한다.
+        preload에 지정한 카테고리와 주문/레벨/건물 테이블만 시작 시 병렬로 로드.
+        """
+        data = LazyTableMap(self.snapshot, max_workers=self.load_workers)
         try:
-            # HayDay 게임 데이터 로드 (오류 방지)
-            data_files = {
-                'animals': f"{DATA_PATH}/animals.csv",
-                'exp_levels': f"{DATA_PATH}/exp_levels.csv",
-                'fields': f"{DATA_PATH}/fields.csv"
-            }
+            started = time.perf_counter()
             
-            for key, file_path in data_files.items():
-                try:
-                    df = pd.read_csv(file_path)
-                    # 첫 번째 행이 데이터 타입인 경우 제거
-                    if len(df) > 1 and df.iloc[0].astype(str).str.contains('int|String|Boolean|float', na=False).any():
-                        df = df.drop(0).reset_index(drop=True)
-                    self.data[key] = df
-                except Exception as e:
-                    print(f"WARNING {key} 파일 로드 실패: {e}")
-                    self.data[key] = pd.DataFrame()  # 빈 데이터프레임으로 초기화
+            # HayDay 게임 데이터 (오류 방지를 위해 Name 필터링 없이 로드)
+            data.register('animals', f"{DATA_PATH}/animals.csv", self._table_reader(False))
+            data.register('exp_levels', f"{DATA_PATH}/exp_levels.csv", self._table_reader(False))
+            # fields는 기존 키 순서(animals, exp_levels, fields, *_goods, fruits, fruit_trees)를 유지하려고 먼저 등록
+            data.register('fields', os.path.join(DATA_PATH, "fields.csv"))
             
-            # 모든 _goods.csv 파일 자동 검색 및 로드
+            # 모든 _goods.csv 파일 자동 검색 (전체 파일명을 키로 사용 ex: bakery_goods)
             import glob
             goods_pattern = os.path.join(DATA_PATH, "*_goods.csv")
             goods_files = glob.glob(goods_pattern)
@@ -116,119 +318,139 @@ class HayDaySimulator:
             print(f"Found {len(goods_files)} production building files")
             
             for goods_path in goods_files:
-                try:
-                    filename = os.path.basename(goods_path)
-                    key = filename.replace('.csv', '')  # 전체 파일명을 키로 사용 (ex: bakery_goods)
-                    df = pd.read_csv(goods_path)
-                    
-                    # 데이터 타입 행 제거
-                    if len(df) > 1 and df.iloc[0].astype(str).str.contains('int|String|Boolean|float', na=False).any():
-                        df = df.drop(0).reset_index(drop=True)
-                    
-                    # Name이 비어있지 않은 행만 필터링
-                    if 'Name' in df.columns:
-                        df = df[df['Name'].notna() & (df['Name'].astype(str).str.strip() != '')]
-                        df = df.reset_index(drop=True)
-                    
-                    self.data[key] = df
-                    if len(df) > 0:
-                        print(f"Loaded {key}: {len(df)} items")
-                except Exception as e:
-                    print(f"Warning: {filename} loading failed: {e}")
-                    self.data[key] = pd.DataFrame()
+                key = os.path.basename(goods_path).replace('.csv', '')
+                data.register(key, goods_path)
             
-            # 농작물 및 과일 데이터도 로드
-            crop_files = ['fields.csv', 'fruits.csv', 'fruit_trees.csv']
-            for crop_file in crop_files:
-                try:
-                    key = crop_file.replace('.csv', '')
-                    df = pd.read_csv(os.path.join(DATA_PATH, crop_file))
-                    if len(df) > 1 and df.iloc[0].astype(str).str.contains('int|String|Boolean|float', na=False).any():
-                        df = df.drop(0).reset_index(drop=True)
-                    if 'Name' in df.columns:
-                        df = df[df['Name'].notna() & (df['Name'].astype(str).str.strip() != '')]
-                        df = df.reset_index(drop=True)
-                    self.data[key] = df
-                    print(f"Loaded {key}: {len(df)} items")
-                except Exception as e:
-                    print(f"Warning: {crop_file} loading failed: {e}")
-                    self.data[key] = pd.DataFrame()
+            # 농작물 및 과일 데이터
+            for key in ['fruits', 'fruit_trees']:
+                data.register(key, os.path.join(DATA_PATH, f"{key}.csv"))
             
-            # HayDay 실제 주문/경험 시스템 데이터 로드
-            try:
-                self.orders = pd.read_csv(f"{DATA_PATH}/orders.csv")
-                self.predefined_orders = pd.read_csv(f"{DATA_PATH}/predefined_orders.csv")
-                self.exp_levels = pd.read_csv(f"{DATA_PATH}/exp_levels.csv")
-                
-                # 건물 언락 레벨 데이터 로드
-                self.processing_buildings = pd.read_csv(f"{DATA_PATH}/processing_buildings.csv")
-                
-                # 데이터 타입 행 제거 (HayDay 데이터 형식)
-                for df_name in ['orders', 'predefined_orders', 'exp_levels', 'processing_buildings']:
-                    df = getattr(self, df_name)
-                    if len(df) > 1 and df.iloc[0].astype(str).str.contains('int|String|Boolean|float', na=False).any():
-                        setattr(self, df_name, df.drop(0).reset_index(drop=True))
-                
-                print("HayDay order system data loading completed!")
-                print(f"Loaded processing buildings data: {len(self.processing_buildings)} buildings")
-                
-            except Exception as e:
-                print(f"Warning: HayDay order data loading failed: {e}")
+            # 시작 시 필요한 카테고리만 미리 로드
+            errors = {}
+            if self.preload:
+                errors.update(data.preload(self.preload))
+            for key, error in errors.items():
+                print(f"WARNING {key} 파일 로드 실패: {error}")
+            
+            # HayDay 실제 주문/경험 시스템 데이터 (건물 언락 레벨 포함) - 항상 로드
+            order_keys = ['orders', 'predefined_orders', 'processing_buildings']
+            frames, errors = self.snapshot.load_many(
+                [(key, f"{DATA_PATH}/{key}.csv", self._table_reader(False)) for key in order_keys],
+                max_workers=self.load_workers
+            )
+            
+            failed = [key for key in order_keys if key in errors]
+            exp_levels = data['exp_levels']
+            if failed or exp_levels.empty:
+                print(f"Warning: HayDay order data loading failed: {errors[failed[0]] if failed else 'exp_levels'}")
                 # 기본 데이터프레임으로 초기화
-                self.orders = pd.DataFrame()
-                self.predefined_orders = pd.DataFrame() 
-                self.exp_levels = pd.DataFrame()
-                self.processing_buildings = pd.DataFrame()
+                frames = {key: pd.DataFrame() for key in order_keys}
+                exp_levels = pd.DataFrame()
+            else:
+                print("HayDay order system data loading completed!")
+                print(f"Loaded processing buildings data: {len(frames['processing_buildings'])} buildings")
+            
+            # 레벨별 주문 파라미터 / 튜토리얼 주문 템플릿 / 건물 언락레벨 인덱스를 묶어 한 번에 교체
+            self.catalog = CatalogState.build(0, data, frames['orders'], frames['predefined_orders'],
+                                              exp_levels, frames['processing_buildings'])
+            
+            # goods 카테고리 -> processing_buildings 매칭 점검
+            unmatched = self.catalog.unmatched_goods_buildings
+            if unmatched:
+                print(f"WARNING processing_buildings에 없는 생산 건물 {len(unmatched)}개 "
+                      f"(언락레벨 0으로 처리): {', '.join(unmatched)}")
             
-            print("Data loading completed!")
+            self.load_timings = self.snapshot.timings  # 지연 로드된 테이블도 이후에 기록됨
+            elapsed = time.perf_counter() - started
+            print(f"Data loading completed in {elapsed:.2f}s "
+                  f"({len(data.loaded_keys())}/{len(data)} categories loaded, rest on demand; "
+                  f"snapshot hits: {self.snapshot.stats['hits']}, rebuilt: {self.snapshot.stats['builds']})")
             
         except Exception as e:
             print(f"Data loading failed: {e}")
             # 모든 데이터를 빈 데이터프레임으로 초기화
-            self.data = {}
+            self.catalog = CatalogState.empty()
             self.delivery_patterns = pd.DataFrame()
             self.delivery_thresholds = pd.DataFrame()
             self.difficulty_policies = pd.DataFrame()
             self.reward_policies = pd.DataFrame()
     
+    # 별도 속성으로 들고 있는 주문/레벨/건물 테이블
+    ORDER_TABLE_KEYS = ['orders', 'predefined_orders', 'exp_levels', 'processing_buildings']
+    
+    def reload_changed_data(self) -> List[str]:
+        """
+        로드 이후 수정된 CSV만 다시 읽고, 그 테이블에 의존하는 인덱스만 새로 만든다.
+        
+        새 테이블과 인덱스를 CatalogState 하나로 모두 만든 뒤 self.catalog 참조만 교체하므로,
+        진행 중인 요청은 이전 버전을 끝까지 보고 다음 조회부터 새 버전을 본다. 바뀐 테이블 키 목록 반환.
+        """
+        with self._reload_lock:
+            changed = self.snapshot.changed_keys()
+            if not changed:
+                return []
+            
+            frames, errors = self.snapshot.reload(changed)
+            for key, error in errors.items():
+                print(f"WARNING {key} 다시 로드 실패 (이전 데이터 유지): {error}")
+            if not frames:
+                return []
+            
+            # 새 묶음 생성 (바뀌지 않은 테이블의 인덱스는 이전 묶음 것을 재사용)
+            current = self.catalog
+            data = current.data.with_frames(frames) if isinstance(current.data, LazyTableMap) else current.data
+            tables = {key: frames.get(key, getattr(current, key)) for key in self.ORDER_TABLE_KEYS}
+            catalog = CatalogState.build(current.version + 1, data, tables['orders'], tables['predefined_orders'],
+                                         tables['exp_levels'], tables['processing_buildings'], previous=current)
+            
+            item_tables_changed = any(key in current.data and key != 'exp_levels' for key in frames)
+            if not item_tables_changed and catalog.building_catalog is current.building_catalog:
+                # 아이템/건물 데이터가 그대로면 가용 아이템 인덱스 유지 (레벨 테이블만 바뀐 경우 등)
+                catalog.available_items.update(current.available_items)
+                if 'availability_index' in current.derived:
+                    catalog.derived['availability_index'] = current.derived['availability_index']
+            production_graph = current.derived.get('production_graph')
+            if production_graph is not None:
+                if any(key in current.data or key.endswith(self.RECIPE_TABLE_SUFFIX) for key in frames):
+                    production_graph = self._build_production_graph(data, frames)
+                catalog.derived['production_graph'] = production_graph
+            
+            # 참조 교체
+            self.catalog = catalog
+            self._drop_stale_caches(catalog.version)
+            
+            print(f"Data reloaded (v{catalog.version}): {', '.join(frames)}")
+            return list(frames)
+    
+    def _drop_stale_caches(self, version: int):
+        """이전 데이터 버전으로 만든 주문 컨텍스트/아이템 표 정리 (키에 버전이 있어 남아 있어도 쓰이지 않음)"""
+        with self._order_context_lock:
+            for key in [key for key in self._order_contexts if key[0] != version]:
+                del self._order_contexts[key]
+        with self._level_item_tables_lock:
+            for key in [key for key in self._level_item_tables if key[0] != version]:
+                del self._level_item_tables[key]
+    
     def analyze_production_chains(self) -> Dict[str, ProductionChain]:
-        """Production 체인 분석"""
+        """Production 체인 분석 (재료가 있는 모든 생산품, 재료가 먼저 오는 순서)"""
+        catalog = self.catalog
+        graph = self._production_graph(catalog)
         chains = {}
-        
-        # 동물 생산 체인
-        if 'animals' in self.data:
-            for _, animal in self.data['animals'].iterrows():
-                if pd.notna(animal.get('Name')):
-                    chains[animal['Good']] = ProductionChain(
-                        item_name=animal['Good'],
-                        production_time=0,  # 연속 생산
-                        ingredients={animal['Feed']: 1},
-                        value=animal['Value'],
-                        unlock_level=animal['UnlockLevel'],
-                        building_type='Animal'
-                    )
-        
-        # 제품 생산 체인
-        for category in ['bakery', 'dairy', 'cafe']:
-            if category in self.data:
-                for _, product in self.data[category].iterrows():
-                    if pd.notna(product.get('Name')):
-                        ingredients = {}
-                        for i in range(1, 6):  # Ingredient1~5
-                            ing_col = f'Ingredient{i}'
-                            amt_col = f'IngredientAmount{i}'
-                            if ing_col in product and pd.notna(product[ing_col]):
-                                ingredients[product[ing_col]] = product.get(amt_col, 1)
-                        
-                        chains[product['Name']] = ProductionChain(
-                            item_name=product['Name'],
-                            production_time=product.get('ProcessTime', 60),
-                            ingredients=ingredients,
-                            value=product.get('Value', 100),
-                            unlock_level=product.get('UnlockLevel', 1),
-                            building_type=category.capitalize()
-                        )
-        
+        for name in graph.order + graph.cyclic:
+            node = graph.nodes[name]
+            if not node.ingredients:
+                continue
+            chains[name] = ProductionChain(
+                item_name=name,
+                production_time=node.craft_time,
+                ingredients=dict(node.ingredients),
+                value=self._get_item_value(name, catalog),
+                unlock_level=self._get_item_unlock_level(name, catalog),
+                building_type=node.building,
+                chain_depth=graph.depth[name],
+                critical_path_time=graph.critical_time[name],
+                building_minutes=graph.building_minutes[name]
+            )
         return chains
     
     def calculate_struggle_score(self, player_level: int, inventory: Dict[str, int]) -> float:
@@ -244,13 +466,11 @@ class HayDaySimulator:
         return min(100, base_score + inventory_score)
     
     def _generate_basic_order(self, player_level: int, delivery_type: DeliveryType, 
-                            struggle_score: float) -> DeliveryOrder:
+                            struggle_score: float, catalog: Optional[CatalogState] = None) -> DeliveryOrder:
         """기본 주문 생성 (데이터가 없는 경우의 폴백)"""
-        import uuid
-        import random
-        
+        catalog = catalog or self.catalog
         # 플레이어 레벨에 따른 사용 가능한 모든 아이템 가져오기
-        available_items = self._get_available_items(player_level)
+        available_items = self._get_available_items(player_level, catalog)
         if not available_items:
             # Items이 없으면 기본 아이템 사용
             available_items = ["밀", "옥수수", "당근", "설탕수수", "코코아", "계란", "우유"]
@@ -264,30 +484,30 @@ class HayDaySimulator:
             item_count = 2
         elif struggle_score < 60:
             difficulty = DifficultyType.NORMAL
-            item_count = random.randint(2, 3)
+            item_count = self.rng.randint(2, 3)
         elif struggle_score < 80:
             difficulty = DifficultyType.HARD
-            item_count = random.randint(3, 4)
+            item_count = self.rng.randint(3, 4)
         else:
             difficulty = DifficultyType.VERY_HARD
-            item_count = random.randint(4, 5)
+            item_count = self.rng.randint(4, 5)
         
         # 랜덤 아이템 선택 - 레벨에 맞는 다양한 아이템 선택
-        selected_items = random.sample(available_items, min(item_count, len(available_items)))
+        selected_items = self.rng.sample(available_items, min(item_count, len(available_items)))
         items = {}
         
         for item in selected_items:
             # Items 수량은 난이도에 따라 조정
             if difficulty == DifficultyType.VERY_EASY:
-                qty = random.randint(1, 3)
+                qty = self.rng.randint(1, 3)
             elif difficulty == DifficultyType.EASY:
-                qty = random.randint(2, 5)
+                qty = self.rng.randint(2, 5)
             elif difficulty == DifficultyType.NORMAL:
-                qty = random.randint(3, 7)
+                qty = self.rng.randint(3, 7)
             elif difficulty == DifficultyType.HARD:
-                qty = random.randint(4, 9)
+                qty = self.rng.randint(4, 9)
             else:
-                qty = random.randint(5, 12)
+                qty = self.rng.randint(5, 12)
             items[item] = qty
         
         # 실제 아이템 가격 및 생산 시간 계산
@@ -296,8 +516,8 @@ class HayDaySimulator:
         production_times = []
         
         for item_name, item_qty in items.items():
-            item_value = self._get_item_value(item_name)
-            item_time = self._get_item_production_time(item_name)
+            item_value = self._get_item_value(item_name, catalog)
+            item_time = self._get_item_production_time(item_name, catalog)
             total_value += item_value * item_qty
             total_time += item_time * item_qty
             production_times.append(item_time)
@@ -305,7 +525,7 @@ class HayDaySimulator:
         avg_time = sum(production_times) / len(production_times) if production_times else 0
         
         return DeliveryOrder(
-            order_id=f"BASIC-{uuid.uuid4().hex[:8].upper()}",
+            order_id=f"BASIC-{self.rng.getrandbits(32):08X}",
             delivery_type=delivery_type,
             items=items,
             total_value=total_value,
@@ -318,238 +538,111 @@ class HayDaySimulator:
     def generate_delivery_order(self, player_level: int, struggle_score: float, 
                               delivery_type: DeliveryType = DeliveryType.TRUCK) -> DeliveryOrder:
         """HayDay 실제 데이터를 기반으로 한 납품 주문 생성"""
+        catalog = self.catalog  # 주문 하나는 같은 데이터 버전으로 생성 (도중에 리로드되어도)
         
         # 레벨 정보 가져오기
-        level_data = self._get_level_data(player_level)
+        level_data = self._get_level_data(player_level, catalog)
         if level_data is None:
-            return self._generate_basic_order(player_level, delivery_type, struggle_score)
+            return self._generate_basic_order(player_level, delivery_type, struggle_score, catalog)
         
         # 사전 정의된 주문이 있는지 확인
-        predefined = self._get_predefined_order(player_level)
+        predefined = self._get_predefined_order(player_level, catalog)
         if predefined is not None:
             return predefined
         
         # 동적 주문 생성
-        return self._generate_dynamic_order(player_level, struggle_score, delivery_type, level_data)
+        return self._generate_dynamic_order(player_level, struggle_score, delivery_type, level_data, catalog)
     
-    def _get_level_data(self, player_level: int):
-        """Player 레벨에 해당하는 데이터 조회"""
-        if self.exp_levels.empty:
-            return None
-            
-        try:
-            # Level 컬럼을 정수로 변환하여 비교
-            level_data = self.exp_levels[
-                pd.to_numeric(self.exp_levels['Level'], errors='coerce') == player_level
-            ]
-            return level_data.iloc[0] if not level_data.empty else None
-        except Exception as e:
-            print(f"WARNING 레벨 데이터 조회 오류: {e}")
-            return None
+    def _get_level_data(self, player_level: int,
+                        catalog: Optional[CatalogState] = None) -> Optional[Dict[str, Optional[int]]]:
+        """Player 레벨에 해당하는 주문 파라미터 조회 (레벨 번호로 바로 인덱싱)"""
+        return (catalog or self.catalog).level_table.get(player_level)
     
-    def _get_predefined_order(self, player_level: int):
-        """사전 정의된 주문 확인 (튜토리얼용)"""
-        if self.predefined_orders.empty:
-            return None
-        
-        # 레벨 10 이하에서만 사전 정의된 주문 사용
-        if player_level > 10:
+    # 사전 정의 주문은 앞쪽 템플릿 3개만 사용, 주문 가치는 수량당 10 코인 (임시 가치)
+    PREDEFINED_ORDER_POOL = 3
+    PREDEFINED_ORDER_UNIT_VALUE = 10
+    
+    def _get_predefined_order(self, player_level: int, catalog: Optional[CatalogState] = None):
+        """사전 정의된 주문 확인 (튜토리얼용, 레벨 10 이하에서만)"""
+        templates = (catalog or self.catalog).predefined_templates
+        if not templates or player_level > 10:
             return None
-            
-        try:
-            # 간단한 사전 정의 주문 생성 (예시)
-            available_orders = self.predefined_orders.head(3)  # 처음 3개만 사용
-            if not available_orders.empty:
-                order = available_orders.sample(1).iloc[0]
-                goods = str(order.get('Goods', 'Wheat')).split(',')
-                amounts = str(order.get('GoodAmounts', '1')).split(',')
-                
-                items = {}
-                for i, good in enumerate(goods):
-                    amount = int(amounts[i] if i < len(amounts) else amounts[0])
-                    items[good.strip()] = amount
-                
-                return DeliveryOrder(
-                    order_id=f"PRE_{player_level}",
-                    delivery_type=DeliveryType.TRUCK,
-                    items=items,
-                    total_value=sum(amount * 10 for amount in items.values()),  # 임시 가치
-                    difficulty=DifficultyType.EASY,
-                    struggle_score=50.0,  # 기본값
-                    level_requirement=player_level,
-                    expiry_time=60
-                )
-        except Exception as e:
-            print(f"WARNING 사전 정의 주문 생성 오류: {e}")
         
-        return None
+        pool_size = min(self.PREDEFINED_ORDER_POOL, len(templates))
+        goods, amounts = templates[self.rng.randrange(pool_size)]
+        return DeliveryOrder(
+            order_id=f"PRE_{player_level}",
+            delivery_type=DeliveryType.TRUCK,
+            items=dict(zip(goods, amounts)),
+            total_value=sum(amounts) * self.PREDEFINED_ORDER_UNIT_VALUE,
+            difficulty=DifficultyType.EASY,
+            struggle_score=50.0,  # 기본값
+            level_requirement=player_level,
+            expiry_time=60
+        )
+    
+    def _predefined_order_batch(self, n: int, player_level: int, rng: np.random.Generator,
+                                catalog: Optional[CatalogState] = None) -> 'DeliveryOrderBatch':
+        """사전 정의 주문 n개 (템플릿 번호만 배열로 추출)"""
+        templates = (catalog or self.catalog).predefined_templates[:self.PREDEFINED_ORDER_POOL]
+        item_names = list(dict.fromkeys(good for goods, _ in templates for good in goods))
+        item_index = {item: index for index, item in enumerate(item_names)}
+        width = max(len(goods) for goods, _ in templates)
+        template_ids = np.full((len(templates), width), -1, dtype=np.int64)
+        template_amounts = np.zeros((len(templates), width), dtype=np.int64)
+        for row, (goods, amounts) in enumerate(templates):
+            template_ids[row, :len(goods)] = [item_index[good] for good in goods]
+            template_amounts[row, :len(goods)] = amounts
+        
+        picks = rng.integers(0, len(templates), size=n)
+        quantities = template_amounts[picks]
+        return DeliveryOrderBatch(
+            delivery_type=DeliveryType.TRUCK,
+            difficulty=DifficultyType.EASY,
+            struggle_score=50.0,
+            level_requirement=player_level,
+            item_names=item_names,
+            item_ids=template_ids[picks],
+            quantities=quantities,
+            total_value=quantities.sum(axis=1) * self.PREDEFINED_ORDER_UNIT_VALUE,
+            total_production_time=np.zeros(n, dtype=np.int64)
+        )
     
     def _generate_dynamic_order(self, player_level: int, struggle_score: float, 
-                               delivery_type: DeliveryType, level_data) -> DeliveryOrder:
+                               delivery_type: DeliveryType, level_data: Dict[str, Optional[int]],
+                               catalog: Optional[CatalogState] = None) -> DeliveryOrder:
         """Dynamic 주문 생성 (HayDay 레벨 데이터 기반)"""
+        catalog = catalog or self.catalog
         try:
-            # 레벨 데이터에서 주문 매개변수 추출 (실제 HayDay CSV 데이터 완전 활용)
-            min_goods = int(level_data.get('MinGoodsInOrderDelivery', 1))
-            max_goods = int(level_data.get('MaxGoodsInOrderDelivery', 3))
-            min_value = int(level_data.get('OrderMinValue', 100))
-            max_value = int(level_data.get('OrderMaxValue', 600))
-            max_order_count = int(level_data.get('MaxOrderCount', 1))
-            truck_coin_multiplier = int(level_data.get('TruckCoinMultiplier', 100))
-            truck_exp_multiplier = int(level_data.get('TruckEXPMultiplier', 100))
-            order_cancel_time = int(level_data.get('OrderCancelTimeMin', 6))
-            
-            # 특별 주문 시스템 (CSV 데이터 기반)
-            special_order_probability = int(level_data.get('SpecialOrderProbablity', 0))  # 오타: Probablity
-            special_order_max_count = int(level_data.get('SpecialOrderMaxCount', 0))
-            
-            # 보트 전용 크레이트 시스템
-            min_crate_amount = int(level_data.get('MinCrateAmountInBoatOrder', 1))
-            max_crate_amount = int(level_data.get('MaxCrateAmountInBoatOrder', 1))
-            boat_coin_multiplier = int(level_data.get('BoatCrateCoinMultiplier', 100))
-            boat_exp_multiplier = int(level_data.get('BoatCrateEXPMultiplier', 100))
-            
-            # 실제 HayDay 스타일: 납품 타입별 아이템 수 조정
-            if delivery_type == DeliveryType.TRAIN:
-                # Train: 3-5개 (5칸 기차)
-                if player_level <= 20:
-                    base_min_items = 3
-                    base_max_items = 4
-                elif player_level <= 40:
-                    base_min_items = 3
-                    base_max_items = 5
-                else:
-                    base_min_items = 4
-                    base_max_items = 5
-            elif delivery_type == DeliveryType.BOAT:
-                # Boat 언락레벨 체크 (HayDay에서는 레벨 17에서 언락)
-                if player_level < 17:
-                    # 보트가 언락되지 않았으면 Truck으로 변경
-                    delivery_type = DeliveryType.TRUCK
-                    base_min_items = 1 if player_level <= 10 else 2
-                    base_max_items = 2 if player_level <= 10 else 3
-                else:
-                    # Boat: CSV 데이터 기반 (MinGoodTypesInBoatOrder / MaxGoodTypesInBoatOrder)
-                    base_min_items = int(level_data.get('MinGoodTypesInBoatOrder', 3))
-                    base_max_items = int(level_data.get('MaxGoodTypesInBoatOrder', 3))
-                    # 보트는 일반적으로 더 많은 아이템 요구
-                    if base_max_items < 4:
-                        base_max_items = min(6, base_min_items + 2)
-            else:  # Truck
-                # Truck: 레벨에 따라 1-6개까지 점진적 증가
-                if player_level <= 10:
-                    base_min_items = 1
-                    base_max_items = 2
-                elif player_level <= 20:
-                    base_min_items = 2
-                    base_max_items = 3
-                elif player_level <= 40:
-                    base_min_items = 2
-                    base_max_items = 4
-                elif player_level <= 60:
-                    base_min_items = 3
-                    base_max_items = 5
-                else:
-                    base_min_items = 3
-                    base_max_items = 6
-            
-            # 보트 전용 가치 범위 적용 (CSV 데이터 기반)
-            if delivery_type == DeliveryType.BOAT:
-                boat_min_value = int(level_data.get('MinBoatOrderValue', min_value))
-                boat_max_value = int(level_data.get('MaxBoatOrderValue', max_value))
-                min_value = boat_min_value
-                max_value = boat_max_value
-                
-            # 어려움 지수에 따른 난이도 조절 (실제 CSV 데이터 기반)
-            if struggle_score < 30:  # 낮은 어려움 = 쉬운 주문
-                num_items = base_min_items
-                target_value = min_value + int((max_value - min_value) * 0.1)  # 하위 10-30% 가치
-                difficulty = DifficultyType.EASY
-            elif struggle_score < 60:  # 중간 어려움
-                num_items = min(base_max_items, base_min_items + 1) 
-                target_value = min_value + int((max_value - min_value) * 0.5)  # 중간 가치
-                difficulty = DifficultyType.NORMAL
-            else:  # 높은 어려움 = 어려운 주문
-                num_items = base_max_items
-                target_value = min_value + int((max_value - min_value) * 0.8)  # 상위 80% 가치
-                difficulty = DifficultyType.HARD
-            
-            # 이용 가능한 아이템 풀 생성 (플레이어 레벨 기준)
-            available_items = self._get_available_items(player_level)
-            
-            # Items을 카테고리별로 분류
-            crops = []
-            animal_products = []
-            basic_goods = []
-            advanced_goods = []
-            
-            for item in available_items:
-                production_time = self._get_item_production_time(item)
-                value = self._get_item_value(item)
-                
-                if production_time <= 5:  # 5분 이하 - 기본 농작물
-                    crops.append(item)
-                elif production_time <= 60:  # 1시간 이하 - 동물/기본 제품
-                    if value < 50:
-                        animal_products.append(item)
-                    else:
-                        basic_goods.append(item)
-                else:  # 1시간 초과 - 고급 제품
-                    advanced_goods.append(item)
+            context = self._order_context(player_level, delivery_type, level_data, catalog)
+            delivery_type = context.delivery_type
+            num_items, difficulty = self._order_size(context, struggle_score)
+            available_items = context.available_items
             
             # 난이도와 어려움 지수에 따라 카테고리 비율 조정
             items = {}
             selected_items = []
-            
-            if struggle_score > 70:  # 높은 어려움 = 쉽게, 기본 아이템 위주
-                # 60% 기본, 30% 동물, 10% 고급
-                if crops:
-                    selected_items.extend(random.sample(crops, min(int(num_items * 0.6), len(crops))))
-                if animal_products:
-                    selected_items.extend(random.sample(animal_products, min(int(num_items * 0.3), len(animal_products))))
-                if basic_goods:
-                    selected_items.extend(random.sample(basic_goods, min(int(num_items * 0.1), len(basic_goods))))
-            elif struggle_score > 40:  # 중간 어려움 = 균형
-                # 25% 기본, 35% 동물, 25% 기본제품, 15% 고급
-                if crops:
-                    selected_items.extend(random.sample(crops, min(max(1, int(num_items * 0.25)), len(crops))))
-                if animal_products:
-                    selected_items.extend(random.sample(animal_products, min(max(1, int(num_items * 0.35)), len(animal_products))))
-                if basic_goods:
-                    selected_items.extend(random.sample(basic_goods, min(max(1, int(num_items * 0.25)), len(basic_goods))))
-                if advanced_goods:
-                    selected_items.extend(random.sample(advanced_goods, min(int(num_items * 0.15), len(advanced_goods))))
-            else:  # 낮은 어려움 = 어려운 주문, 고급 아이템 위주
-                # 10% 기본, 20% 동물, 30% 기본제품, 40% 고급
-                if advanced_goods:
-                    selected_items.extend(random.sample(advanced_goods, min(max(1, int(num_items * 0.4)), len(advanced_goods))))
-                if basic_goods:
-                    selected_items.extend(random.sample(basic_goods, min(max(1, int(num_items * 0.3)), len(basic_goods))))
-                if animal_products:
-                    selected_items.extend(random.sample(animal_products, min(max(1, int(num_items * 0.2)), len(animal_products))))
-                if crops:
-                    selected_items.extend(random.sample(crops, min(int(num_items * 0.1), len(crops))))
+            for category, count in self._order_category_quotas(struggle_score, num_items):
+                pool = context.pool_items[category]
+                if pool:
+                    selected_items.extend(self.rng.sample(pool, min(count, len(pool))))
             
             # 만약 선택된 아이템이 부족하면 랜덤 추가
+            # (set 반복 순서는 PYTHONHASHSEED에 따라 달라지므로 목록 순서를 유지하며 거른다)
             if len(selected_items) < num_items:
-                remaining = list(set(available_items) - set(selected_items))
+                selected_set = set(selected_items)
+                remaining = [item for item in available_items if item not in selected_set]
                 if remaining:
-                    selected_items.extend(random.sample(remaining, min(num_items - len(selected_items), len(remaining))))
+                    selected_items.extend(self.rng.sample(remaining, min(num_items - len(selected_items), len(remaining))))
             
-            # Remove duplicates 및 최종 아이템 수 조정
-            selected_items = list(set(selected_items))[:num_items]
+            # Remove duplicates 및 최종 아이템 수 조정 (선택 순서 유지)
+            selected_items = list(dict.fromkeys(selected_items))[:num_items]
             
             for item in selected_items:
                 # HayDay 스타일 수량: 아이템 가치에 따라 적절한 수량 계산
-                item_value = self._get_item_value(item)
+                item_value = context.item_values[item]
                 
-                if item_value <= 10:  # 저가 아이템 (밀, 옥수수 등)
-                    amount = random.randint(3, 12)
-                elif item_value <= 50:  # 중가 아이템 (빵, 버터 등)  
-                    amount = random.randint(2, 8)
-                elif item_value <= 100:  # 고가 아이템 (케이크, 의류 등)
-                    amount = random.randint(1, 5)
-                else:  # 최고가 아이템 (보석, 고급 제품 등)
-                    amount = random.randint(1, 3)
+                amount = self.rng.randint(*self._order_amount_range(item_value))
                 
                 # 난이도에 따른 수량 조정
                 if difficulty == DifficultyType.EASY:
@@ -565,8 +658,8 @@ class HayDaySimulator:
             production_times = []
             
             for item_name, item_qty in items.items():
-                item_value = self._get_item_value(item_name)
-                item_time = self._get_item_production_time(item_name)
+                item_value = context.item_values[item_name]
+                item_time = context.item_times[item_name]
                 actual_value += item_value * item_qty
                 # 각 아이템의 총 생산 시간
                 item_total_time = item_time * item_qty
@@ -577,7 +670,7 @@ class HayDaySimulator:
             avg_time = sum(production_times) / len(production_times) if production_times else 0
             
             return DeliveryOrder(
-                order_id=f"{delivery_type.value}_{np.random.randint(1000, 9999)}",
+                order_id=f"{delivery_type.value}_{self.rng.np.integers(1000, 9999)}",
                 delivery_type=delivery_type,
                 items=items,
                 total_value=actual_value,
@@ -590,8 +683,270 @@ class HayDaySimulator:
             
         except Exception as e:
             print(f"Warning: Dynamic order generation error: {e}")
-            return self._generate_basic_order(player_level, delivery_type, struggle_score)
+            return self._generate_basic_order(player_level, delivery_type, struggle_score, catalog)
+    
+    
+    # 모든 납품 타입이 읽는 exp_levels 컬럼 / 보트 주문(레벨 17 이상)에서만 읽는 컬럼
+    ORDER_LEVEL_COLUMNS = (
+        'MinGoodsInOrderDelivery', 'MaxGoodsInOrderDelivery', 'OrderMinValue', 'OrderMaxValue', 'MaxOrderCount',
+        'TruckCoinMultiplier', 'TruckEXPMultiplier', 'OrderCancelTimeMin', 'SpecialOrderProbablity',
+        'SpecialOrderMaxCount'
+    )
+    BOAT_LEVEL_COLUMNS = (
+        'MinCrateAmountInBoatOrder', 'MaxCrateAmountInBoatOrder', 'BoatCrateCoinMultiplier', 'BoatCrateEXPMultiplier',
+        'MinGoodTypesInBoatOrder', 'MaxGoodTypesInBoatOrder', 'MinBoatOrderValue', 'MaxBoatOrderValue'
+    )
+    
+    def _build_order_context(self, player_level: int, delivery_type: DeliveryType,
+                             level_data: Dict[str, Optional[int]],
+                             catalog: Optional[CatalogState] = None) -> 'OrderContext':
+        """(레벨, 납품 타입) 동적 주문 준비 데이터 생성 - 이 납품 타입이 읽는 레벨 값이 비어 있으면 ValueError"""
+        boat_order = delivery_type == DeliveryType.BOAT and player_level >= 17
+        columns = self.ORDER_LEVEL_COLUMNS + (self.BOAT_LEVEL_COLUMNS if boat_order else ())
+        missing = [column for column in columns if level_data.get(column) is None]
+        if missing:
+            raise ValueError(f"level {player_level} has no value for {', '.join(missing)}")
+        
+        # 레벨 데이터에서 주문 매개변수 추출 (실제 HayDay CSV 데이터 완전 활용)
+        min_goods = level_data['MinGoodsInOrderDelivery']
+        max_goods = level_data['MaxGoodsInOrderDelivery']
+        min_value = level_data['OrderMinValue']
+        max_value = level_data['OrderMaxValue']
+        max_order_count = level_data['MaxOrderCount']
+        truck_coin_multiplier = level_data['TruckCoinMultiplier']
+        truck_exp_multiplier = level_data['TruckEXPMultiplier']
+        order_cancel_time = level_data['OrderCancelTimeMin']
+        
+        # 특별 주문 시스템 (CSV 데이터 기반)
+        special_order_probability = level_data['SpecialOrderProbablity']  # 오타: Probablity
+        special_order_max_count = level_data['SpecialOrderMaxCount']
+        
+        # 실제 HayDay 스타일: 납품 타입별 아이템 수 조정
+        if delivery_type == DeliveryType.TRAIN:
+            # Train: 3-5개 (5칸 기차)
+            if player_level <= 20:
+                base_min_items = 3
+                base_max_items = 4
+            elif player_level <= 40:
+                base_min_items = 3
+                base_max_items = 5
+            else:
+                base_min_items = 4
+                base_max_items = 5
+        elif delivery_type == DeliveryType.BOAT:
+            # Boat 언락레벨 체크 (HayDay에서는 레벨 17에서 언락)
+            if player_level < 17:
+                # 보트가 언락되지 않았으면 Truck으로 변경
+                delivery_type = DeliveryType.TRUCK
+                base_min_items = 1 if player_level <= 10 else 2
+                base_max_items = 2 if player_level <= 10 else 3
+            else:
+                # 보트 전용 크레이트 시스템
+                min_crate_amount = level_data['MinCrateAmountInBoatOrder']
+                max_crate_amount = level_data['MaxCrateAmountInBoatOrder']
+                boat_coin_multiplier = level_data['BoatCrateCoinMultiplier']
+                boat_exp_multiplier = level_data['BoatCrateEXPMultiplier']
+                
+                # Boat: CSV 데이터 기반 (MinGoodTypesInBoatOrder / MaxGoodTypesInBoatOrder)
+                base_min_items = level_data['MinGoodTypesInBoatOrder']
+                base_max_items = level_data['MaxGoodTypesInBoatOrder']
+                # 보트는 일반적으로 더 많은 아이템 요구
+                if base_max_items < 4:
+                    base_max_items = min(6, base_min_items + 2)
+        else:  # Truck
+            # Truck: 레벨에 따라 1-6개까지 점진적 증가
+            if player_level <= 10:
+                base_min_items = 1
+                base_max_items = 2
+            elif player_level <= 20:
+                base_min_items = 2
+                base_max_items = 3
+            elif player_level <= 40:
+                base_min_items = 2
+                base_max_items = 4
+            elif player_level <= 60:
+                base_min_items = 3
+                base_max_items = 5
+            else:
+                base_min_items = 3
+                base_max_items = 6
+        
+        # 보트 전용 가치 범위 적용 (CSV 데이터 기반)
+        if delivery_type == DeliveryType.BOAT:
+            boat_min_value = level_data['MinBoatOrderValue']
+            boat_max_value = level_data['MaxBoatOrderValue']
+            min_value = boat_min_value
+            max_value = boat_max_value
+            
+        # 이용 가능한 아이템 풀 (플레이어 레벨 기준, 카테고리별 분류)
+        available_items, values, times, pools = self._order_item_pool(player_level, catalog)
+        return OrderContext(
+            delivery_type=delivery_type,
+            min_items=base_min_items,
+            max_items=base_max_items,
+            min_value=min_value,
+            max_value=max_value,
+            available_items=available_items,
+            values=values,
+            times=times,
+            pools=pools,
+            pool_items={category: [available_items[index] for index in indices]
+                        for category, indices in pools.items()},
+            item_values=dict(zip(available_items, values.tolist())),
+            item_times=dict(zip(available_items, times.tolist()))
+        )
+    
+    def _order_size(self, context: 'OrderContext', struggle_score: float) -> Tuple[int, DifficultyType]:
+        """어려움 지수에 따른 (아이템 수, 난이도)"""
+        # 어려움 지수에 따른 난이도 조절 (실제 CSV 데이터 기반)
+        if struggle_score < 30:  # 낮은 어려움 = 쉬운 주문
+            return context.min_items, DifficultyType.EASY
+        elif struggle_score < 60:  # 중간 어려움
+            return min(context.max_items, context.min_items + 1), DifficultyType.NORMAL
+        else:  # 높은 어려움 = 어려운 주문
+            return context.max_items, DifficultyType.HARD
     
+    # (레벨, 납품 타입)별 주문 컨텍스트 LRU 크기
+    ORDER_CONTEXT_CACHE_SIZE = 256
+    
+    def _order_context(self, player_level: int, delivery_type: DeliveryType,
+                       level_data: Dict[str, Optional[int]],
+                       catalog: Optional[CatalogState] = None) -> 'OrderContext':
+        """(레벨, 납품 타입) 주문 컨텍스트 (LRU 캐시, 데이터 리로드 시 무효화)"""
+        catalog = catalog or self.catalog
+        key = (catalog.version, player_level, delivery_type)
+        with self._order_context_lock:
+            context = self._order_contexts.get(key)
+            if context is not None:
+                self._order_contexts.move_to_end(key)
+                return context
+        
+        context = self._build_order_context(player_level, delivery_type, level_data, catalog)
+        with self._order_context_lock:
+            self._order_contexts[key] = context
+            while len(self._order_contexts) > self.ORDER_CONTEXT_CACHE_SIZE:
+                self._order_contexts.popitem(last=False)
+        return context
+    
+    # 어려움 지수 구간별 카테고리 구성: (구간 하한(초과), [(카테고리, 비율, 최소 개수)]) - 위에서부터 매칭
+    ORDER_CATEGORY_MIX = [
+        # 높은 어려움 = 쉽게, 기본 아이템 위주 (60% 기본, 30% 동물, 10% 기본제품)
+        (70, [('crops', 0.6, 0), ('animal_products', 0.3, 0), ('basic_goods', 0.1, 0)]),
+        # 중간 어려움 = 균형 (25% 기본, 35% 동물, 25% 기본제품, 15% 고급)
+        (40, [('crops', 0.25, 1), ('animal_products', 0.35, 1), ('basic_goods', 0.25, 1), ('advanced_goods', 0.15, 0)]),
+        # 낮은 어려움 = 어려운 주문, 고급 아이템 위주 (10% 기본, 20% 동물, 30% 기본제품, 40% 고급)
+        (None, [('advanced_goods', 0.4, 1), ('basic_goods', 0.3, 1), ('animal_products', 0.2, 1), ('crops', 0.1, 0)]),
+    ]
+    
+    # 아이템 가치 상한 -> 주문 수량 범위 (HayDay 스타일, 가치가 높을수록 적게)
+    ORDER_AMOUNT_BANDS = [
+        (10, 3, 12),    # 저가 아이템 (밀, 옥수수 등)
+        (50, 2, 8),     # 중가 아이템 (빵, 버터 등)
+        (100, 1, 5),    # 고가 아이템 (케이크, 의류 등)
+        (None, 1, 3),   # 최고가 아이템 (보석, 고급 제품 등)
+    ]
+    
+    def _order_category_quotas(self, struggle_score: float, num_items: int) -> List[Tuple[str, int]]:
+        """어려움 지수에 따른 카테고리별 선택 개수 (풀 크기 제한 전)"""
+        for lower_bound, mix in self.ORDER_CATEGORY_MIX:
+            if lower_bound is None or struggle_score > lower_bound:
+                return [(category, max(minimum, int(num_items * ratio))) for category, ratio, minimum in mix]
+        return []
+    
+    def _order_amount_range(self, item_value: int) -> Tuple[int, int]:
+        """아이템 가치에 따른 주문 수량 범위 (양끝 포함)"""
+        for upper_bound, low, high in self.ORDER_AMOUNT_BANDS:
+            if upper_bound is None or item_value <= upper_bound:
+                return low, high
+        return 1, 1
+    
+    def _order_item_pool(self, player_level: int, catalog: Optional[CatalogState] = None
+                         ) -> Tuple[List[str], np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """주문 아이템 풀: (아이템 목록, 가치 배열, 생산시간 배열, 카테고리 -> 아이템 인덱스 배열)"""
+        catalog = catalog or self.catalog
+        available_items = self._get_available_items(player_level, catalog)
+        values = np.array([self._get_item_value(item, catalog) for item in available_items], dtype=np.int64)
+        times = np.array([self._get_item_production_time(item, catalog) for item in available_items], dtype=np.int64)
+        
+        short = times <= 5                  # 5분 이하 - 기본 농작물
+        medium = ~short & (times <= 60)     # 1시간 이하 - 동물/기본 제품
+        pools = {
+            'crops': np.flatnonzero(short),
+            'animal_products': np.flatnonzero(medium & (values < 50)),
+            'basic_goods': np.flatnonzero(medium & (values >= 50)),
+            'advanced_goods': np.flatnonzero(times > 60),  # 1시간 초과 - 고급 제품
+        }
+        return available_items, values, times, pools
+    
+    def generate_delivery_orders(self, n: int, player_level: int, struggle_score: float,
+                                 delivery_type: DeliveryType = DeliveryType.TRUCK,
+                                 rng: Optional[np.random.Generator] = None) -> 'DeliveryOrderBatch':
+        """
+        같은 조건의 주문 n개를 한 번에 생성 (밸런싱 검토용 대량 샘플)
+        
+        동적 주문과 사전 정의 주문을 배열 연산으로 처리한다. 아이템 수, 카테고리 구성, 수량 구간은
+        generate_delivery_order와 같고 난수열만 다르다. 기본 주문으로 빠지는 레벨은 단건 생성을
+        n번 반복해 같은 배치 형식으로 반환. rng를 주지 않으면 self.rng.np 사용.
+        """
+        rng = self.rng.np if rng is None else rng
+        catalog = self.catalog
+        level_data = self._get_level_data(player_level, catalog)
+        if level_data is None:
+            orders = [self._generate_basic_order(player_level, delivery_type, struggle_score, catalog)
+                      for _ in range(n)]
+            return DeliveryOrderBatch.from_orders(orders, delivery_type, struggle_score, player_level)
+        if player_level <= 10 and catalog.predefined_templates:
+            return self._predefined_order_batch(n, player_level, rng, catalog)
+        
+        try:
+            context = self._order_context(player_level, delivery_type, level_data, catalog)
+        except Exception as e:
+            print(f"Warning: Dynamic order generation error: {e}")
+            orders = [self._generate_basic_order(player_level, delivery_type, struggle_score, catalog)
+                      for _ in range(n)]
+            return DeliveryOrderBatch.from_orders(orders, delivery_type, struggle_score, player_level)
+        
+        delivery_type = context.delivery_type
+        num_items, difficulty = self._order_size(context, struggle_score)
+        available_items, values, times, pools = context.available_items, context.values, context.times, context.pools
+        
+        # 카테고리별 비복원 추출 -> 부족분은 나머지 아이템에서 채움 -> 아이템 수 초과분은 무작위로 제외
+        selected = np.empty((n, 0), dtype=np.int64)
+        for category, count in self._order_category_quotas(struggle_score, num_items):
+            pool = pools[category]
+            picks = _sample_distinct(rng, n, len(pool), min(count, len(pool)))
+            selected = np.concatenate([selected, pool[picks]], axis=1)
+        shortage = min(num_items - selected.shape[1], len(available_items) - selected.shape[1])
+        if shortage > 0:
+            fill = _sample_distinct(rng, n, len(available_items), shortage, taken=selected)
+            selected = np.concatenate([selected, fill], axis=1)
+        if selected.shape[1] > num_items:
+            keep = np.argsort(rng.random(selected.shape), axis=1)[:, :num_items]
+            selected = np.take_along_axis(selected, keep, axis=1)
+        
+        # 가치 구간별 수량 -> 난이도에 따른 수량 조정
+        *bands, (_, last_low, last_high) = self.ORDER_AMOUNT_BANDS
+        conditions = [values <= upper for upper, _, _ in bands]
+        low = np.select(conditions, [band_low for _, band_low, _ in bands], default=last_low)[selected]
+        high = np.select(conditions, [band_high for _, _, band_high in bands], default=last_high)[selected]
+        amounts = rng.integers(low, high + 1)
+        if difficulty == DifficultyType.EASY:
+            amounts = (amounts * 0.7).astype(np.int64)
+        elif difficulty == DifficultyType.HARD:
+            amounts = (amounts * 1.3).astype(np.int64)
+        amounts = np.maximum(amounts, 1)
+        
+        return DeliveryOrderBatch(
+            delivery_type=delivery_type,
+            difficulty=difficulty,
+            struggle_score=struggle_score,
+            level_requirement=player_level,
+            item_names=available_items,
+            item_ids=selected,
+            quantities=amounts,
+            total_value=(values[selected] * amounts).sum(axis=1),
+            total_production_time=(times[selected] * amounts).sum(axis=1)
+        )
     
     def _generate_order_items(self, pattern: pd.Series, player_level: int) -> Dict[str, int]:
         """패턴에 따른 주문 아이템 생성"""
@@ -614,174 +969,141 @@ class HayDaySimulator:
             
             for i, (min_amt, max_amt) in enumerate(zip(min_amounts, max_amounts)):
                 if i < len(available_items):
-                    items[available_items[i]] = int(np.random.uniform(min_amt, max_amt))
+                    items[available_items[i]] = int(self.rng.np.uniform(min_amt, max_amt))
         
         return items
     
-    def _get_available_items(self, player_level: int) -> List[str]:
-        """Player 레벨에 따른 사용 가능한 아이템 목록 (실제 HayDay 언락레벨 적용)"""
-        available = []
-        
-        # Exclude할 아이템 패턴 (이벤트, 더미, 테스트 아이템)
-        exclude_patterns = [
-            'CountyFair',  # 박람회 이벤트 아이템
-            'Dummy',       # 더미 아이템
-            'Placeholder', # 플레이스홀더
-            'Test',        # 테스트 아이템
-            'Ticket',      # 티켓류
-            'Ribbon',      # 리본류
-            'Bonus',       # 보너스 아이템
-            'Easter',      # 이스터 이벤트
-            'Christmas',   # 크리스마스 이벤트
-            'Halloween',   # 할로윈 이벤트
-            'Valentine',   # 발렌타인 이벤트
-            'Birthday',    # 생일 이벤트
-            'Anniversary', # 기념일 이벤트
-            '_egg',        # 이스터 에그 아이템
-            'Event',       # 모든 이벤트 아이템
-            'Special',     # 스페셜 이벤트
-            'Limited',     # 한정판 아이템
-            'Seasonal'     # 시즌 아이템
-        ]
-        
-        # 모든 로드된 데이터에서 아이템 추출
-        for key, df in self.data.items():
-            if df.empty:
+    # 주문/아이템 목록에서 제외할 아이템 패턴 (이벤트, 더미, 테스트 아이템)
+    EXCLUDED_ITEM_PATTERNS = [
+        'CountyFair',  # 박람회 이벤트 아이템
+        'Dummy',       # 더미 아이템
+        'Placeholder', # 플레이스홀더
+        'Test',        # 테스트 아이템
+        'Ticket',      # 티켓류
+        'Ribbon',      # 리본류
+        'Bonus',       # 보너스 아이템
+        'Easter',      # 이스터 이벤트
+        'Christmas',   # 크리스마스 이벤트
+        'Halloween',   # 할로윈 이벤트
+        'Valentine',   # 발렌타인 이벤트
+        'Birthday',    # 생일 이벤트
+        'Anniversary', # 기념일 이벤트
+        '_egg',        # 이스터 에그 아이템
+        'Event',       # 모든 이벤트 아이템
+        'Special',     # 스페셜 이벤트
+        'Limited',     # 한정판 아이템
+        'Seasonal'     # 시즌 아이템
+    ]
+    
+    # 아예 건너뛰는 이벤트 관련 데이터 카테고리
+    EXCLUDED_CATEGORY_MARKERS = ['countyfair', 'dummy', 'seasonal', 'event', 'easter', 'christmas', 'halloween']
+    
+    def _get_available_items(self, player_level: int, catalog: Optional[CatalogState] = None) -> List[str]:
+        """Player 레벨에 따른 사용 가능한 아이템 목록 (실제 HayDay 언락레벨 적용, 언락레벨 순)"""
+        catalog = catalog or self.catalog
+        cached = catalog.available_items.get(player_level)
+        if cached is None:
+            levels, names = self._get_availability_index(catalog)
+            cached = names[:bisect.bisect_right(levels, player_level)]
+            catalog.available_items[player_level] = cached
+        return list(cached)  # 호출 측에서 수정해도 캐시는 유지
+    
+    LEVEL_ITEM_TABLE_CACHE_SIZE = 128
+    
+    def level_items_table(self, player_level: int) -> pd.DataFrame:
+        """
+        레벨별 사용 가능 아이템 표 (Name, UnlockLevel, Price, TimeMin - 언락레벨 순)
+        
+        (버전, 레벨) LRU 캐시라 여러 호출자가 같은 DataFrame을 공유한다. 수정하지 말 것.
+        """
+        catalog = self.catalog
+        key = (catalog.version, player_level)
+        with self._level_item_tables_lock:
+            table = self._level_item_tables.get(key)
+            if table is not None:
+                self._level_item_tables.move_to_end(key)
+                return table
+        
+        items = self._get_available_items(player_level, catalog)
+        table = pd.DataFrame({
+            'Name': items,
+            'UnlockLevel': [self._get_item_unlock_level(item, catalog) for item in items],
+            'Price': [self._get_item_value(item, catalog) for item in items],
+            'TimeMin': [self._get_item_production_time(item, catalog) for item in items]
+        })
+        with self._level_item_tables_lock:
+            self._level_item_tables[key] = table
+            while len(self._level_item_tables) > self.LEVEL_ITEM_TABLE_CACHE_SIZE:
+                self._level_item_tables.popitem(last=False)
+        return table
+    
+    def _get_availability_index(self, catalog: Optional[CatalogState] = None) -> Tuple[List[int], List[str]]:
+        """
+        (언락레벨 목록, 아이템 목록) - 실효 언락레벨 오름차순
+        
+        실효 언락레벨은 아이템이 나오는 행들 중 가장 낮은 요구 레벨
+        (생산품은 건물 언락레벨과 제품 언락레벨 중 높은 값). 같은 레벨은 데이터 순서 유지.
+        """
+        catalog = catalog or self.catalog
+        index = catalog.derived.get('availability_index')
+        if index is not None:
+            return index
+        
+        effective_levels = {}
+        for key in catalog.data.keys():
+            # 이벤트 관련 데이터는 아예 건너뛰기 (로드 전에 키로 판단)
+            if any(event in key.lower() for event in self.EXCLUDED_CATEGORY_MARKERS):
                 continue
             
-            # 이벤트 관련 데이터는 아예 건너뛰기
-            if any(event in key.lower() for event in ['countyfair', 'dummy', 'seasonal', 'event', 'easter', 'christmas', 'halloween']):
+            df = catalog.data[key]
+            if df.empty:
                 continue
-                
-            # 농작물 및 과일 (fields, fruits, fruit_trees)
-            if key in ['fields', 'fruits', 'fruit_trees']:
-                for _, item in df.iterrows():
-                    if (pd.notna(item.get('Name')) and 
-                        pd.notna(item.get('UnlockLevel')) and
-                        int(item.get('UnlockLevel', 999)) <= player_level):
-                        item_name = str(item.get('Name'))
-                        # Exclude 패턴 체크
-                        if not any(pattern in item_name for pattern in exclude_patterns):
-                            if item_name not in available:
-                                available.append(item_name)
             
-            # Animal products (animals)
+            # 농작물 및 과일 / Animal products / 모든 _goods로 끝나는 생산 건물 데이터
+            if key in ['fields', 'fruits', 'fruit_trees']:
+                name_column = 'Name'
             elif key == 'animals':
-                for _, animal in df.iterrows():
-                    if (pd.notna(animal.get('Good')) and 
-                        pd.notna(animal.get('UnlockLevel')) and
-                        int(animal.get('UnlockLevel', 999)) <= player_level):
-                        item_name = str(animal.get('Good'))
-                        # Exclude 패턴 체크
-                        if not any(pattern in item_name for pattern in exclude_patterns):
-                            if item_name not in available:
-                                available.append(item_name)
-            
-            # 모든 _goods로 끝나는 생산 건물 데이터
+                name_column = 'Good'
             elif key.endswith('_goods'):
-                for _, product in df.iterrows():
-                    if pd.notna(product.get('Name')):
-                        item_name = str(product.get('Name'))
-                        
-                        # 건물 언락레벨 체크 (processing_buildings.csv 사용)
-                        building_name = key.replace('_goods', '')
-                        building_unlock_level = self._get_building_unlock_level(building_name)
-                        
-                        # 제품 자체의 언락레벨도 체크
-                        item_unlock_level = int(product.get('UnlockLevel', building_unlock_level))
-                        
-                        # 더 높은 언락레벨 사용 (건물 or 제품)
-                        required_level = max(building_unlock_level, item_unlock_level)
-                        
-                        if required_level <= player_level:
-                            # Exclude 패턴 체크
-                            if not any(pattern in item_name for pattern in exclude_patterns):
-                                if item_name not in available:
-                                    available.append(item_name)
-        
-        # Remove duplicates 및 레벨 순으로 정렬
-        available = list(set(available))
-        
-        # Sort by unlock level (낮은 레벨부터)
-        def get_unlock_level(item_name):
-            # 모든 로드된 데이터에서 언락레벨 찾기
-            for key, df in self.data.items():
-                if df.empty:
-                    continue
-                    
-                # 농작물/과일
-                if key in ['fields', 'fruits', 'fruit_trees']:
-                    if 'Name' in df.columns:
-                        matching = df[df['Name'] == item_name]
-                        if not matching.empty:
-                            return int(matching.iloc[0].get('UnlockLevel', 999))
-                
-                # Animal products
-                elif key == 'animals':
-                    matching = df[df['Good'] == item_name]
-                    if not matching.empty:
-                        return int(matching.iloc[0].get('UnlockLevel', 999))
-                
-                # Production buildings 제품
-                elif key.endswith('_goods'):
-                    if 'Name' in df.columns:
-                        matching = df[df['Name'] == item_name]
-                        if not matching.empty:
-                            return int(matching.iloc[0].get('UnlockLevel', 999))
+                name_column = 'Name'
+            else:
+                continue
+            if name_column not in df.columns:
+                continue
             
-            return 1  # 기본값
-        
-        available.sort(key=get_unlock_level)
-        # 디버그 출력 제거 (렉 방지)
-        # print(f"Available items for level {player_level}: {len(available)} items")
-        # print(f"First 10 items: {available[:10]}")
-        return available  # 모든 사용 가능한 아이템 반환
+            if key.endswith('_goods'):
+                # 건물 언락레벨과 제품 언락레벨 중 더 높은 레벨 사용
+                building_unlock_level = self._get_building_unlock_level(key.replace('_goods', ''), catalog)
+                item_levels = df['UnlockLevel'] if 'UnlockLevel' in df.columns else [building_unlock_level] * len(df)
+                required_levels = [max(building_unlock_level, level) if pd.notna(level) else None
+                                   for level in item_levels]
+            elif 'UnlockLevel' in df.columns:
+                required_levels = [level if pd.notna(level) else None for level in df['UnlockLevel']]
+            else:
+                continue
+            
+            for name, level in zip(df[name_column], required_levels):
+                if pd.isna(name) or level is None:
+                    continue
+                item_name = str(name)
+                # Exclude 패턴 체크
+                if any(pattern in item_name for pattern in self.EXCLUDED_ITEM_PATTERNS):
+                    continue
+                level = int(level)
+                if item_name not in effective_levels or level < effective_levels[item_name]:
+                    effective_levels[item_name] = level
+        
+        # Sort by unlock level (낮은 레벨부터, 안정 정렬)
+        ordered = sorted(effective_levels.items(), key=lambda entry: entry[1])
+        index = catalog.derived['availability_index'] = ([level for _, level in ordered],
+                                                          [name for name, _ in ordered])
+        return index
     
-    def _get_item_value(self, item_name: str) -> int:
+    def _get_item_value(self, item_name: str, catalog: Optional[CatalogState] = None) -> int:
         """Item 가치 조회 (실제 HayDay 가격 데이터 사용)"""
-        try:
-            # 모든 로드된 데이터에서 가격 찾기
-            for key, df in self.data.items():
-                if df.empty:
-                    continue
-                    
-                # 농작물/과일
-                if key in ['fields', 'fruits', 'fruit_trees']:
-                    matching = df[df['Name'] == item_name]
-                    if not matching.empty:
-                        item = matching.iloc[0]
-                        for price_col in ['OrderPrice', 'OrderValue', 'BoatOrderValue', 'Price', 'Value']:
-                            if pd.notna(item.get(price_col)):
-                                try:
-                                    price = int(float(item.get(price_col)))
-                                    if price > 0:
-                                        return price
-                                except (ValueError, TypeError):
-                                    continue
-                
-                # Animal products
-                elif key == 'animals':
-                    matching = df[df['Good'] == item_name]
-                    if not matching.empty:
-                        animal = matching.iloc[0]
-                        return int(animal.get('ProcessValue', animal.get('Value', 10)))
-                
-                # Production buildings 제품
-                elif key.endswith('_goods'):
-                    matching = df[df['Name'] == item_name]
-                    if not matching.empty:
-                        product = matching.iloc[0]
-                        for price_col in ['OrderPrice', 'OrderValue', 'BoatOrderValue', 'Price', 'Value']:
-                            if pd.notna(product.get(price_col)):
-                                try:
-                                    price = int(float(product.get(price_col)))
-                                    if price > 0:
-                                        return price
-                                except (ValueError, TypeError):
-                                    continue
-        
-        except Exception as e:
-            pass  # Silent error handling
+        price = (catalog or self.catalog).item_catalog.value(item_name)
+        if price is not None:
+            return price
         
         # 기본 가격 (HayDay 실제 데이터 기반)
         default_prices = {
@@ -792,37 +1114,11 @@ class HayDaySimulator:
         
         return default_prices.get(item_name, 20)  # 기본값 20 코인
     
-    def _get_item_production_time(self, item_name: str) -> int:
+    def _get_item_production_time(self, item_name: str, catalog: Optional[CatalogState] = None) -> int:
         """Item 생산시간 조회 (실제 HayDay TimeMin 데이터)"""
-        try:
-            # 모든 로드된 데이터에서 생산시간 찾기
-            for key, df in self.data.items():
-                if df.empty:
-                    continue
-                    
-                # 농작물/과일
-                if key in ['fields', 'fruits', 'fruit_trees']:
-                    matching = df[df['Name'] == item_name]
-                    if not matching.empty:
-                        item = matching.iloc[0]
-                        if pd.notna(item.get('TimeMin')):
-                            try:
-                                return int(item.get('TimeMin'))
-                            except (ValueError, TypeError):
-                                pass
-                
-                # Production buildings 제품
-                elif key.endswith('_goods'):
-                    matching = df[df['Name'] == item_name]
-                    if not matching.empty:
-                        item = matching.iloc[0]
-                        if pd.notna(item.get('TimeMin')):
-                            try:
-                                return int(item.get('TimeMin'))
-                            except (ValueError, TypeError):
-                                pass
-        except Exception as e:
-            pass  # Silent error handling
+        production_time = (catalog or self.catalog).item_catalog.production_time(item_name)
+        if production_time is not None:
+            return production_time
         
         # 기본 생산시간 (분 단위)
         default_times = {
@@ -832,28 +1128,13 @@ class HayDaySimulator:
         
         return default_times.get(item_name, 15)  # 기본값 15분
     
-    def _get_building_unlock_level(self, building_name: str) -> int:
+    def _get_building_unlock_level(self, building_name: str, catalog: Optional[CatalogState] = None) -> int:
         """건물 언락레벨 조회 (processing_buildings.csv)"""
-        try:
-            if hasattr(self, 'processing_buildings') and not self.processing_buildings.empty:
-                # 건물명 매칭 (대소문자 무시)
-                matching_buildings = self.processing_buildings[
-                    self.processing_buildings['Name'].str.lower() == building_name.lower()
-                ]
-                if not matching_buildings.empty:
-                    unlock_level = matching_buildings.iloc[0].get('UnlockLevel')
-                    if pd.notna(unlock_level):
-                        try:
-                            return int(unlock_level)
-                        except (ValueError, TypeError):
-                            pass
-            return 0
-        except Exception:
-            return 0
+        return (catalog or self.catalog).building_catalog.unlock_level(building_name)
     
     def get_all_items_data(self) -> Dict[str, Dict]:
-        """모든 아이템의 상세 정보를 반환 (SungDae 시뮬레이터용)"""
-        items_data = {}
+        """모든 아이템의 상세 정보를 반환 (SungDae 시뮬레이터용, 컬럼 단위 계산)"""
+        frames = []
         
         # 모든 데이터에서 아이템 정보 추출
         for key, df in self.data.items():
@@ -866,168 +1147,74 @@ class HayDaySimulator:
             
             # 농작물 (fields)
             if key == 'fields':
-                for _, item in df.iterrows():
-                    if pd.notna(item.get('Name')):
-                        name = str(item.get('Name'))
-                        # 안전한 숫자 변환
-                        sell_price = item.get('SellPrice', 1)
-                        grow_time = item.get('GrowTime', 10)
-                        unlock_level = item.get('UnlockLevel', 1)
-                        
-                        try:
-                            sell_price = int(float(sell_price)) if pd.notna(sell_price) else 1
-                        except (ValueError, TypeError):
-                            sell_price = 1
-                            
-                        try:
-                            grow_time = int(float(grow_time)) if pd.notna(grow_time) else 10
-                        except (ValueError, TypeError):
-                            grow_time = 10
-                            
-                        try:
-                            unlock_level = int(float(unlock_level)) if pd.notna(unlock_level) else 1
-                        except (ValueError, TypeError):
-                            unlock_level = 1
-                        
-                        items_data[name] = {
-                            'base_price': sell_price,
-                            'production_time': grow_time,
-                            'layer': 'CROPS',
-                            'unlock_level': unlock_level,
-                            'category': 'crops'
-                        }
-            
+                frame = self._items_frame(df, 'Name', ('SellPrice', 1), ('GrowTime', 10),
+                                          zero_is_missing=False, layer='CROPS', category='crops')
             # 과일 (fruits, fruit_trees)
             elif key in ['fruits', 'fruit_trees']:
-                for _, item in df.iterrows():
-                    if pd.notna(item.get('Name')):
-                        name = str(item.get('Name'))
-                        # 안전한 숫자 변환
-                        sell_price = item.get('SellPrice', 2)
-                        grow_time = item.get('GrowTime', 20)
-                        unlock_level = item.get('UnlockLevel', 1)
-                        
-                        try:
-                            sell_price = int(float(sell_price)) if pd.notna(sell_price) else 2
-                        except (ValueError, TypeError):
-                            sell_price = 2
-                            
-                        try:
-                            grow_time = int(float(grow_time)) if pd.notna(grow_time) else 20
-                        except (ValueError, TypeError):
-                            grow_time = 20
-                            
-                        try:
-                            unlock_level = int(float(unlock_level)) if pd.notna(unlock_level) else 1
-                        except (ValueError, TypeError):
-                            unlock_level = 1
-                        
-                        items_data[name] = {
-                            'base_price': sell_price,
-                            'production_time': grow_time,
-                            'layer': 'CROPS',
-                            'unlock_level': unlock_level,
-                            'category': 'fruits'
-                        }
-            
+                frame = self._items_frame(df, 'Name', ('SellPrice', 2), ('GrowTime', 20),
+                                          zero_is_missing=False, layer='CROPS', category='fruits')
             # 동물 제품 (animals)
             elif key == 'animals':
-                for _, animal in df.iterrows():
-                    if pd.notna(animal.get('Good')):
-                        name = str(animal.get('Good'))
-                        items_data[name] = {
-                            'base_price': int(pd.to_numeric(animal.get('SellPrice', 5), errors='coerce') or 5),
-                            'production_time': int(pd.to_numeric(animal.get('ProductionTime', 30), errors='coerce') or 30),
-                            'layer': 'CROPS',
-                            'unlock_level': int(pd.to_numeric(animal.get('UnlockLevel', 1), errors='coerce') or 1),
-                            'category': 'animal_products'
-                        }
-            
-            # 생산 건물 제품들 (가공품 = MID layer)
+                frame = self._items_frame(df, 'Good', ('SellPrice', 5), ('ProductionTime', 30),
+                                          zero_is_missing=True, layer='CROPS', category='animal_products')
+            # 생산 건물 제품들 (Good 컬럼이 있는 경우, 가격과 생산시간으로 레이어 분류)
             else:
-                for _, item in df.iterrows():
-                    # Good 컬럼이 있는 경우
-                    if pd.notna(item.get('Good')):
-                        name = str(item.get('Good'))
-                        production_time = int(pd.to_numeric(item.get('ProductionTime', 60), errors='coerce') or 60)
-                        sell_price = int(pd.to_numeric(item.get('SellPrice', 10), errors='coerce') or 10)
-                        
-                        # 가격과 생산시간으로 레이어 분류
-                        if sell_price >= 100 or production_time >= 240:  # 고급품
-                            layer = 'TOP'
-                        elif sell_price >= 20 or production_time >= 30:  # 중급품
-                            layer = 'MID'
-                        else:  # 기본품
-                            layer = 'CROPS'
-                        
-                        items_data[name] = {
-                            'base_price': sell_price,
-                            'production_time': production_time,
-                            'layer': layer,
-                            'unlock_level': int(pd.to_numeric(item.get('UnlockLevel', 1), errors='coerce') or 1),
-                            'category': key
-                        }
-        
-        return items_data
-    
-    def _get_item_unlock_level(self, item_name: str) -> int:
-        """Item 언락레벨 조회 (CSV 데이터 기반)"""
-        try:
-            # 농작물 언락레벨 (fields.csv)
-            if 'fields' in self.data and not self.data['fields'].empty:
-                matching_crops = self.data['fields'][self.data['fields']['Name'] == item_name]
-                if not matching_crops.empty:
-                    unlock_level = matching_crops.iloc[0].get('UnlockLevel')
-                    if pd.notna(unlock_level):
-                        try:
-                            return int(unlock_level)
-                        except (ValueError, TypeError):
-                            pass
-            
-            # 제품 언락레벨 (production buildings CSV에서 찾기)
-            for key, df in self.data.items():
-                if df.empty or not key.endswith('_goods'):
-                    continue
-                    
-                matching_items = df[df['Name'] == item_name]
-                if not matching_items.empty:
-                    # building 이름으로 processing_buildings.csv에서 언락레벨 찾기
-                    building_name = key.replace('_goods', '')
-                    unlock_level = self._get_building_unlock_level(building_name)
-                    if unlock_level > 0:
-                        return unlock_level
+                frame = self._items_frame(df, 'Good', ('SellPrice', 10), ('ProductionTime', 60),
+                                          zero_is_missing=True, layer=None, category=key)
             
-            # 동물 제품 언락레벨  
-            if 'animals' in self.data and not self.data['animals'].empty:
-                matching_animals = self.data['animals'][self.data['animals']['Good'] == item_name]
-                if not matching_animals.empty:
-                    unlock_level = matching_animals.iloc[0].get('UnlockLevel')
-                    if pd.notna(unlock_level):
-                        try:
-                            return int(unlock_level)
-                        except (ValueError, TypeError):
-                            pass
-                        item = matching_items.iloc[0]
-                        if pd.notna(item.get('UnlockLevel')):
-                            try:
-                                return int(item.get('UnlockLevel'))
-                            except (ValueError, TypeError):
-                                pass
-                                
-            # Animal products도 확인
-            if 'animals' in self.data and not self.data['animals'].empty:
-                matching_animals = self.data['animals'][self.data['animals']['Good'] == item_name]
-                if not matching_animals.empty:
-                    animal = matching_animals.iloc[0]
-                    if pd.notna(animal.get('UnlockLevel')):
-                        try:
-                            return int(animal.get('UnlockLevel'))
-                        except (ValueError, TypeError):
-                            pass
-        except Exception as e:
-            print(f"WARNING 언락레벨 조회 오류: {e}")
+            if frame is not None:
+                frames.append(frame)
+        
+        if not frames:
+            return {}
+        
+        # 같은 이름은 처음 나온 위치에 나중 값으로 덮어씀 (dict 갱신 순서와 동일)
+        items = pd.concat(frames, ignore_index=True).groupby('name', sort=False).last()
+        return items.to_dict('index')
+    
+    @staticmethod
+    def _items_frame(df: pd.DataFrame, name_column: str, price: Tuple[str, int], time: Tuple[str, int],
+                     zero_is_missing: bool, layer: Optional[str], category: str) -> Optional[pd.DataFrame]:
+        """카테고리 테이블 -> (name, base_price, production_time, layer, unlock_level, category) 프레임"""
+        if name_column not in df.columns:
+            return None
+        rows = df[df[name_column].notna()]
+        if rows.empty:
+            return None
         
-        return 1  # 기본값
+        def int_column(column: str, default: int) -> np.ndarray:
+            # 컬럼 전체를 한 번에 숫자로 변환 (없거나 변환 불가하면 기본값)
+            if column not in rows.columns:
+                return np.full(len(rows), default, dtype=np.int64)
+            values = pd.to_numeric(rows[column], errors='coerce')
+            if zero_is_missing:
+                values = values.mask(values == 0)
+            return values.fillna(default).astype(np.int64).to_numpy()
+        
+        base_price = int_column(*price)
+        production_time = int_column(*time)
+        if layer is None:
+            # 고급품 / 중급품 / 기본품
+            layers = np.select(
+                [(base_price >= 100) | (production_time >= 240), (base_price >= 20) | (production_time >= 30)],
+                ['TOP', 'MID'], default='CROPS'
+            )
+        else:
+            layers = np.full(len(rows), layer, dtype=object)
+        
+        return pd.DataFrame({
+            'name': rows[name_column].astype(str).to_numpy(),
+            'base_price': base_price,
+            'production_time': production_time,
+            'layer': layers.astype(object),
+            'unlock_level': int_column('UnlockLevel', 1),
+            'category': category
+        })
+    
+    def _get_item_unlock_level(self, item_name: str, catalog: Optional[CatalogState] = None) -> int:
+        """Item 언락레벨 조회 (CSV 데이터 기반: 농작물 -> 생산 건물 -> 동물 순)"""
+        unlock_level = (catalog or self.catalog).item_catalog.unlock_level(item_name)
+        return unlock_level if unlock_level is not None else 1  # 기본값
     
     def simulate_economy(self, days: int = 30, player_level: int = 20) -> Dict:
         """경제 시뮬레이션 실행"""
@@ -1047,7 +1234,7 @@ class HayDaySimulator:
             daily_orders = []
             daily_value = 0
             
-            for _ in range(np.random.randint(3, 6)):
+            for _ in range(self.rng.np.integers(3, 6)):
                 order = self.generate_delivery_order(player_level, current_struggle)
                 if order:
                     daily_orders.append(order)
@@ -1070,8 +1257,203 @@ class HayDaySimulator:
             results['difficulties'].append(avg_difficulty if daily_orders else 3)
         
         return results
+    
+    # 앙상블 결과 백분위 밴드 (하단, 중앙, 상단)
+    ENSEMBLE_PERCENTILES = (5, 50, 95)
+    ENSEMBLE_METRICS = ('struggle_scores', 'total_values', 'orders_generated')
+    
+    def simulate_economy_ensemble(self, replicas: int = 100, days: int = 30,
+                                  levels: Union[int, List[int]] = 20,
+                                  workers: Optional[int] = None) -> Dict:
+        """
+        simulate_economy를 레벨마다 replicas번 반복해 일별 백분위 밴드(p5/p50/p95)로 집계
+        
+        반복마다 self.rng의 SeedSequence에서 spawn한 독립 시드를 쓰므로 workers 수와 관계없이 결과가 같다.
+        workers > 1이면 spawn 방식 프로세스 풀로 나눠 실행한다. 워커는 부모 상태를 물려받지 않고
+        스냅샷 설정(경로, 사용 여부)으로 카탈로그를 새로 로드하며, 반복마다 시드를 작업으로 받는다.
+        (부모가 로드한 뒤 CSV가 바뀌었다면 워커는 바뀐 데이터를 본다.)
+        반환: {'days', 'percentiles', 'replicas', 'workers', 'elapsed',
+               'levels': {레벨: {지표: (백분위 수, days) float32 배열}}}
+        """
+        if replicas < 1:
+            raise ValueError(f"replicas must be >= 1 (got {replicas})")
+        started = time.perf_counter()
+        levels = [levels] if isinstance(levels, int) else list(levels)
+        tasks = [(seed, days, level) for level in levels for seed in self.rng.seed_sequence.spawn(replicas)]
+        workers = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+        
+        if workers > 1:
+            # fork는 스레드(로더 풀, 데이터 감시)가 있는 프로세스에서 안전하지 않으므로 항상 spawn
+            context = multiprocessing.get_context('spawn')
+            worker_state = (self.snapshot.cache_dir, self.snapshot.enabled)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                     initializer=_init_ensemble_worker, initargs=worker_state) as executor:
+                runs = list(executor.map(_economy_replica_worker, tasks,
+                                         chunksize=max(1, len(tasks) // (workers * 4))))
+        else:
+            runs = [_simulate_economy_replica(self, *task) for task in tasks]
+        
+        # (레벨, 반복, 지표, 일) -> 반복 축 백분위
+        runs = np.stack(runs).reshape(len(levels), replicas, len(self.ENSEMBLE_METRICS), days)
+        bands = np.percentile(runs, self.ENSEMBLE_PERCENTILES, axis=1).astype(np.float32)
+        
+        return {
+            'days': np.arange(1, days + 1),
+            'percentiles': self.ENSEMBLE_PERCENTILES,
+            'replicas': replicas,
+            'workers': workers,
+            'elapsed': time.perf_counter() - started,
+            'levels': {
+                level: {metric: bands[:, level_index, metric_index]
+                        for metric_index, metric in enumerate(self.ENSEMBLE_METRICS)}
+                for level_index, level in enumerate(levels)
+            }
+        }
+
+    # simulate_economy 규칙: 하루 주문 수 범위 [3, 6), 주문 난이도 점수
+    DAILY_ORDER_RANGE = (3, 6)
+    DIFFICULTY_SCORES = {'VeryEasy': 1, 'Easy': 2, 'Normal': 3, 'Hard': 4, 'VeryHard': 5}
+    # 주문 규칙이 바뀌는 어려움 지수 경계 (기본 주문 20/40/60/80 미만, 동적 주문 30/60 미만, 카테고리 구성 40/70 초과)
+    STRUGGLE_BOUNDS_BELOW = (20, 30, 40, 60, 80)
+    STRUGGLE_BOUNDS_ABOVE = (40, 70)
+    
+    def simulate_population(self, n_players: int = 100000, levels: Union[int, Tuple[int, int], np.ndarray] = (20, 40),
+                            days: int = 90, initial_struggle: float = 50.0, order_samples: int = 4096,
+                            histogram_bins: int = 20) -> Dict:
+        """
+        플레이어 N명을 배열로 들고 simulate_economy 규칙으로 하루씩 동시에 진행 (코호트 분석용)
+        
+        levels: 고정 레벨, (최소, 최대) 균등 분포, 또는 플레이어별 레벨 배열.
+        주문 분포는 (레벨, 주문 규칙이 같은 어려움 지수 구간)마다 order_samples개를 한 번 생성해 두고
+        매일 그 표본에서 복원 추출한다. 레벨 상승은 simulate_economy와 같이 다루지 않는다.
+        """
+        started = time.perf_counter()
+        rng = self.rng.np
+        if isinstance(levels, int):
+            player_levels = np.full(n_players, levels, dtype=np.int64)
+        elif isinstance(levels, tuple):
+            player_levels = rng.integers(levels[0], levels[1] + 1, size=n_players)
+        else:
+            player_levels = np.asarray(levels, dtype=np.int64)
+            n_players = len(player_levels)
+        
+        state = PopulationState(
+            level=player_levels,
+            struggle=np.full(n_players, initial_struggle, dtype=np.float64),
+            total_value=np.zeros(n_players, dtype=np.int64),
+            orders_completed=np.zeros(n_players, dtype=np.int64)
+        )
+        
+        # (레벨, 구간) -> 그룹 번호, 그룹별 주문 가치 표본 (그룹 수, order_samples) / 난이도 점수
+        group_ids: Dict[Tuple[int, int], int] = {}
+        group_values: List[np.ndarray] = []
+        group_difficulty: List[int] = []
+        daily_struggle = np.zeros((len(self.ENSEMBLE_PERCENTILES), days), dtype=np.float32)
+        daily_value = np.zeros((len(self.ENSEMBLE_PERCENTILES), days), dtype=np.float32)
+        
+        for day in range(days):
+            segments = self._struggle_segments(state.struggle)
+            keys, first, inverse = np.unique(player_levels * 16 + segments, return_index=True, return_inverse=True)
+            group_of_key = np.empty(len(keys), dtype=np.int64)
+            for key_index, player in enumerate(first):
+                group_key = (int(player_levels[player]), int(segments[player]))
+                if group_key not in group_ids:
+                    # 같은 구간이면 어느 플레이어의 어려움 지수로 생성해도 주문 분포가 같다
+                    batch = self.generate_delivery_orders(order_samples, group_key[0], float(state.struggle[player]),
+                                                          rng=rng)
+                    group_ids[group_key] = len(group_values)
+                    group_values.append(batch.total_value)
+                    group_difficulty.append(self.DIFFICULTY_SCORES.get(batch.difficulty.value, 3))
+                group_of_key[key_index] = group_ids[group_key]
+            player_groups = group_of_key[inverse]
+            
+            # 하루 주문 수 -> 주문마다 그룹 표본에서 복원 추출 -> 플레이어별 합계
+            counts = rng.integers(*self.DAILY_ORDER_RANGE, size=n_players)
+            order_groups = np.repeat(player_groups, counts)
+            picks = rng.integers(0, order_samples, size=len(order_groups))
+            order_values = np.stack(group_values)[order_groups, picks]
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+            values = np.zeros(n_players, dtype=np.int64)
+            has_orders = counts > 0
+            if len(order_values):
+                values[has_orders] = np.add.reduceat(order_values, starts[has_orders])
+            
+            # 어려움 지수 업데이트 (주문 완료에 따른 조정, 주문이 없으면 +5)
+            difficulty = np.array(group_difficulty, dtype=np.float64)[player_groups]
+            state.struggle = np.where(has_orders, np.maximum(0, state.struggle - difficulty * 2),
+                                      np.minimum(100, state.struggle + 5))
+            state.total_value += values
+            state.orders_completed += counts
+            daily_struggle[:, day] = np.percentile(state.struggle, self.ENSEMBLE_PERCENTILES)
+            daily_value[:, day] = np.percentile(values, self.ENSEMBLE_PERCENTILES)
+        
+        cohort_levels, cohort_index = np.unique(player_levels, return_inverse=True)
+        cohort_sizes = np.bincount(cohort_index)
+        return {
+            'players': n_players,
+            'days': np.arange(1, days + 1),
+            'percentiles': self.ENSEMBLE_PERCENTILES,
+            'daily_struggle': daily_struggle,
+            'daily_value': daily_value,
+            'histograms': {
+                'struggle': np.histogram(state.struggle, bins=histogram_bins, range=(0, 100)),
+                'total_value': np.histogram(state.total_value, bins=histogram_bins),
+                'level': (cohort_sizes, cohort_levels),
+            },
+            'cohorts': {
+                int(level): {
+                    'players': int(size),
+                    'mean_struggle': float(struggle_sum / size),
+                    'mean_total_value': float(value_sum / size),
+                }
+                for level, size, struggle_sum, value_sum in zip(
+                    cohort_levels, cohort_sizes,
+                    np.bincount(cohort_index, weights=state.struggle),
+                    np.bincount(cohort_index, weights=state.total_value)
+                )
+            },
+            'state': state,
+            'elapsed': time.perf_counter() - started
+        }
+    
+    def _struggle_segments(self, struggle: np.ndarray) -> np.ndarray:
+        """주문 생성 규칙이 모두 같은 어려움 지수 구간 번호 (경계를 넘을 때마다 1씩 증가)"""
+        segments = np.zeros(len(struggle), dtype=np.int64)
+        for bound in self.STRUGGLE_BOUNDS_BELOW:
+            segments += struggle >= bound
+        for bound in self.STRUGGLE_BOUNDS_ABOVE:
+            segments += struggle > bound
+        return segments
+
+# 앙상블 워커 프로세스의 시뮬레이터 (initializer가 스냅샷으로 새로 로드)
+_ENSEMBLE_SIMULATOR: Optional[HayDaySimulator] = None
+
+def _init_ensemble_worker(snapshot_dir: str, use_snapshot: bool):
+    """프로세스 풀 initializer - 부모와 같은 스냅샷 설정으로 워커 전용 시뮬레이터 로드"""
+    global _ENSEMBLE_SIMULATOR
+    with contextlib.redirect_stdout(io.StringIO()):  # 워커마다 반복되는 로드 로그 숨김
+        _ENSEMBLE_SIMULATOR = HayDaySimulator(use_snapshot=use_snapshot, load_workers=1, snapshot_dir=snapshot_dir)
+
+def _economy_replica_worker(task: Tuple[np.random.SeedSequence, int, int]) -> np.ndarray:
+    return _simulate_economy_replica(_ENSEMBLE_SIMULATOR, *task)
+
+def _simulate_economy_replica(simulator: HayDaySimulator, seed: np.random.SeedSequence,
+                              days: int, player_level: int) -> np.ndarray:
+    """반복 1회 -> (지표, days) 배열 (카탈로그는 공유하고 난수 스트림만 교체한 얕은 복사본으로 실행)"""
+    replica = copy.copy(simulator)
+    replica.rng = SimulationRandom(seed)
+    results = replica.simulate_economy(days, player_level)
+    return np.array([results[metric] for metric in HayDaySimulator.ENSEMBLE_METRICS], dtype=np.float64)
 
 # Streamlit 대시보드
+def _dashboard_simulator() -> HayDaySimulator:
+    """대시보드 공용 시뮬레이터 (프로세스당 1개)"""
+    return HayDaySimulator()
+
+if HAS_STREAMLIT:
+    # Streamlit은 리런마다 스크립트를 다시 실행하므로 모듈 전역 대신 cache_resource로 세션 간 공유
+    _dashboard_simulator = st.cache_resource(show_spinner="데이터 로드 중...")(_dashboard_simulator)
+
 def create_dashboard():
     """Streamlit 대시보드 생성"""
     st.set_page_config(page_title="HayDay Dynamic Balancing Simulator", layout="wide")
@@ -1120,8 +1502,9 @@ def create_dashboard():
     simulation_days = st.sidebar.slider("시뮬레이션 기간 (일)", 7, 90, 30)
     delivery_type = st.sidebar.selectbox("납품 타입", ["Truck", "Train"])
     
-    # 시뮬레이터 초기화
-    simulator = HayDaySimulator()
+    # 공용 시뮬레이터 (리런마다 새로 만들지 않고, 수정된 CSV만 다시 로드)
+    simulator = _dashboard_simulator()
+    simulator.reload_changed_data()
     
     # 메인 탭 (주문 생성을 맨 앞으로)
     tab1, tab2, tab3, tab4 = st.tabs(["📦 주문 생성", "📊 시뮬레이션", "🏭 생산 체인", "📈 데이터 분석"])
@@ -1143,16 +1526,13 @@ def create_dashboard():
         
         # 레벨별 사용 가능한 아이템 미리보기
         st.subheader(f"📋 레벨 {test_level}에서 사용 가능한 아이템")
-        available_items = simulator._get_available_items(test_level)
+        available_items = simulator.level_items_table(test_level)
         
-        if available_items:
+        if not available_items.empty:
             cols = st.columns(min(5, len(available_items)))
-            for i, item in enumerate(available_items[:15]):  # 최대 15개만 표시
+            for i, (item, unlock_level, price, production_time) in enumerate(
+                    available_items.head(15).itertuples(index=False)):  # 최대 15개만 표시
                 with cols[i % 5]:
-                    unlock_level = simulator._get_item_unlock_level(item)
-                    price = simulator._get_item_value(item)
-                    production_time = simulator._get_item_production_time(item)
-                    
                     st.info(f"""
                     **{item}**  
                     🔓 레벨 {unlock_level}  
@@ -1240,7 +1620,39 @@ def create_dashboard():
     with tab2:
         st.header("📊 경제 시뮬레이션")
         
-        if st.button("🚀 시뮬레이션 실행"):
+        ensemble_col1, ensemble_col2 = st.columns(2)
+        with ensemble_col1:
+            use_ensemble = st.checkbox("🎲 Monte Carlo 앙상블 (p5/p50/p95 밴드)", value=False)
+        with ensemble_col2:
+            ensemble_replicas = st.slider("반복 횟수", 10, 1000, 200, step=10, disabled=not use_ensemble)
+        
+        if use_ensemble and st.button("🚀 앙상블 시뮬레이션 실행"):
+            with st.spinner(f"{ensemble_replicas}회 반복 시뮬레이션 실행 중..."):
+                ensemble = simulator.simulate_economy_ensemble(ensemble_replicas, simulation_days, player_level)
+            bands = ensemble['levels'][player_level]
+            low, mid, high = ensemble['percentiles']
+            
+            band_titles = {
+                'struggle_scores': ("어려움 지수 변화", "Struggle Score"),
+                'total_values': ("일일 총 주문 가치", "코인 가치"),
+                'orders_generated': ("일일 생성된 주문 수", "주문 수"),
+            }
+            band_cols = st.columns(len(band_titles))
+            for band_col, (metric, (title, y_label)) in zip(band_cols, band_titles.items()):
+                with band_col:
+                    fig = go.Figure([
+                        go.Scatter(x=ensemble['days'], y=bands[metric][2], mode='lines',
+                                   line=dict(width=0), name=f"p{high}"),
+                        go.Scatter(x=ensemble['days'], y=bands[metric][0], mode='lines', line=dict(width=0),
+                                   fill='tonexty', fillcolor='rgba(31, 119, 180, 0.2)', name=f"p{low}-p{high}"),
+                        go.Scatter(x=ensemble['days'], y=bands[metric][1], mode='lines', name=f"p{mid}"),
+                    ])
+                    fig.update_layout(title=title, xaxis_title='일', yaxis_title=y_label)
+                    st.plotly_chart(fig, use_container_width=True)
+            
+            st.caption(f"{ensemble['replicas']}회 반복, 워커 {ensemble['workers']}개, {ensemble['elapsed']:.1f}초")
+        
+        if not use_ensemble and st.button("🚀 시뮬레이션 실행"):
             with st.spinner("시뮬레이션 실행 중..."):
                 results = simulator.simulate_economy(simulation_days, player_level)
             
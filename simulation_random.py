@@ -0,0 +1,55 @@
+"""
+시뮬레이터 인스턴스별 난수 스트림
+HayDaySimulator / SungDaeSimulator가 전역 random, np.random 대신 사용한다.
+"""
+
+import random
+from typing import List, Optional, Union
+
+import numpy as np
+
+# 파이썬 random.Random 시드로 쓸 SeedSequence 상태 크기 (32비트 워드 수)
+PYTHON_SEED_WORDS = 8
+
+SeedLike = Union[None, int, np.random.SeedSequence, 'SimulationRandom']
+
+
+class SimulationRandom(random.Random):
+    """
+    random.Random API(randint, sample, choice, uniform ...) + NumPy Generator(self.np)
+
+    두 스트림 모두 같은 SeedSequence에서 만든다. spawn()으로 서로 독립인 자식 스트림을 나누면
+    샤드를 여러 프로세스에 나눠 돌려도 같은 시드의 순차 실행과 결과가 같다.
+    """
+
+    def __init__(self, seed: Optional[Union[int, np.random.SeedSequence]] = None):
+        self.seed_sequence = (seed if isinstance(seed, np.random.SeedSequence)
+                              else np.random.SeedSequence(seed))
+        state = self.seed_sequence.generate_state(PYTHON_SEED_WORDS, np.uint32)
+        super().__init__(int.from_bytes(state.tobytes(), 'little'))
+        self.np = np.random.Generator(np.random.PCG64(self.seed_sequence))
+
+    @property
+    def entropy(self):
+        """재현용 시드 값 (seed=None이면 OS 엔트로피에서 뽑힌 값)"""
+        return self.seed_sequence.entropy
+
+    def spawn(self, n: int) -> List['SimulationRandom']:
+        """독립 자식 스트림 n개 (부모 스트림 상태는 바뀌지 않음)"""
+        return [SimulationRandom(child) for child in self.seed_sequence.spawn(n)]
+
+    def __reduce__(self):
+        # 프로세스 풀로 보낼 때 파이썬/NumPy 스트림 위치를 그대로 유지
+        return self.__class__, (self.seed_sequence,), (self.getstate(), self.np.bit_generator.state)
+
+    def __setstate__(self, state):
+        python_state, numpy_state = state
+        self.setstate(python_state)
+        self.np.bit_generator.state = numpy_state
+
+
+def as_simulation_random(seed: SeedLike = None) -> SimulationRandom:
+    """시드 / SeedSequence / 기존 스트림 -> SimulationRandom (기존 스트림은 그대로 공유)"""
+    if isinstance(seed, SimulationRandom):
+        return seed
+    return SimulationRandom(seed)
@@ -4,14 +4,21 @@ RabbitHole의 다이나믹 밸런싱 시스템을 HayDay 아이템으로 구현
 기존 HayDay 시뮬레이터에 영향을 주지 않는 독립적인 모드
 """
 
-import random
 import math
-from typing import Dict, List, Tuple, Optional, Set
+import threading
+import time
+from typing import Dict, List, Mapping, Tuple, Optional, Set
 from enum import Enum
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from collections.abc import MutableMapping
+from types import MappingProxyType
 import json
 
+import numpy as np
+
+from simulation_random import SeedLike, SimulationRandom, as_simulation_random
+
 class ResourceSource(Enum):
     """리소스 획득 소스 (PDF: RH-일반 납품 - 세부 로직)"""
     STORAGE = "STORAGE"      # 창고에서 직접 획득
@@ -57,7 +64,251 @@ class ResourceState:
     @property
     def is_deficit(self) -> bool:
         """부족 상태 여부 (희소성 알고리즘 기준)"""
-        return self.stock_ratio < 0.3
+        return self.stock_ratio < DEFICIT_STOCK_RATIO
+
+# 재고 비율 구간 (부족 < 0.3 <= 건강 <= 0.8 < 풍부)
+DEFICIT_STOCK_RATIO = 0.3
+ABUNDANT_STOCK_RATIO = 0.8
+# 1단계 리소스 분석의 풍부 기준 (분석 버킷: 부족 < 0.3, 풍부 > 0.7, 나머지 균형)
+ANALYSIS_ABUNDANT_STOCK_RATIO = 0.7
+
+# ResourceStore layer 컬럼 값
+LAYER_CODES: Dict[ItemLayer, int] = {layer: code for code, layer in enumerate(ItemLayer)}
+LAYERS_BY_CODE: List[ItemLayer] = list(ItemLayer)
+
+
+def _column_property(column: str, cast):
+    def getter(self):
+        return cast(getattr(self._store, column)[self._row])
+    
+    def setter(self, value):
+        getattr(self._store, column)[self._row] = value
+        self._store.touch(self._row)
+    
+    return property(getter, setter)
+
+
+class ResourceView:
+    """ResourceStore 한 행에 대한 ResourceState 호환 뷰 (속성 쓰기가 컬럼에 바로 반영됨)"""
+    __slots__ = ('_store', '_row')
+    
+    def __init__(self, store: 'ResourceStore', row: int):
+        self._store = store
+        self._row = row
+    
+    @property
+    def current_stock(self) -> int:
+        return int(self._store.current_stock[self._row])
+    
+    @current_stock.setter
+    def current_stock(self, value: int):
+        self._store.set_stock(self._row, current_stock=value)
+    
+    @property
+    def max_capacity(self) -> int:
+        return int(self._store.max_capacity[self._row])
+    
+    @max_capacity.setter
+    def max_capacity(self, value: int):
+        self._store.set_stock(self._row, max_capacity=value)
+    
+    production_time = _column_property('production_time', int)
+    shelf_available = _column_property('shelf_available', bool)
+    market_available = _column_property('market_available', bool)
+    
+    @property
+    def production_buildings(self) -> List[str]:
+        return self._store.production_buildings[self._row]
+    
+    @production_buildings.setter
+    def production_buildings(self, value: List[str]):
+        self._store.production_buildings[self._row] = value
+        self._store.touch(self._row)
+    
+    @property
+    def item_name(self) -> str:
+        return self._store.row_names[self._row]
+    
+    @property
+    def layer(self) -> ItemLayer:
+        # 레이어 변경은 레이어 인덱스와 맞춰야 하므로 ResourceState 교체로만 한다
+        return LAYERS_BY_CODE[self._store.layer_code[self._row]]
+    
+    @property
+    def stock_ratio(self) -> float:
+        """재고 비율 (0.0 ~ 1.0)"""
+        return self.current_stock / max(self.max_capacity, 1)
+    
+    @property
+    def is_deficit(self) -> bool:
+        """부족 상태 여부 (희소성 알고리즘 기준)"""
+        return self.stock_ratio < DEFICIT_STOCK_RATIO
+    
+    def __repr__(self) -> str:
+        return (f"ResourceView(item_name={self.item_name!r}, layer={self.layer}, current_stock={self.current_stock}, "
+                f"max_capacity={self.max_capacity}, production_time={self.production_time}, "
+                f"production_buildings={self.production_buildings!r}, shelf_available={self.shelf_available}, "
+                f"market_available={self.market_available})")
+
+
+class ResourceStore(MutableMapping):
+    """
+    아이템명 -> ResourceView 매핑 (컬럼형 저장소)
+    
+    current_stock / max_capacity / production_time / layer_code / shelf_available / market_available 은
+    NumPy 배열 컬럼이라 부족/풍부 집계를 한 번의 벡터 연산으로 한다.
+    반복 순서는 dict와 같다 (기존 키 교체 시 위치 유지, 삭제 후 재추가 시 맨 뒤).
+    삭제된 행은 free list에 모았다가 다음 추가 때 재사용하므로, 배열 크기는 동시에 보유한 아이템 수를
+    넘어 커지지 않는다. 그래서 행 번호는 순서와 무관하고, 반복 순서는 inserted(행별 삽입 순번)를 따른다.
+    행별 값을 캐시하는 쪽은 inserted가 바뀐 행을 다른 아이템으로 보고 다시 채워야 한다.
+    삭제된 아이템의 ResourceView는 행이 재사용되면 다른 아이템을 가리키므로 들고 있지 말 것.
+    
+    재고/용량 변경은 set_stock (뷰 속성 쓰기 포함) 한 경로로만 하며, 그때 해당 아이템만
+    부족/균형/풍부 버킷을 옮긴다. 컬럼 배열에 직접 쓰면 버킷이 어긋난다.
+    모든 쓰기는 row_version 을 올리므로, 파생 값을 캐시하는 쪽은 마지막으로 본 버전과 비교해
+    바뀐 행만 다시 계산하면 된다.
+    """
+    
+    DEFICIT, BALANCED, ABUNDANT = 0, 1, 2
+    
+    def __init__(self, capacity: int = 64):
+        self._rows: Dict[str, int] = {}  # 아이템명 -> 행 (삽입 순서 = 반복 순서)
+        self.row_names: List[str] = []
+        self.production_buildings: List[List[str]] = []
+        self._views: List[ResourceView] = []
+        self._order: Optional[np.ndarray] = None  # 반복 순서의 행 번호 (삽입/삭제 시 무효화)
+        self.current_stock = np.zeros(capacity, dtype=np.int64)
+        self.max_capacity = np.zeros(capacity, dtype=np.int64)
+        self.production_time = np.zeros(capacity, dtype=np.int64)
+        self.layer_code = np.zeros(capacity, dtype=np.int8)
+        self.shelf_available = np.zeros(capacity, dtype=bool)
+        self.market_available = np.zeros(capacity, dtype=bool)
+        self.bucket = np.full(capacity, -1, dtype=np.int8)  # 행 -> 분석 버킷 (-1: 없음)
+        self.row_version = np.zeros(capacity, dtype=np.int64)  # 행별 마지막 쓰기 버전 (1부터)
+        self.inserted = np.zeros(capacity, dtype=np.int64)  # 행 -> 지금 아이템의 삽입 순번 (1부터, 0: 빈 행)
+        self._write_count = 0
+        self._insert_count = 0
+        self._free_rows: List[int] = []  # 삭제되어 재사용할 행
+        # 버킷별 아이템 (버킷에 들어온 순서)
+        self.buckets: Tuple[Dict[str, None], ...] = ({}, {}, {})
+    
+    _ARRAY_COLUMNS = ('current_stock', 'max_capacity', 'production_time', 'layer_code',
+                      'shelf_available', 'market_available', 'bucket', 'row_version', 'inserted')
+    
+    def _append_row(self, item_name: str) -> int:
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self.row_names[row] = item_name
+            self.production_buildings[row] = []
+        else:
+            row = len(self.row_names)
+            if row == len(self.current_stock):
+                for column in self._ARRAY_COLUMNS:
+                    array = getattr(self, column)
+                    grown = np.zeros(len(array) * 2, dtype=array.dtype)
+                    grown[:row] = array
+                    setattr(self, column, grown)
+            self.row_names.append(item_name)
+            self.production_buildings.append([])
+            self._views.append(ResourceView(self, row))
+        self.bucket[row] = -1
+        self._insert_count += 1
+        self.inserted[row] = self._insert_count
+        self._rows[item_name] = row
+        self._order = None
+        return row
+    
+    def __setitem__(self, item_name: str, resource) -> None:
+        """ResourceState(또는 같은 속성을 가진 객체)의 값을 컬럼에 기록"""
+        row = self._rows.get(item_name)
+        if row is None:
+            row = self._append_row(item_name)
+        self.set_stock(row, resource.current_stock, resource.max_capacity)
+        self.production_time[row] = resource.production_time
+        self.layer_code[row] = LAYER_CODES[resource.layer]
+        self.shelf_available[row] = resource.shelf_available
+        self.market_available[row] = resource.market_available
+        self.production_buildings[row] = resource.production_buildings
+        self.touch(row)
+    
+    def __getitem__(self, item_name: str) -> ResourceView:
+        return self._views[self._rows[item_name]]
+    
+    def __delitem__(self, item_name: str) -> None:
+        row = self._rows.pop(item_name)
+        del self.buckets[self.bucket[row]][item_name]
+        self.bucket[row] = -1
+        self.inserted[row] = 0
+        self._free_rows.append(row)
+        self._order = None
+    
+    def __iter__(self):
+        return iter(self._rows)
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __contains__(self, item_name) -> bool:
+        return item_name in self._rows
+    
+    def set_stock(self, row: int, current_stock: Optional[int] = None, max_capacity: Optional[int] = None):
+        """재고/용량 변경의 유일한 경로 - 값 기록 후 그 아이템의 버킷만 갱신"""
+        if current_stock is not None:
+            self.current_stock[row] = current_stock
+        if max_capacity is not None:
+            self.max_capacity[row] = max_capacity
+        self.touch(row)
+        
+        stock_ratio = int(self.current_stock[row]) / max(int(self.max_capacity[row]), 1)
+        if stock_ratio < DEFICIT_STOCK_RATIO:
+            bucket = self.DEFICIT
+        elif stock_ratio > ANALYSIS_ABUNDANT_STOCK_RATIO:
+            bucket = self.ABUNDANT
+        else:
+            bucket = self.BALANCED
+        
+        previous = self.bucket[row]
+        if previous != bucket:
+            item_name = self.row_names[row]
+            if previous >= 0:
+                del self.buckets[previous][item_name]
+            self.buckets[bucket][item_name] = None
+            self.bucket[row] = bucket
+    
+    def touch(self, row: int):
+        """행 값이 바뀌었음을 기록"""
+        self._write_count += 1
+        self.row_version[row] = self._write_count
+    
+    def bucket_count(self, bucket: int) -> int:
+        return len(self.buckets[bucket])
+    
+    def row(self, item_name: str) -> int:
+        """아이템 행 번호 (재사용되므로 순서 비교에는 insertion_order 사용)"""
+        return self._rows[item_name]
+    
+    def insertion_order(self, item_name: str) -> int:
+        """아이템 삽입 순번 (반복 순서와 같은 순서)"""
+        return int(self.inserted[self._rows[item_name]])
+    
+    def order(self) -> np.ndarray:
+        """반복 순서의 행 번호 배열"""
+        if self._order is None:
+            self._order = np.fromiter(self._rows.values(), dtype=np.int64, count=len(self._rows))
+        return self._order
+    
+    def stock_ratios(self) -> np.ndarray:
+        """반복 순서의 재고 비율 (ResourceState.stock_ratio 와 같은 값)"""
+        rows = self.order()
+        return self.current_stock[rows] / np.maximum(self.max_capacity[rows], 1)
+    
+    def total_stock(self) -> int:
+        return int(self.current_stock[self.order()].sum())
+    
+    def names_where(self, mask: np.ndarray) -> List[str]:
+        """반복 순서 기준 mask가 True인 아이템명"""
+        row_names = self.row_names
+        return [row_names[row] for row in self.order()[mask]]
 
 @dataclass
 class ProductionPressure:
@@ -97,18 +348,37 @@ class DeliveryOrder:
     expiry_time: int  # 만료 시간 (분)
     generation_metadata: Dict  # 생성 과정 메타데이터
 
+# 상호의존성 맵 공유 캐시: (카탈로그 버전, 아이템 구성) -> 읽기 전용 맵 (인스턴스 간 공유)
+INTERDEPENDENCY_CACHE_SIZE = 8
+_INTERDEPENDENCY_MAPS: "OrderedDict[Tuple, Mapping[str, Mapping]]" = OrderedDict()
+_INTERDEPENDENCY_MAPS_LOCK = threading.Lock()
+
 class SungDaeSimulator:
     """
     성대 모드 시뮬레이터
     RabbitHole 다이나믹 밸런싱 시스템의 완전한 구현
     """
     
-    def __init__(self, hayday_items: Dict, player_level: int = 5):
+    def __init__(self, hayday_items: Dict, player_level: int = 5, item_catalog=None, rng: SeedLike = None):
+        self.rng: SimulationRandom = as_simulation_random(rng)  # 인스턴스 전용 난수 스트림 (시드/스트림 주입 가능)
         self.hayday_items = hayday_items
+        self.item_catalog = item_catalog  # HayDaySimulator.item_catalog (없으면 CSV 직접 조회)
+        self.catalog_version = 0
         self._player_level = player_level  # private 변수로 저장
         
         # 상태 추적
-        self.resource_states: Dict[str, ResourceState] = {}
+        self.resource_states = ResourceStore()  # 아이템명 -> ResourceView (컬럼형)
+        # 레이어별 주문 후보 인덱스 (유효 + 언락 아이템, resource_states 순서 유지)
+        # resource_states 추가/삭제는 _set_resource_state / _remove_resource_state 로만 한다
+        self._layer_index: Dict[ItemLayer, Dict[str, None]] = {layer: {} for layer in ItemLayer}
+        self._locked_items: Dict[str, int] = {}  # 보유 중이지만 아직 언락 전인 아이템 -> 언락 레벨
+        self._eligible_rows: Optional[np.ndarray] = None  # 레이어 인덱스 전체의 행 번호 (인덱스 변경 시 무효화)
+        self._reset_source_cache()
+        self._interdependency_map: Optional[Mapping[str, Mapping]] = None  # 공유 캐시에서 가져온 읽기 전용 맵
+        self._interdependency_version = -1
+        self._pressure_snapshot: Optional[Dict] = None  # 생산 압박 분석 스냅샷 (_calculate_production_pressure)
+        self._pressure_snapshot_key: Optional[Tuple] = None
+        self.pressure_snapshot_version = 0  # 스냅샷을 다시 계산할 때마다 증가
         self.production_pressures: Dict[str, ProductionPressure] = {}
         self.current_struggle_score: float = 50.0  # 초기값 50
         
@@ -128,7 +398,7 @@ class SungDaeSimulator:
         self._initialize_production_systems()
         
         barn_capacity = self._calculate_barn_capacity()
-        total_items = sum(resource.current_stock for resource in self.resource_states.values())
+        total_items = self.resource_states.total_stock()
         
         print(f"[INIT] SungDae 시뮬레이터 초기화 완료:")
         print(f"  - 플레이어 레벨: {self.player_level}")
@@ -153,6 +423,7 @@ class SungDaeSimulator:
             
             # 인벤토리 재초기화 (새로운 레벨에 맞게)
             self._upgrade_inventory_for_new_level(old_level, new_level)
+            self._index_unlocked_items()
     
     def _upgrade_inventory_for_new_level(self, old_level: int, new_level: int):
         """레벨 변경에 따른 인벤토리 업그레이드"""
@@ -210,20 +481,20 @@ class SungDaeSimulator:
                 }
                 
                 # 초기 재고 설정 (새로 언락된 아이템은 적게)
-                base_stock = random.randint(1, 3)
+                base_stock = self.rng.randint(1, 3)
                 max_capacity = int(barn_capacity * layer_multipliers[layer])
                 max_capacity = max(base_stock, max_capacity)
                 
-                self.resource_states[item_name] = ResourceState(
+                self._set_resource_state(item_name, ResourceState(
                     item_name=item_name,
                     layer=layer,
                     current_stock=base_stock,
                     max_capacity=max_capacity,
                     production_time=item_data.get('production_time', 300),
                     production_buildings=item_data.get('buildings', []),
-                    shelf_available=random.choice([True, False]),
+                    shelf_available=self.rng.choice([True, False]),
                     market_available=layer != ItemLayer.TOP
-                )
+                ))
                 
                 newly_unlocked.append(item_name)
         
@@ -240,11 +511,66 @@ class SungDaeSimulator:
                 to_remove.append(item_name)
         
         for item_name in to_remove:
-            del self.resource_states[item_name]
+            self._remove_resource_state(item_name)
         
         if to_remove:
             print(f"[REMOVE] 제거된 고레벨 아이템: {to_remove}")
     
+    def _set_resource_state(self, item_name: str, resource: ResourceState):
+        """리소스 추가/교체 + 레이어 인덱스 갱신 (교체 시 기존 순서 유지)"""
+        previous = self.resource_states.get(item_name)
+        if previous is not None and previous.layer != resource.layer:
+            self._layer_index[previous.layer].pop(item_name, None)
+            self._eligible_rows = None
+        self.resource_states[item_name] = resource
+        
+        if not self._is_valid_item(item_name):
+            return
+        if self._is_unlocked_item(item_name):
+            self._locked_items.pop(item_name, None)
+            self._insert_layer_item(resource.layer, item_name)
+        else:
+            self._locked_items[item_name] = self.hayday_items.get(item_name, {}).get('unlock_level', 1)
+    
+    def _remove_resource_state(self, item_name: str):
+        """리소스 삭제 + 레이어 인덱스 갱신"""
+        resource = self.resource_states.pop(item_name)
+        self._layer_index[resource.layer].pop(item_name, None)
+        self._locked_items.pop(item_name, None)
+        self._eligible_rows = None
+    
+    def _insert_layer_item(self, layer: ItemLayer, item_name: str):
+        """레이어 인덱스에 아이템 추가 (중간 순번이면 해당 레이어만 다시 정렬)"""
+        layer_items = self._layer_index[layer]
+        if item_name in layer_items:
+            return
+        last_item = next(reversed(layer_items), None)
+        layer_items[item_name] = None
+        self._eligible_rows = None
+        insertion_order = self.resource_states.insertion_order
+        if last_item is not None and insertion_order(item_name) < insertion_order(last_item):
+            self._layer_index[layer] = dict.fromkeys(sorted(layer_items, key=insertion_order))
+    
+    def _index_unlocked_items(self):
+        """레벨 상승으로 언락된 보유 아이템을 레이어 인덱스에 추가"""
+        unlocked = [item for item, unlock_level in self._locked_items.items() if unlock_level <= self.player_level]
+        for item_name in unlocked:
+            del self._locked_items[item_name]
+            self._insert_layer_item(self.resource_states[item_name].layer, item_name)
+    
+    def _eligible_layer_items(self, layer: ItemLayer) -> List[str]:
+        """주문 후보 아이템 (유효 + 언락, resource_states 순서)"""
+        return list(self._layer_index[layer])
+    
+    def _get_eligible_rows(self) -> np.ndarray:
+        """주문 후보 아이템 전체의 resource_states 행 번호 (resource_states 순서)"""
+        if self._eligible_rows is None:
+            store = self.resource_states
+            rows = np.array([store.row(item) for layer_items in self._layer_index.values()
+                             for item in layer_items], dtype=np.int64)
+            self._eligible_rows = rows[np.argsort(store.inserted[rows], kind='stable')]
+        return self._eligible_rows
+    
     def _initialize_delivery_patterns(self):
         """납품 패턴 초기화 (PDF: 패턴 가중치 적용)"""
         self.delivery_patterns = {
@@ -297,7 +623,7 @@ class SungDaeSimulator:
                 continue
             
             # 플레이어 레벨보다 높은 언락 레벨의 아이템은 건너뛰기 (CSV 데이터 기반)
-            unlock_level = self._get_correct_unlock_level(item_name)
+            unlock_level = self._get_correct_unlock_level(item_name, self.item_catalog)
             if unlock_level > self.player_level:
                 print(f"[DEBUG] 레벨 {unlock_level} 아이템 '{item_name}' 제외됨 (플레이어 레벨: {self.player_level})")
                 continue
@@ -315,7 +641,7 @@ class SungDaeSimulator:
             }
             
             # 레벨별 기본 저장량 (barn 용량에 비례)
-            base_percentage = random.uniform(0.3, 0.7)  # barn 용량의 30-70%
+            base_percentage = self.rng.uniform(0.3, 0.7)  # barn 용량의 30-70%
             base_stock = int(barn_capacity * layer_multipliers[layer] * base_percentage)
             base_stock = max(1, base_stock)  # 최소 1개
             
@@ -323,16 +649,16 @@ class SungDaeSimulator:
             max_capacity = int(barn_capacity * layer_multipliers[layer])
             max_capacity = max(base_stock, max_capacity)  # 현재 재고보다는 커야 함
             
-            self.resource_states[item_name] = ResourceState(
+            self._set_resource_state(item_name, ResourceState(
                 item_name=item_name,
                 layer=layer,
                 current_stock=base_stock,
                 max_capacity=max_capacity,
                 production_time=item_data.get('production_time', 300),
                 production_buildings=item_data.get('buildings', []),
-                shelf_available=random.choice([True, False]),
+                shelf_available=self.rng.choice([True, False]),
                 market_available=layer != ItemLayer.TOP  # TOP 레이어는 마켓 구매 불가
-            )
+            ))
     
     def _calculate_barn_capacity(self) -> int:
         """플레이어 레벨에 따른 barn 용량 계산 (HayDay 실제 진행 반영)"""
@@ -366,8 +692,8 @@ class SungDaeSimulator:
         for building in building_types:
             self.production_pressures[building] = ProductionPressure(
                 building_name=building,
-                current_load=random.uniform(0.1, 0.6),
-                max_capacity=random.randint(3, 8),
+                current_load=self.rng.uniform(0.1, 0.6),
+                max_capacity=self.rng.randint(3, 8),
                 items_in_queue=[]
             )
     
@@ -570,9 +896,9 @@ class SungDaeSimulator:
         selected_items = {}
         
         # Township 기차 규칙: 3-5개 칸, 다양한 아이템 타입 보장
-        train_cars = random.randint(3, 5)  # 3-5개 기차칸
+        train_cars = self.rng.randint(3, 5)  # 3-5개 기차칸
         # 최소 3개, 최대 6개 아이템 타입 (다양성 보장)
-        train_item_count = random.randint(3, min(6, train_cars + 1))
+        train_item_count = self.rng.randint(3, min(6, train_cars + 1))
         
         # 기차 전용 레이어 분포 (TOP 레이어 강화)
         train_layer_distribution = {
@@ -601,8 +927,7 @@ class SungDaeSimulator:
         
         # 각 레이어별로 아이템 선정
         for layer, count in layer_counts.items():
-            layer_items = [item for item, resource in self.resource_states.items() 
-                          if resource.layer == layer and self._is_valid_item(item) and self._is_unlocked_item(item)]
+            layer_items = self._eligible_layer_items(layer)
             
             if not layer_items:
                 continue
@@ -634,12 +959,12 @@ class SungDaeSimulator:
         
         # 기차칸 수에 따른 분산 시스템 - 실제로는 한 아이템이 여러 칸에 걸쳐있음
         # 예: 옥수수가 1칸에 6개, 2칸에 6개 이런 식
-        cars_for_this_item = random.randint(1, min(3, train_cars))  # 한 아이템이 최대 3칸
+        cars_for_this_item = self.rng.randint(1, min(3, train_cars))  # 한 아이템이 최대 3칸
         
         total_quantity = 0
         for i in range(cars_for_this_item):
             # 칸별로 다른 수량 (Township 실제 패턴)
-            car_quantity = random.randint(base_per_car, base_per_car + 3)
+            car_quantity = self.rng.randint(base_per_car, base_per_car + 3)
             total_quantity += car_quantity
         
         # 최소 1개, 최대 25개 제한 (Township 게임 내 제한)
@@ -656,7 +981,7 @@ class SungDaeSimulator:
             if resource.current_stock < quantity:
                 # 부족분을 칸 단위로 조정 (Township의 칸별 시스템)
                 cars_needed = math.ceil(quantity / 5)  # 평균 칸당 5개 기준
-                near_miss_buffer = random.randint(1, 3)  # 칸 1-3개만큼 부족
+                near_miss_buffer = self.rng.randint(1, 3)  # 칸 1-3개만큼 부족
                 
                 adjusted_items[item_name] = max(
                     resource.current_stock - near_miss_buffer,
@@ -666,7 +991,7 @@ class SungDaeSimulator:
             # Township 기차는 풍부한 자원도 칸 단위로 대량 요구
             elif resource.stock_ratio > 0.6:
                 # 칸 수에 비례한 증가 (3-5칸이므로 3-5배 증가 가능)
-                car_multiplier = random.uniform(1.2, 1.8)
+                car_multiplier = self.rng.uniform(1.2, 1.8)
                 adjusted_items[item_name] = int(quantity * car_multiplier)
             
             # 최소 1개, 최대 25개 제한 (Township 게임 내 제한)
@@ -723,183 +1048,153 @@ class SungDaeSimulator:
     
     def _analyze_resource_state(self) -> Dict:
         """1단계: 리소스 상태 분석"""
-        analysis = {
-            'deficit_items': [],  # 부족한 아이템들
-            'abundant_items': [], # 풍부한 아이템들
-            'balanced_items': [], # 균형잡힌 아이템들
-            'total_deficit_ratio': 0.0
+        # 재고 변경 시 ResourceStore가 유지하는 버킷을 그대로 사용 (O(1), 읽기 전용 뷰 - 순서는 버킷에 들어온 순서)
+        buckets = self.resource_states.buckets
+        return {
+            'deficit_items': buckets[ResourceStore.DEFICIT].keys(),  # 부족한 아이템들
+            'abundant_items': buckets[ResourceStore.ABUNDANT].keys(), # 풍부한 아이템들
+            'balanced_items': buckets[ResourceStore.BALANCED].keys(), # 균형잡힌 아이템들
+            'total_deficit_ratio': len(buckets[ResourceStore.DEFICIT]) / len(self.resource_states)
         }
-        
-        deficit_count = 0
-        for item_name, resource in self.resource_states.items():
-            if resource.is_deficit:
-                analysis['deficit_items'].append(item_name)
-                deficit_count += 1
-            elif resource.stock_ratio > 0.7:
-                analysis['abundant_items'].append(item_name)
-            else:
-                analysis['balanced_items'].append(item_name)
-        
-        analysis['total_deficit_ratio'] = deficit_count / len(self.resource_states)
-        return analysis
     
     def _perform_source_tagging(self, resource_analysis: Dict) -> Dict:
-        """2-4단계: 고도화된 소스 태깅 시스템 (PDF Steps 2-4 구현)"""
-        source_tags = {
-            ResourceSource.STORAGE: [],
-            ResourceSource.SHELF: [],
-            ResourceSource.MARKET: [],
-            ResourceSource.PRODUCTION: []
-        }
-        
-        # 고급 소스 점수 계산을 위한 데이터 수집
-        source_scores = {}
-        production_complexity = {}
-        availability_metrics = {}
+        """
+        2-4단계: 고도화된 소스 태깅 시스템 (PDF Steps 2-4 구현)
         
-        for item_name, resource in self.resource_states.items():
-            if not self._is_valid_item(item_name) or not self._is_unlocked_item(item_name):
-                continue
-                
-            # 소스별 점수 계산
-            source_scores[item_name] = {}
-            
-            # STORAGE 점수 계산 (재고 기반, 재고 수량과 안정성 고려)
-            storage_score = self._calculate_storage_source_score(resource)
-            source_scores[item_name][ResourceSource.STORAGE] = storage_score
-            
-            # SHELF 점수 계산 (구매 접근성과 비용 효율성)
-            shelf_score = self._calculate_shelf_source_score(resource)
-            source_scores[item_name][ResourceSource.SHELF] = shelf_score
-            
-            # MARKET 점수 계산 (시장 변동성과 가용성)
-            market_score = self._calculate_market_source_score(resource)
-            source_scores[item_name][ResourceSource.MARKET] = market_score
-            
-            # PRODUCTION 점수 계산 (생산 복잡도와 시간 비용)
-            production_score = self._calculate_production_source_score(resource, item_name)
-            source_scores[item_name][ResourceSource.PRODUCTION] = production_score
-            
-            # 최고 점수의 소스에 아이템 할당 (다중 소스 가능)
-            max_score = max(source_scores[item_name].values())
-            threshold = max_score * 0.8  # 80% 이상 점수를 가진 모든 소스 포함
-            
-            for source, score in source_scores[item_name].items():
-                if score >= threshold and score > 0.2:  # 최소 임계값
-                    source_tags[source].append(item_name)
+        유효 + 언락 아이템의 소스별 점수를 (아이템 x 소스) 행렬로 한 번에 계산한다.
+        지난 주문 이후 재고/진열대/마켓 상태(row_version) 또는 생산 건물 압박이 바뀐 행만 다시 계산.
+        반환: 소스 -> 아이템명 set
+        """
+        building_pressure = self._source_tagging_inputs()
+        rows = self._get_eligible_rows()
+        store = self.resource_states
+        
+        pressure = building_pressure[rows]
+        dirty = ((store.row_version[rows] != self._source_seen_version[rows]) |
+                 (pressure != self._source_seen_pressure[rows]))
+        if dirty.any():
+            dirty_rows = rows[dirty]
+            self._source_scores[dirty_rows] = self._calculate_source_scores(dirty_rows, pressure[dirty])
+            self._source_seen_version[dirty_rows] = store.row_version[dirty_rows]
+            self._source_seen_pressure[dirty_rows] = pressure[dirty]
+        
+        # 최고 점수의 80% 이상 + 최소 임계값 0.2 를 넘는 모든 소스에 할당 (다중 소스 가능)
+        scores = self._source_scores[rows]
+        tags = (scores >= scores.max(axis=1, keepdims=True) * 0.8) & (scores > 0.2)
         
         # 소스 태깅 품질 검증 및 최적화
-        source_tags = self._optimize_source_distribution(source_tags, source_scores)
-        
-        return source_tags
-    
-    def _calculate_storage_source_score(self, resource) -> float:
-        """STORAGE 소스 점수 계산 - 재고량과 안정성 기반"""
-        if resource.current_stock <= 0:
-            return 0.0
-        
-        # 기본 재고 점수 (0-1.0)
-        stock_ratio_score = min(resource.stock_ratio, 1.0)
-        
-        # 절대 재고량 보너스 (대량 재고에 대한 보너스)
-        absolute_stock_bonus = min(resource.current_stock / 20.0, 0.3)
-        
-        # 안정성 점수 (재고가 충분할수록 높음)
-        stability_score = 0.0
-        if resource.current_stock >= 10:
-            stability_score = 0.4
-        elif resource.current_stock >= 5:
-            stability_score = 0.2
-        
-        # 종합 점수 (최대 1.0)
-        total_score = min(stock_ratio_score + absolute_stock_bonus + stability_score, 1.0)
-        return total_score
-    
-    def _calculate_shelf_source_score(self, resource) -> float:
-        """SHELF 소스 점수 계산 - 구매 접근성과 효율성"""
-        if not resource.shelf_available:
-            return 0.0
-        
-        base_score = 0.7  # 진열대 기본 점수
-        
-        # 비용 효율성 (낮은 가격일수록 높은 점수)
-        price = self.hayday_items.get(resource.item_name, {}).get('sell_price', 100)
-        cost_efficiency = max(0.0, 0.3 - (price / 300.0))  # 가격이 높을수록 페널티
-        
-        # 재고 부족 보너스 (재고가 부족할 때 구매 유인)
-        shortage_bonus = 0.0
-        if resource.current_stock < 3:
-            shortage_bonus = 0.2
-        elif resource.current_stock < 1:
-            shortage_bonus = 0.4
-        
-        total_score = min(base_score + cost_efficiency + shortage_bonus, 1.0)
-        return total_score
-    
-    def _calculate_market_source_score(self, resource) -> float:
-        """MARKET 소스 점수 계산 - 시장 변동성과 가용성"""
-        if not resource.market_available:
-            return 0.0
-        
-        base_score = 0.5  # 마켓 기본 점수 (진열대보다 낮음)
-        
-        # 마켓 변동성 고려 (일반적으로 더 비싸지만 가용성 높음)
-        availability_bonus = 0.3
-        
-        # 긴급 구매 보너스 (심각한 부족 상태)
-        emergency_bonus = 0.0
-        if resource.is_deficit and resource.current_stock == 0:
-            emergency_bonus = 0.5
-        elif resource.current_stock < 2:
-            emergency_bonus = 0.3
-        
-        total_score = min(base_score + availability_bonus + emergency_bonus, 1.0)
-        return total_score
-    
-    def _calculate_production_source_score(self, resource, item_name: str) -> float:
-        """PRODUCTION 소스 점수 계산 - 생산 복잡도와 시간 비용"""
-        # 기본 생산 점수
-        base_score = 0.6
-        
-        # 생산 시간 페널티 (긴 생산시간일수록 낮은 점수)
-        production_time = self.hayday_items.get(item_name, {}).get('production_time', 300)
-        time_penalty = min(production_time / 86400.0, 0.4)  # 하루(86400초) 기준으로 페널티
-        
-        # 재고 부족도에 따른 생산 우선순위
-        shortage_incentive = 0.0
-        if resource.is_deficit:
-            shortage_incentive = 0.4
-        elif resource.current_stock < 3:
-            shortage_incentive = 0.2
-        
-        # 건물 압박도 고려 (생산 건물이 바쁘면 점수 감소)
-        building_penalty = 0.0
-        buildings = self.hayday_items.get(item_name, {}).get('buildings', ['farm'])
-        if buildings and len(buildings) > 0:
-            building_name = buildings[0]
-            if building_name in self.production_pressures:
-                pressure = self.production_pressures[building_name].pressure_level
-                building_penalty = pressure * 0.3  # 높은 압박일수록 페널티
-        
-        # 효율성 보너스 (빠르고 가치 높은 아이템)
-        efficiency_bonus = 0.0
-        price = self.hayday_items.get(item_name, {}).get('sell_price', 1)
-        if production_time > 0:
-            value_per_minute = price / (production_time / 60.0)
-            if value_per_minute > 2.0:
-                efficiency_bonus = 0.2
-        
-        total_score = max(0.0, base_score - time_penalty + shortage_incentive - building_penalty + efficiency_bonus)
-        return min(total_score, 1.0)
-    
-    def _optimize_source_distribution(self, source_tags: Dict, source_scores: Dict) -> Dict:
-        """소스 분배 최적화 - 균형잡힌 소스 활용 보장"""
+        tags = self._optimize_source_distribution(tags, scores)
+        
+        row_names = store.row_names
+        return {source: {row_names[row] for row in rows[tags[:, column]]}
+                for column, source in enumerate(ResourceSource)}
+    
+    def _reset_source_cache(self):
+        """소스 태깅 캐시 초기화 (행 단위, _source_tagging_inputs / _perform_source_tagging 참고)"""
+        self._source_static_rows = 0
+        self._source_static_inserted = np.zeros(0, dtype=np.int64)  # 정적 입력을 채울 때의 행 삽입 순번
+        self._source_shelf_price = np.zeros(0)
+        self._source_item_price = np.zeros(0)
+        self._source_base_time = np.zeros(0)
+        self._source_primary_building: List[Optional[str]] = []
+        self._source_building_names: Tuple[str, ...] = ()
+        self._source_building_slot = np.zeros(0, dtype=np.int64)
+        self._source_scores = np.zeros((0, len(ResourceSource)))
+        self._source_seen_version = np.zeros(0, dtype=np.int64)
+        self._source_seen_pressure = np.zeros(0)
+    
+    def _source_tagging_inputs(self) -> np.ndarray:
+        """
+        소스 점수의 정적 입력(판매가, 기본 생산시간, 주 생산 건물)을 새로 생긴 행과 재사용된 행에 채우고
+        행별 현재 생산 건물 압박 배열을 반환 (건물이 없거나 압박 정보가 없으면 0)
+        """
+        store = self.resource_states
+        total_rows = len(store.row_names)
+        if total_rows > self._source_static_rows:
+            new_count = total_rows - self._source_static_rows
+            self._source_shelf_price = np.concatenate([self._source_shelf_price, np.zeros(new_count)])
+            self._source_item_price = np.concatenate([self._source_item_price, np.zeros(new_count)])
+            self._source_base_time = np.concatenate([self._source_base_time, np.zeros(new_count)])
+            self._source_primary_building.extend([None] * new_count)
+            self._source_static_inserted = np.concatenate([self._source_static_inserted,
+                                                           np.zeros(new_count, dtype=np.int64)])
+            
+            self._source_scores = np.concatenate([self._source_scores, np.zeros((new_count, len(ResourceSource)))])
+            self._source_seen_version = np.concatenate([self._source_seen_version, np.zeros(new_count, dtype=np.int64)])
+            self._source_seen_pressure = np.concatenate([self._source_seen_pressure, np.zeros(new_count)])
+            self._source_static_rows = total_rows
+        
+        # 정적 입력을 채운 뒤 아이템이 바뀐 행 (새 행, 삭제 후 다른 아이템이 재사용한 행)
+        inserted = store.inserted[:total_rows]
+        stale_rows = np.flatnonzero((inserted != self._source_static_inserted) & (inserted > 0))
+        if len(stale_rows):
+            items = [self.hayday_items.get(store.row_names[row], {}) for row in stale_rows]
+            self._source_shelf_price[stale_rows] = [item.get('sell_price', 100) for item in items]
+            self._source_item_price[stale_rows] = [item.get('sell_price', 1) for item in items]
+            self._source_base_time[stale_rows] = [item.get('production_time', 300) for item in items]
+            for row, item in zip(stale_rows.tolist(), items):
+                buildings = item.get('buildings', ['farm'])
+                self._source_primary_building[row] = buildings[0] if buildings else None
+            self._source_seen_version[stale_rows] = 0  # 점수도 다시 계산
+            self._source_static_inserted[stale_rows] = inserted[stale_rows]
+            self._source_building_names = ()  # 건물 슬롯 다시 매핑
+        
+        building_names = tuple(self.production_pressures)
+        if building_names != self._source_building_names:
+            slots = {building_name: slot for slot, building_name in enumerate(building_names)}
+            self._source_building_slot = np.array(
+                [slots.get(building_name, -1) for building_name in self._source_primary_building], dtype=np.int64)
+            self._source_building_names = building_names
+        
+        # 마지막 칸 0.0 = 압박 정보 없는 건물 (slot -1)
+        pressures = np.array([pressure.pressure_level for pressure in self.production_pressures.values()] + [0.0])
+        return pressures[self._source_building_slot]
+    
+    def _calculate_source_scores(self, rows: np.ndarray, building_pressure: np.ndarray) -> np.ndarray:
+        """행별 STORAGE / SHELF / MARKET / PRODUCTION 점수 (ResourceSource 순서 열, 각 0.0 ~ 1.0)"""
+        store = self.resource_states
+        stock = store.current_stock[rows]
+        stock_ratio = stock / np.maximum(store.max_capacity[rows], 1)
+        deficit = stock_ratio < DEFICIT_STOCK_RATIO
+        scores = np.empty((len(rows), len(ResourceSource)))
+        
+        # STORAGE - 재고 비율 + 절대 재고량 보너스(최대 0.3) + 안정성(10개 이상 0.4, 5개 이상 0.2), 재고 없으면 0
+        stability_score = np.where(stock >= 10, 0.4, np.where(stock >= 5, 0.2, 0.0))
+        storage_score = np.minimum(np.minimum(stock_ratio, 1.0) + np.minimum(stock / 20.0, 0.3) + stability_score, 1.0)
+        scores[:, 0] = np.where(stock <= 0, 0.0, storage_score)
+        
+        # SHELF - 기본 0.7 + 비용 효율성(가격이 높을수록 페널티) + 재고 부족 보너스, 진열대에 없으면 0
+        cost_efficiency = np.maximum(0.0, 0.3 - self._source_shelf_price[rows] / 300.0)
+        shortage_bonus = np.where(stock < 3, 0.2, 0.0)
+        scores[:, 1] = np.where(store.shelf_available[rows],
+                                np.minimum(0.7 + cost_efficiency + shortage_bonus, 1.0), 0.0)
+        
+        # MARKET - 기본 0.5 + 가용성 0.3 + 긴급 구매 보너스, 마켓에 없으면 0
+        emergency_bonus = np.where(deficit & (stock == 0), 0.5, np.where(stock < 2, 0.3, 0.0))
+        scores[:, 2] = np.where(store.market_available[rows], np.minimum(0.5 + 0.3 + emergency_bonus, 1.0), 0.0)
+        
+        # PRODUCTION - 기본 0.6 - 생산시간 페널티(하루 기준, 최대 0.4) + 부족 우선순위 - 건물 압박 + 효율성 보너스
+        production_time = self._source_base_time[rows]
+        time_penalty = np.minimum(production_time / 86400.0, 0.4)
+        shortage_incentive = np.where(deficit, 0.4, np.where(stock < 3, 0.2, 0.0))
+        building_penalty = building_pressure * 0.3
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value_per_minute = self._source_item_price[rows] / (production_time / 60.0)
+        efficiency_bonus = np.where((production_time > 0) & (value_per_minute > 2.0), 0.2, 0.0)
+        production_score = np.maximum(
+            0.0, 0.6 - time_penalty + shortage_incentive - building_penalty + efficiency_bonus)
+        scores[:, 3] = np.minimum(production_score, 1.0)
+        
+        return scores
+    
+    def _optimize_source_distribution(self, tags: np.ndarray, scores: np.ndarray) -> np.ndarray:
+        """소스 분배 최적화 - 균형잡힌 소스 활용 보장 (tags: 아이템 x 소스 bool 행렬)"""
         # 각 소스별 아이템 수 확인
-        source_counts = {source: len(items) for source, items in source_tags.items()}
-        total_items = sum(source_counts.values())
+        source_counts = tags.sum(axis=0)
+        total_items = int(source_counts.sum())
         
         if total_items == 0:
-            return source_tags
+            return tags
         
         # 목표 분배 비율 (선호도 기반)
         target_ratios = {
@@ -908,44 +1203,53 @@ class SungDaeSimulator:
             ResourceSource.MARKET: 0.2,    # 시장 구매
             ResourceSource.PRODUCTION: 0.1  # 생산 최소화
         }
+        source_columns = {source: column for column, source in enumerate(ResourceSource)}
         
         # 심각한 불균형이 있는 경우 재조정
         for source, target_ratio in target_ratios.items():
-            current_ratio = source_counts[source] / total_items if total_items > 0 else 0
+            current_ratio = int(source_counts[source_columns[source]]) / total_items
             
-            # 목표 비율에서 크게 벗어난 경우 조정
-            if current_ratio < target_ratio * 0.5:  # 목표의 50% 미만
+            # 목표 비율에서 크게 벗어난 경우 조정 (목표의 50% 미만)
+            if current_ratio < target_ratio * 0.5:
                 # 다른 소스에서 적합한 아이템 이전
-                self._rebalance_source_allocation(source_tags, source_scores, source, target_ratio)
+                self._rebalance_source_allocation(tags, scores, source_columns[source])
         
-        return source_tags
-    
-    def _rebalance_source_allocation(self, source_tags: Dict, source_scores: Dict, 
-                                   target_source: ResourceSource, target_ratio: float):
-        """특정 소스의 할당량 재조정"""
-        # 다른 소스에서 점수가 높은 아이템을 찾아서 이전
-        for item_name, scores in source_scores.items():
-            if item_name in source_tags[target_source]:
-                continue
-                
-            target_score = scores.get(target_source, 0.0)
-            if target_score > 0.5:  # 충분히 높은 점수
-                # 현재 할당된 소스들의 점수와 비교
-                current_sources = [s for s in ResourceSource if item_name in source_tags[s]]
-                
-                should_transfer = False
-                for current_source in current_sources:
-                    current_score = scores.get(current_source, 0.0)
-                    if target_score > current_score * 1.2:  # 20% 이상 높은 점수
-                        source_tags[current_source].remove(item_name)
-                        should_transfer = True
-                        break
-                
-                if should_transfer:
-                    source_tags[target_source].append(item_name)
+        return tags
     
+    def _rebalance_source_allocation(self, tags: np.ndarray, scores: np.ndarray, target: int):
+        """특정 소스의 할당량 재조정 (tags 제자리 수정)"""
+        # 대상 소스 점수가 충분히 높은(0.5 초과) 미할당 아이템을,
+        # 현재 할당된 소스 중 (ResourceSource 순서로) 처음 20% 이상 점수가 낮은 소스에서 이전
+        target_scores = scores[:, target]
+        candidates = ~tags[:, target] & (target_scores > 0.5)
+        movable = tags & (target_scores[:, None] > scores * 1.2)
+        
+        transfer_rows = np.flatnonzero(candidates & movable.any(axis=1))
+        tags[transfer_rows, movable[transfer_rows].argmax(axis=1)] = False
+        tags[transfer_rows, target] = True
+
     def _calculate_production_pressure(self) -> Dict:
-        """5단계: 고도화된 생산 압박 분배 시스템 (PDF Step 5 구현)"""
+        """
+        5단계: 생산 압박 스냅샷 (트럭/기차 주문, 화면 표시 데이터가 공유)
+        
+        건물 부하/대기열, 시간대(시 단위), 카탈로그 버전이 마지막 계산 때와 같으면 이전 결과를 그대로 반환한다.
+        반환 dict는 캐시와 공유하므로 수정하지 말 것.
+        """
+        hour_bucket = int(time.time() / 3600)
+        key = (self.catalog_version, hour_bucket, self._production_pressure_signature())
+        if self._pressure_snapshot is None or self._pressure_snapshot_key != key:
+            self._pressure_snapshot = self._analyze_production_pressure(hour_bucket % 24)
+            self._pressure_snapshot_key = key
+            self.pressure_snapshot_version += 1
+        return self._pressure_snapshot
+    
+    def _production_pressure_signature(self) -> Tuple:
+        """압박 계산 입력 (건물별 부하, 용량, 대기열) - 바뀌면 스냅샷 재계산"""
+        return tuple((building_name, pressure.current_load, pressure.max_capacity, tuple(pressure.items_in_queue))
+                     for building_name, pressure in self.production_pressures.items())
+    
+    def _analyze_production_pressure(self, current_hour: int) -> Dict:
+        """고도화된 생산 압박 분배 시스템 (PDF Step 5 구현)"""
         pressure_analysis = {
             'high_pressure_buildings': [],
             'medium_pressure_buildings': [],
@@ -964,7 +1268,7 @@ class SungDaeSimulator:
         interdependency_map = self._analyze_production_interdependencies()
         
         # 3. 시간 기반 압박도 계산
-        time_based_pressures = self._calculate_time_based_pressures()
+        time_based_pressures = self._calculate_time_based_pressures(current_hour)
         
         # 4. 통합 압박도 계산
         integrated_pressures = self._integrate_pressure_metrics(
@@ -1042,8 +1346,39 @@ class SungDaeSimulator:
         
         return building_pressures
     
-    def _analyze_production_interdependencies(self) -> Dict:
-        """생산 상호 의존성 분석"""
+    def _analyze_production_interdependencies(self) -> Mapping[str, Mapping]:
+        """
+        생산 상호 의존성 분석 (건물 -> 의존 아이템, 복잡도, 상호의존성 팩터)
+        
+        아이템 카탈로그에만 의존하므로 카탈로그 버전 + 아이템 구성별로 한 번만 만들고
+        같은 구성의 인스턴스끼리 공유한다. 읽기 전용 (수정하지 말 것).
+        """
+        if self._interdependency_map is None or self._interdependency_version != self.catalog_version:
+            key = (self.catalog_version, self._interdependency_fingerprint())
+            with _INTERDEPENDENCY_MAPS_LOCK:
+                interdependency_map = _INTERDEPENDENCY_MAPS.get(key)
+                if interdependency_map is not None:
+                    _INTERDEPENDENCY_MAPS.move_to_end(key)
+            if interdependency_map is None:
+                interdependency_map = self._build_production_interdependencies()
+                with _INTERDEPENDENCY_MAPS_LOCK:
+                    _INTERDEPENDENCY_MAPS[key] = interdependency_map
+                    while len(_INTERDEPENDENCY_MAPS) > INTERDEPENDENCY_CACHE_SIZE:
+                        _INTERDEPENDENCY_MAPS.popitem(last=False)
+            self._interdependency_map = interdependency_map
+            self._interdependency_version = self.catalog_version
+        return self._interdependency_map
+    
+    def _interdependency_fingerprint(self) -> Tuple:
+        """상호의존성 맵 입력 (아이템명, 주 생산 건물, 생산시간) - 공유 캐시 키"""
+        fingerprint = []
+        for item_name, item_data in self.hayday_items.items():
+            buildings = item_data.get('buildings', ['farm'])
+            fingerprint.append((item_name, buildings[0] if buildings else None, item_data.get('production_time', 300)))
+        return tuple(fingerprint)
+    
+    def _build_production_interdependencies(self) -> Mapping[str, Mapping]:
+        """상호의존성 맵 생성 (읽기 전용 구조로 반환)"""
         interdependency_map = {}
         
         # 아이템별 생산 체인 분석
@@ -1098,17 +1433,18 @@ class SungDaeSimulator:
             
             data['interdependency_factor'] = interdependency_factor
         
-        return interdependency_map
+        return MappingProxyType({
+            building: MappingProxyType({key: tuple(value) if isinstance(value, list) else value
+                                        for key, value in data.items()})
+            for building, data in interdependency_map.items()
+        })
     
-    def _calculate_time_based_pressures(self) -> Dict:
-        """시간 기반 압박도 계산"""
+    def _calculate_time_based_pressures(self, current_hour: int) -> Dict:
+        """시간 기반 압박도 계산 (current_hour: 0~23)"""
         time_pressures = {}
         
         for building_name, pressure in self.production_pressures.items():
             # 시간별 수요 변동 시뮬레이션
-            import time
-            current_hour = int(time.time() / 3600) % 24
-            
             # 시간대별 압박 패턴 (현실적인 플레이 패턴 반영)
             if 18 <= current_hour <= 23 or 7 <= current_hour <= 9:  # 피크 시간
                 time_multiplier = 1.3
@@ -1623,7 +1959,7 @@ class SungDaeSimulator:
         if sum(weights) == 0:
             weights = [1.0] * len(weights)
         
-        selected_id = random.choices(pattern_ids, weights=weights)[0]
+        selected_id = self.rng.choices(pattern_ids, weights=weights)[0]
         return self.delivery_patterns[selected_id]
     
     def _select_items_and_quantities(self, pattern: DeliveryPattern, source_tags: Dict) -> Dict[str, int]:
@@ -1631,7 +1967,7 @@ class SungDaeSimulator:
         selected_items = {}
         
         # 아이템 개수 결정
-        item_count = random.randint(*pattern.item_count_range)
+        item_count = self.rng.randint(*pattern.item_count_range)
         
         # 레이어별 아이템 수량 계산
         layer_counts = {}
@@ -1646,8 +1982,7 @@ class SungDaeSimulator:
         
         # 각 레이어별로 아이템 선정
         for layer, count in layer_counts.items():
-            layer_items = [item for item, resource in self.resource_states.items() 
-                          if resource.layer == layer and self._is_valid_item(item) and self._is_unlocked_item(item)]
+            layer_items = self._eligible_layer_items(layer)
             
             if not layer_items:
                 continue
@@ -1674,7 +2009,7 @@ class SungDaeSimulator:
                     max_quantity = int(max_quantity * 1.5)
                 
                 # 최종 수량 결정 (최소 1개)
-                final_quantity = random.randint(max(1, min_quantity), max(1, max_quantity))
+                final_quantity = self.rng.randint(max(1, min_quantity), max(1, max_quantity))
                 selected_items[item] = final_quantity
         
         return selected_items
@@ -1714,7 +2049,7 @@ class SungDaeSimulator:
                 
             # 점수 기반 가중 선택
             weights = [item[1] + 0.1 for item in available_items]  # 최소 가중치 보장
-            chosen_idx = random.choices(range(len(available_items)), weights=weights)[0]
+            chosen_idx = self.rng.choices(range(len(available_items)), weights=weights)[0]
             
             selected.append(available_items[chosen_idx][0])
             available_items.pop(chosen_idx)
@@ -1779,10 +2114,10 @@ class SungDaeSimulator:
                 # 부족분이 적을 때 Near-miss 효과 극대화
                 if deficit <= 3:
                     # 수량을 현재 재고 + 1로 조정하여 긴장감 조성
-                    adjusted_items[item_name] = resource.current_stock + random.randint(1, 2)
+                    adjusted_items[item_name] = resource.current_stock + self.rng.randint(1, 2)
                 else:
                     # 부족분이 클 때는 원래 수량의 70-90%로 조정 (최소 2개)
-                    reduction_factor = random.uniform(0.7, 0.9)
+                    reduction_factor = self.rng.uniform(0.7, 0.9)
                     adjusted_items[item_name] = max(2, int(quantity * reduction_factor))
             
             # 풍부한 아이템의 경우 수량 증가로 밸런스 조정
@@ -1920,7 +2255,7 @@ class SungDaeSimulator:
         
         # 기차 납품 가치 보너스
         if delivery_type == DeliveryType.TRAIN:
-            value_multiplier = random.uniform(1.5, 2.2)
+            value_multiplier = self.rng.uniform(1.5, 2.2)
             total_value = int(total_value * value_multiplier)
         
         # 평균 생산 시간 계산
@@ -1928,9 +2263,9 @@ class SungDaeSimulator:
         
         # 만료 시간 계산 (기차는 더 오래)
         if delivery_type == DeliveryType.TRAIN:
-            expiry_time = random.randint(180, 300)  # 3-5시간
+            expiry_time = self.rng.randint(180, 300)  # 3-5시간
         else:
-            expiry_time = random.randint(60, 120)   # 1-2시간
+            expiry_time = self.rng.randint(60, 120)   # 1-2시간
         
         # 레벨 요구사항 (실제 아이템 언락 레벨 기반)
         level_requirement = self.player_level
@@ -1941,7 +2276,7 @@ class SungDaeSimulator:
         
         # 기차 납품은 레벨 요구사항이 더 높음 (Township 특성)
         if delivery_type == DeliveryType.TRAIN:
-            level_requirement = max(level_requirement, self.player_level + random.randint(2, 8))
+            level_requirement = max(level_requirement, self.player_level + self.rng.randint(2, 8))
         
         # 주문 생성
         order_id_prefix = "TRAIN" if delivery_type == DeliveryType.TRAIN else "TRUCK" 
@@ -1963,7 +2298,7 @@ class SungDaeSimulator:
                 'player_level': self.player_level,
                 'delivery_type': delivery_type.value,
                 'generation_timestamp': json.dumps(None, default=str),
-                'resource_deficit_ratio': len([r for r in self.resource_states.values() if r.is_deficit]) / len(self.resource_states),
+                'resource_deficit_ratio': self._count_deficit_resources() / len(self.resource_states),
                 'layer_distribution': {
                     layer.value: len([item for item in items.keys() 
                                     if self.resource_states.get(item, ResourceState('', ItemLayer.CROPS, 0, 0, 0, [], False, False)).layer == layer])
@@ -2045,7 +2380,9 @@ class SungDaeSimulator:
     
     def get_system_status(self) -> Dict:
         """시스템 상태 조회"""
-        deficit_items = [name for name, resource in self.resource_states.items() if resource.is_deficit]
+        stock_ratios = self.resource_states.stock_ratios()
+        deficit = stock_ratios < DEFICIT_STOCK_RATIO
+        deficit_items = self.resource_states.names_where(deficit)
         high_pressure_buildings = [name for name, pressure in self.production_pressures.items() if pressure.pressure_level > 0.8]
         
         return {
@@ -2058,9 +2395,9 @@ class SungDaeSimulator:
             'average_struggle_score': sum(self.struggle_history[-10:]) / min(10, len(self.struggle_history)) if self.struggle_history else 0,
             'last_pattern_used': self.delivery_history[-1].generation_metadata['pattern_id'] if self.delivery_history else None,
             'resource_health': {
-                'healthy': len([r for r in self.resource_states.values() if 0.3 <= r.stock_ratio <= 0.8]),
-                'deficit': len([r for r in self.resource_states.values() if r.stock_ratio < 0.3]),
-                'abundant': len([r for r in self.resource_states.values() if r.stock_ratio > 0.8])
+                'healthy': int(np.count_nonzero(~deficit & (stock_ratios <= ABUNDANT_STOCK_RATIO))),
+                'deficit': len(deficit_items),
+                'abundant': int(np.count_nonzero(stock_ratios > ABUNDANT_STOCK_RATIO))
             }
         }
     
@@ -2075,14 +2412,14 @@ class SungDaeSimulator:
                     if completed_item in self.resource_states:
                         resource = self.resource_states[completed_item]
                         resource.current_stock = min(resource.max_capacity, 
-                                                   resource.current_stock + random.randint(2, 5))
+                                                   resource.current_stock + self.rng.randint(2, 5))
                 
                 # 생산 압박 감소
                 pressure.current_load = max(0.1, pressure.current_load - 0.15)
             
             # 진열대/마켓 상태 랜덤 변경
             for resource in self.resource_states.values():
-                if random.random() < 0.1:  # 10% 확률로 변경
+                if self.rng.random() < 0.1:  # 10% 확률로 변경
                     resource.shelf_available = not resource.shelf_available
     
     def export_simulation_data(self) -> Dict:
@@ -2190,19 +2527,75 @@ class SungDaeSimulator:
             'performance_insights': self._generate_performance_insights()
         }
     
+    def attach_catalog(self, catalog):
+        """
+        HayDay 데이터 리로드 후 새 카탈로그 묶음(HayDaySimulator.catalog)으로 교체
+        
+        아이템 DB(가격/생산시간/건물/언락레벨)를 새 묶음으로 다시 만들어 함께 교체하고, 보유 리소스의
+        생산시간/건물/레이어, 레이어 인덱스, 소스 태깅 정적 배열도 같은 호출에서 갱신한다.
+        재고/용량/진열 상태는 유지하고, 새 DB에 없는 아이템은 제거.
+        """
+        hayday_items = self._build_hayday_items(catalog.orders, catalog.item_catalog)
+        self.hayday_items = hayday_items
+        self.item_catalog = catalog.item_catalog
+        self.catalog_version = catalog.version
+        
+        # 레이어 인덱스는 새 분류로 다시 채움 (행 순서대로 넣으므로 resource_states 순서 유지)
+        self._layer_index = {layer: {} for layer in ItemLayer}
+        self._locked_items = {}
+        self._eligible_rows = None
+        layer_classification = self._classify_items_by_layer()
+        for item_name in list(self.resource_states):
+            item_data = hayday_items.get(item_name)
+            if item_data is None:
+                self._remove_resource_state(item_name)
+                continue
+            resource = self.resource_states[item_name]
+            self._set_resource_state(item_name, ResourceState(
+                item_name=item_name,
+                layer=layer_classification.get(item_name, ItemLayer.CROPS),
+                current_stock=resource.current_stock,
+                max_capacity=resource.max_capacity,
+                production_time=item_data.get('production_time', 300),
+                production_buildings=item_data.get('buildings', []),
+                shelf_available=resource.shelf_available,
+                market_available=resource.market_available
+            ))
+        
+        # 판매가/생산시간/주 생산 건물은 아이템 DB에서 온 값이므로 처음부터 다시 채움
+        self._reset_source_cache()
+    
     @classmethod
-    def create_from_hayday_simulator(cls, hayday_simulator, player_level: int = 5):
-        """HayDay 시뮬레이터에서 SungDae 시뮬레이터 생성"""
+    def create_from_hayday_simulator(cls, hayday_simulator, player_level: int = 5, rng: SeedLike = None):
+        """HayDay 시뮬레이터에서 SungDae 시뮬레이터 생성 (rng가 없으면 HayDay 난수 스트림의 자식 스트림 사용)"""
+        catalog = getattr(hayday_simulator, 'catalog', None)
+        if catalog is not None:
+            orders, item_catalog, catalog_version = catalog.orders, catalog.item_catalog, catalog.version
+        else:
+            orders = getattr(hayday_simulator, 'orders', None)
+            item_catalog = getattr(hayday_simulator, 'item_catalog', None)
+            catalog_version = getattr(hayday_simulator, 'catalog_version', 0)
+        hayday_items = cls._build_hayday_items(orders, item_catalog)
+        
+        if rng is None and hasattr(hayday_simulator, 'rng'):
+            rng = hayday_simulator.rng.spawn(1)[0]
+        simulator = cls(hayday_items, player_level, item_catalog=item_catalog, rng=rng)
+        simulator.catalog_version = catalog_version
+        return simulator
+    
+    @classmethod
+    def _build_hayday_items(cls, orders, item_catalog=None) -> Dict[str, Dict]:
+        """HayDay 주문 데이터 -> 아이템 DB (아이템명 -> 가격/생산시간(초)/건물/언락레벨)"""
         # HayDay 아이템 데이터 변환
         hayday_items = {}
         
         # Orders 데이터에서 아이템 추출
-        if hasattr(hayday_simulator, 'orders') and not hayday_simulator.orders.empty:
-            for _, row in hayday_simulator.orders.iterrows():
+        if orders is not None and not orders.empty:
+            for _, row in orders.iterrows():
                 name = row.get('Name', '')
                 if name and isinstance(name, str) and name.strip():
                     # 아이템별 올바른 언락 레벨 설정 (HayDay 실제 레벨)
-                    correct_unlock_level = cls._get_correct_unlock_level(name)
+                    correct_unlock_level = cls._get_correct_unlock_level(name, item_catalog)
                     
                     hayday_items[name] = {
                         'sell_price': int(row.get('Value', 100)),
@@ -2275,58 +2668,26 @@ class SungDaeSimulator:
             }
             hayday_items.update(real_hayday_items)
         
-        return cls(hayday_items, player_level)
+        return hayday_items
+    
+    # 언락 레벨 조회 대상 카테고리 (앞쪽 카테고리 우선)
+    UNLOCK_LEVEL_CATEGORIES = [
+        'bakery_goods', 'dairy_goods', 'fields', 'animal_goods', 'fruits', 'jam_maker_goods',
+        'juice_press_goods', 'loom_goods', 'pie_oven_goods', 'cake_oven_goods',
+        'candy_machine_goods', 'ice_cream_maker_goods'
+    ]
     
     @classmethod
-    def _get_correct_unlock_level(cls, item_name: str) -> int:
-        """아이템별 올바른 HayDay 언락 레벨 반환 (CSV 데이터 기반 다이나믹 로딩)"""
-        import os
-        import csv
-        
-        # CSV 파일 경로들
-        csv_files = [
-            'hayday_extracted_data/core_data/bakery_goods.csv',
-            'hayday_extracted_data/core_data/dairy_goods.csv', 
-            'hayday_extracted_data/core_data/fields.csv',
-            'hayday_extracted_data/core_data/animal_goods.csv',
-            'hayday_extracted_data/core_data/fruits.csv',
-            'hayday_extracted_data/core_data/jam_maker_goods.csv',
-            'hayday_extracted_data/core_data/juice_press_goods.csv',
-            'hayday_extracted_data/core_data/loom_goods.csv',
-            'hayday_extracted_data/core_data/pie_oven_goods.csv',
-            'hayday_extracted_data/core_data/cake_oven_goods.csv',
-            'hayday_extracted_data/core_data/candy_machine_goods.csv',
-            'hayday_extracted_data/core_data/ice_cream_maker_goods.csv'
-        ]
+    def _get_correct_unlock_level(cls, item_name: str, item_catalog=None) -> int:
+        """아이템별 올바른 HayDay 언락 레벨 반환 (ItemCatalog 또는 CSV 데이터 기반 다이나믹 로딩)"""
+        # HayDay 시뮬레이터의 아이템 카탈로그가 있으면 CSV를 다시 읽지 않음
+        if item_catalog is not None:
+            unlock_level = item_catalog.first_unlock_level(item_name, cls.UNLOCK_LEVEL_CATEGORIES)
+        else:
+            unlock_level = cls._load_unlock_level_cache().get(item_name)
         
-        # CSV에서 언락 레벨 로드 (캐시 사용)
-        if not hasattr(cls, '_unlock_level_cache'):
-            cls._unlock_level_cache = {}
-            
-            for csv_file in csv_files:
-                file_path = os.path.join(os.path.dirname(__file__), csv_file)
-                if os.path.exists(file_path):
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            reader = csv.DictReader(f)
-                            for row in reader:
-                                name = row.get('Name', '').strip()
-                                unlock_level_str = row.get('UnlockLevel', '').strip()
-                                
-                                if name and unlock_level_str:
-                                    try:
-                                        unlock_level = int(unlock_level_str)
-                                        if name not in cls._unlock_level_cache:  # 첫 번째 발견만 사용
-                                            cls._unlock_level_cache[name] = unlock_level
-                                    except ValueError:
-                                        continue
-                    except Exception as e:
-                        print(f"[WARNING] CSV 로딩 실패: {csv_file} - {e}")
-                        continue
-        
-        # 캐시된 데이터에서 레벨 반환
-        if item_name in cls._unlock_level_cache:
-            return cls._unlock_level_cache[item_name]
+        if unlock_level is not None:
+            return unlock_level
         
         # 기본 작물들 (CSV에 없는 기본 아이템들)
         basic_fallbacks = {
@@ -2343,6 +2704,42 @@ class SungDaeSimulator:
             
         return 25  # 기본 중간 레벨
     
+    @classmethod
+    def _load_unlock_level_cache(cls) -> Dict[str, int]:
+        """CSV에서 아이템 언락 레벨 로드 (클래스 단위 캐시)"""
+        import os
+        import csv
+        
+        if hasattr(cls, '_unlock_level_cache'):
+            return cls._unlock_level_cache
+        
+        # CSV 파일 경로들
+        csv_files = [f'hayday_extracted_data/core_data/{category}.csv' for category in cls.UNLOCK_LEVEL_CATEGORIES]
+        
+        cls._unlock_level_cache = {}
+        for csv_file in csv_files:
+            file_path = os.path.join(os.path.dirname(__file__), csv_file)
+            if os.path.exists(file_path):
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        reader = csv.DictReader(f)
+                        for row in reader:
+                            name = row.get('Name', '').strip()
+                            unlock_level_str = row.get('UnlockLevel', '').strip()
+                            
+                            if name and unlock_level_str:
+                                try:
+                                    unlock_level = int(unlock_level_str)
+                                    if name not in cls._unlock_level_cache:  # 첫 번째 발견만 사용
+                                        cls._unlock_level_cache[name] = unlock_level
+                                except ValueError:
+                                    continue
+                except Exception as e:
+                    print(f"[WARNING] CSV 로딩 실패: {csv_file} - {e}")
+                    continue
+        
+        return cls._unlock_level_cache
+    
     # Helper methods for UI display data
     def _get_struggle_trend(self) -> str:
         if len(self.struggle_history) < 5:
@@ -2383,8 +2780,16 @@ class SungDaeSimulator:
         total_pressure = sum(p.pressure_level for p in self.production_pressures.values())
         return (total_pressure / len(self.production_pressures)) * 100
     
+    def _count_deficit_resources(self) -> int:
+        return self.resource_states.bucket_count(ResourceStore.DEFICIT)
+    
+    def _count_healthy_resources(self) -> int:
+        """재고 비율 0.3 ~ 0.8 아이템 수"""
+        stock_ratios = self.resource_states.stock_ratios()
+        return int(np.count_nonzero((stock_ratios >= DEFICIT_STOCK_RATIO) & (stock_ratios <= ABUNDANT_STOCK_RATIO)))
+    
     def _calculate_scarcity_index(self) -> float:
-        deficit_count = len([r for r in self.resource_states.values() if r.is_deficit])
+        deficit_count = self._count_deficit_resources()
         return (deficit_count / len(self.resource_states)) * 100
     
     def _calculate_item_diversity(self) -> float:
@@ -2412,7 +2817,7 @@ class SungDaeSimulator:
         value_efficiency = (avg_value / max_possible_value * 100) if max_possible_value > 0 else 50
         
         # 3. 리소스 활용도
-        healthy_resources = len([r for r in self.resource_states.values() if not r.is_deficit])
+        healthy_resources = len(self.resource_states) - self._count_deficit_resources()
         total_resources = len(self.resource_states)
         resource_efficiency = (healthy_resources / total_resources * 100) if total_resources > 0 else 50
         
@@ -2458,7 +2863,7 @@ class SungDaeSimulator:
             recommendations.append("스트러글 스코어가 너무 높습니다. 더 쉬운 패턴을 사용하세요.")
         elif self.current_struggle_score < 20:
             recommendations.append("스트러글 스코어가 낮습니다. 더 도전적인 패턴을 시도해보세요.")
-        deficit_count = len([r for r in self.resource_states.values() if r.is_deficit])
+        deficit_count = self._count_deficit_resources()
         if deficit_count > len(self.resource_states) * 0.3:
             recommendations.append("부족한 아이템이 많습니다. 생산 효율성을 높이거나 재고를 보충하세요.")
         return recommendations or ["현재 밸런스 상태가 양호합니다."]
@@ -2518,7 +2923,7 @@ class SungDaeSimulator:
         return max(0, 100 - distance * 2)
     
     def _get_resource_balance_score(self) -> float:
-        healthy_count = len([r for r in self.resource_states.values() if 0.3 <= r.stock_ratio <= 0.8])
+        healthy_count = self._count_healthy_resources()
         return (healthy_count / len(self.resource_states)) * 100
     
     def _get_production_balance_score(self) -> float:
@@ -2826,7 +3231,7 @@ class SungDaeSimulator:
         
         orders = []
         for i in range(count):
-            delivery_type = random.choice(delivery_types)
+            delivery_type = self.rng.choice(delivery_types)
             order = self.generate_delivery_order(delivery_type, use_struggle_adjustment=True)
             orders.append(order)
             
@@ -2834,8 +3239,8 @@ class SungDaeSimulator:
             self._update_resource_state_after_order(order)
             
             # 시간 경과 시뮬레이션 (랜덤)
-            if random.random() < 0.3:
-                self.simulate_time_progression(random.randint(1, 3))
+            if self.rng.random() < 0.3:
+                self.simulate_time_progression(self.rng.randint(1, 3))
         
         return orders
     
@@ -2849,9 +3254,9 @@ class SungDaeSimulator:
                 resource.current_stock = max(0, resource.current_stock - reduction)
                 
                 # 진열대/마켓 가용성 랜덤 업데이트 (시장 변동성 시뮬레이션)
-                if random.random() < 0.1:  # 10% 확률로 가용성 변경
-                    resource.shelf_available = random.choice([True, False])
-                    resource.market_available = random.choice([True, False])
+                if self.rng.random() < 0.1:  # 10% 확률로 가용성 변경
+                    resource.shelf_available = self.rng.choice([True, False])
+                    resource.market_available = self.rng.choice([True, False])
     
     def calculate_advanced_reward_system(self, order: DeliveryOrder) -> Dict:
         """
@@ -3364,7 +3769,7 @@ class SungDaeSimulator:
                     ][:5]
                 },
                 'current_struggle_score': self.current_struggle_score,
-                'resource_deficit_ratio': len([r for r in self.resource_states.values() if r.is_deficit]) / max(1, len(self.resource_states)),
+                'resource_deficit_ratio': self._count_deficit_resources() / max(1, len(self.resource_states)),
                 'struggle_trend': self._get_struggle_trend()
             }
             
@@ -18,6 +18,7 @@ import time
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 try:
     from hayday_simulator import HayDaySimulator, DeliveryType, DifficultyType
+    from hayday_catalog import read_game_csv
     from sungdae_simulator import SungDaeSimulator, DeliveryType as SungDaeDeliveryType, DeliveryDifficulty
 except ImportError as e:
     print(f"⚠️ 시뮬레이터 모듈을 찾을 수 없습니다: {e}")
@@ -66,12 +67,44 @@ class Localization:
                 return self.translations[fallback_lang][tid]
         return tid  # 번역이 없으면 원본 TID 반환
 
+def json_value(value, default=None):
+    """타입 지정 컬럼 값(Int32 결측 등)을 JSON 직렬화 가능한 값으로 변환"""
+    if value is None or pd.isna(value):
+        return default
+    return value
+
 # 전역 시뮬레이터 인스턴스
 simulator = None
 sungdae_simulator = None
 localization = None
 simulation_data = {"status": "ready", "results": None}
 
+# core_data CSV 변경 감지 주기 (초, 0이면 비활성화)
+DATA_RELOAD_INTERVAL = float(os.environ.get('HAYDAY_RELOAD_INTERVAL', '2'))
+data_watcher = None
+
+def watch_data_files(interval: float):
+    """core_data CSV mtime 폴링 - 바뀐 파일만 다시 로드하고 SungDae 카탈로그 교체"""
+    while True:
+        time.sleep(interval)
+        try:
+            if not simulator:
+                continue
+            changed = simulator.reload_changed_data()
+            if changed and sungdae_simulator:
+                sungdae_simulator.attach_catalog(simulator.catalog)
+        except Exception as e:
+            print(f"Warning: Data reload failed: {e}")
+
+def start_data_watcher(interval: float = DATA_RELOAD_INTERVAL):
+    """데이터 파일 감시 스레드 시작 (프로세스당 한 번)"""
+    global data_watcher
+    if interval <= 0 or data_watcher is not None:
+        return
+    data_watcher = threading.Thread(target=watch_data_files, args=(interval,), daemon=True)
+    data_watcher.start()
+    print(f"Data file watcher started (every {interval:g}s)")
+
 def init_simulator():
     """시뮬레이터 및 로컬라이제이션 초기화"""
     global simulator, localization, sungdae_simulator
@@ -143,6 +176,7 @@ def api_stats():
         "total_levels": len(simulator.exp_levels) if not simulator.exp_levels.empty else 0,
         "predefined_orders": len(simulator.predefined_orders) if not simulator.predefined_orders.empty else 0,
         "data_categories": len([k for k in simulator.data.keys()]),
+        "catalog_version": simulator.catalog_version,
         "last_updated": datetime.now().isoformat()
     }
     return jsonify(stats)
@@ -381,11 +415,11 @@ def api_levels():
     # 처음 50개 레벨만 (너무 많은 데이터 방지)
     for _, level in levels_df.head(50).iterrows():
         levels_data.append({
-            "level": level.get('Level', 0),
-            "exp_to_next": level.get('ExpToNextLevel', 0),
-            "max_fields": level.get('MaxFields', 0),
-            "order_min_value": level.get('OrderMinValue', 0),
-            "order_max_value": level.get('OrderMaxValue', 0)
+            "level": json_value(level.get('Level'), 0),
+            "exp_to_next": json_value(level.get('ExpToNextLevel'), 0),
+            "max_fields": json_value(level.get('MaxFields'), 0),
+            "order_min_value": json_value(level.get('OrderMinValue'), 0),
+            "order_max_value": json_value(level.get('OrderMaxValue'), 0)
         })
     
     return jsonify(levels_data)
@@ -417,17 +451,8 @@ def api_csv_data(filename):
         if not os.path.exists(csv_path):
             return jsonify({"error": f"CSV file not found: {filename}"}), 404
         
-        df = pd.read_csv(csv_path)
-        
-        # 첫 번째 행이 데이터 타입인 경우 제거
-        if len(df) > 1 and all(df.iloc[0].astype(str).str.contains('int|String|Boolean|float', na=False)):
-            df = df.drop(0).reset_index(drop=True)
-        
-        # 빈 Name 행들 필터링 (모든 파일에 적용)
-        if 'Name' in df.columns:
-            # Name이 비어있지 않은 행만 유지
-            df = df[df['Name'].notna() & (df['Name'].astype(str).str.strip() != '')]
-            df = df.reset_index(drop=True)
+        # 데이터 타입 행 기반으로 파싱 (빈 Name 행 필터링 포함)
+        df = read_game_csv(csv_path)
         
         # 로컬라이제이션 적용 (TID가 들어간 모든 컬럼에 적용)
         if localization:
@@ -988,6 +1013,7 @@ if __name__ == '__main__':
     print("Initializing simulator...")
     
     init_simulator()
+    start_data_watcher()
     
     print("Starting web server...")
     print("URL: http://localhost:5001")